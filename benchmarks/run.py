@@ -0,0 +1,543 @@
+"""Benchmarks of the rendering, picking and I/O hot paths of Trajectory Picker
+
+The core benchmarks (image pyramid, picking, angles, json) don't need a display. The GUI benchmarks
+create a GUI in a Tk window, they are skipped when Tk can't open one (use xvfb-run on a server).
+Every median is compared to a threshold, --check exits with 1 on a regression.
+
+The timings depend on the machine, so the thresholds only mean something on the machine that
+measured them. Either compare to a baseline run saved with -o on the same machine (--baseline,
+the thresholds are its medians x THRESHOLD_MARGIN), or regenerate thresholds.json with
+--write-thresholds on every machine. The committed thresholds.json is the one of a development
+machine, --check against it doesn't belong in a shared CI.
+
+Usage examples (from the repository root):
+    uv run benchmarks/run.py
+    uv run benchmarks/run.py -k render -k json
+    uv run benchmarks/run.py -o baseline.json
+    uv run benchmarks/run.py --baseline baseline.json --check
+    xvfb-run uv run benchmarks/run.py --write-thresholds
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import numpy as np
+import PIL
+from PIL import Image
+
+import trajectory_manager
+from gui.image_pyramid import ImagePyramid
+from gui.point_grid import PointGrid
+from gui.view_transform import ViewTransform
+from trajectory import Trajectory
+
+PLAYMATS = {
+    "2025": os.path.join(ROOT, "assets/2025/playmat_2025_FINAL_3000x2000.png"),
+    "2026": os.path.join(ROOT, "assets/2026/playmat_2026_FINAL_3000x2000.png"),
+}
+CANVAS_SIZE = (1280, 800)
+ZOOMS = ("fit", 1.0, 4.0)  # "fit" is the zoom of a newly opened image
+POINT_COUNTS = (10, 1_000, 100_000)
+PICK_BATCH = 1_000  # Clicks timed together, the result is the time of one click
+SEED = 2025
+
+THRESHOLDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "thresholds.json")
+THRESHOLD_MARGIN = 3.0  # --write-thresholds saves median * THRESHOLD_MARGIN
+
+
+class Case:
+    """One measured operation
+
+    Args:
+        name (str): stable name of the case, used as the key of its threshold
+        setup: function without argument that prepares the case and returns the timed function
+        batch (int): number of operations done by one call of the timed function, the times are divided by it
+    """
+
+    def __init__(self, name: str, setup, batch: int = 1):
+        self.name = name
+        self.setup = setup
+        self.batch = batch
+
+
+# -------------------------------------------------------------------------------
+# Data
+# -------------------------------------------------------------------------------
+
+
+def random_trajectory(size: int, image_size=(3000, 2000)) -> Trajectory:
+    # Same random trajectory at every run, with the fields set by the GUI options
+    rng = np.random.default_rng(SEED)
+    xy = np.rint(rng.random((size, 2)) * image_size)
+
+    trajectory = Trajectory.from_columns(
+        xy,
+        orientation=np.rint(rng.random(size) * 360 - 180),
+        direction=rng.integers(-1, 2, size),
+    )
+    return trajectory_manager.calculate_angle(trajectory)
+
+
+def random_clicks(size: int) -> np.ndarray:
+    rng = np.random.default_rng(SEED + 1)
+    return rng.random((size, 2)) * CANVAS_SIZE
+
+
+def set_view(view: ViewTransform, image_size, zoom) -> None:
+    # Zoom on the middle of the image, "fit" shows the entire image like zoom_fit
+    if zoom == "fit":
+        zoom = min(CANVAS_SIZE[0] / image_size[0], CANVAS_SIZE[1] / image_size[1])
+
+    view.reset()
+    view.scale(zoom)
+    view.translate(
+        (CANVAS_SIZE[0] - image_size[0] * zoom) / 2,
+        (CANVAS_SIZE[1] - image_size[1] * zoom) / 2,
+    )
+
+
+def panning(view: ViewTransform):
+    # Move the view of one pixel back and forth, the background is rendered again like during a drag
+    offsets = [1]
+
+    def _pan():
+        view.translate(offsets[0], 0)
+        offsets[0] = -offsets[0]
+
+    return _pan
+
+
+# -------------------------------------------------------------------------------
+# Core benchmarks (no display needed)
+# -------------------------------------------------------------------------------
+
+
+def bench_render():
+    for playmat, filename in PLAYMATS.items():
+        pil_image = Image.open(filename)
+        pil_image.load()
+        pyramid = ImagePyramid(pil_image)
+
+        view = ViewTransform()
+        pan = panning(view)
+
+        for zoom in ZOOMS:
+            for quality, resample, reduction in (
+                ("standard", Image.NEAREST, 1),
+                ("smooth", Image.BILINEAR, 1),
+                ("draft", Image.NEAREST, 2),
+            ):
+
+                def _setup(
+                    pyramid=pyramid, view=view, pan=pan, zoom=zoom, resample=resample, reduction=reduction
+                ):
+                    set_view(view, pyramid.size, zoom)
+
+                    def _run():
+                        pan()
+                        pyramid.render(CANVAS_SIZE, view.mat_affine, resample, reduction)
+
+                    return _run
+
+                yield Case(f"render[{playmat},zoom={zoom},{quality}]", _setup)
+
+
+def bench_pick():
+    view = ViewTransform()
+    set_view(view, (3000, 2000), "fit")
+    clicks = random_clicks(PICK_BATCH)
+
+    for size in POINT_COUNTS:
+        trajectory = random_trajectory(size)
+        grid = PointGrid()
+        grid.rebuild(trajectory.xy)
+
+        def _run(grid=grid):
+            # Same steps as GUI.select_point
+            for x, y in clicks:
+                image_point = np.dot(view.inverse, (x, y, 1.0))
+                grid.nearest(image_point[0], image_point[1], 30)
+
+        yield Case(f"pick[n={size}]", lambda run=_run: run, PICK_BATCH)
+
+    def _to_image():
+        for x, y in clicks:
+            np.dot(view.inverse, (x, y, 1.0))
+
+    yield Case("to_image", lambda: _to_image, PICK_BATCH)
+
+
+def bench_angles():
+    for size in POINT_COUNTS:
+        trajectory = random_trajectory(size)
+        yield Case(
+            f"calculate_angle[n={size}]",
+            lambda trajectory=trajectory: lambda: trajectory_manager.calculate_angle(
+                trajectory
+            ),
+        )
+
+
+def bench_json():
+    directory = tempfile.mkdtemp(prefix="trajectory-picker-bench-")
+
+    for size in POINT_COUNTS:
+        trajectory = random_trajectory(size)
+
+        def _memory(trajectory=trajectory):
+            content = trajectory_manager.coordinates_to_json(trajectory, [], 1, 1, 1, 0, 0)
+            trajectory_manager.format_json_to_trajectory(json.loads(json.dumps(content)))
+
+        file_path = os.path.join(directory, f"trajectory_{size}.json")
+
+        def _file(trajectory=trajectory, file_path=file_path):
+            trajectory_manager.write_json_trajectory(file_path, trajectory, [], 1, 1, 1, 0, 0)
+            trajectory_manager.load_trajectory_file(file_path)
+
+        yield Case(f"json_round_trip[n={size}]", lambda run=_memory: run)
+        yield Case(f"json_file_round_trip[n={size}]", lambda run=_file: run)
+
+
+# -------------------------------------------------------------------------------
+# GUI benchmarks (a Tk window is needed)
+# -------------------------------------------------------------------------------
+
+
+def create_gui():
+    """Create a GUI with an empty config, return (gui, None) or (None, reason) without display"""
+
+    import tkinter as tk
+
+    try:
+        from ttkbootstrap import Window
+
+        root = Window()
+    except tk.TclError as e:
+        return None, f"no display ({e})"
+
+    from gui import GUI
+
+    root.geometry(f"{CANVAS_SIZE[0]}x{CANVAS_SIZE[1] + 60}+0+0")
+    config_file = os.path.join(tempfile.mkdtemp(prefix="trajectory-picker-bench-"), "config.json")
+    gui = GUI(master=root, CONFIG_FILE=config_file)
+    root.update()
+
+    return gui, None
+
+
+def bench_gui(gui):
+    for playmat, filename in PLAYMATS.items():
+        pil_image = Image.open(filename)
+        pil_image.load()
+        gui.show_image(filename, pil_image, ImagePyramid(pil_image))
+        pan = panning(gui.view)
+
+        for zoom in ZOOMS:
+
+            def _setup(pil_image=pil_image, pan=pan, zoom=zoom):
+                # The other playmat may have been shown since
+                if gui.pil_image is not pil_image:
+                    gui.show_image(filename, pil_image, ImagePyramid(pil_image))
+                set_view(gui.view, pil_image.size, zoom)
+
+                def _draw():
+                    pan()
+                    gui.draw_image(gui.pil_image)
+                    gui.update_idletasks()  # Includes the paint of the canvas
+
+                return _draw
+
+            yield Case(f"draw_image[{playmat},zoom={zoom}]", _setup)
+
+    clicks = random_clicks(PICK_BATCH)
+
+    for size in POINT_COUNTS:
+
+        def _setup_points(size=size):
+            set_view(gui.view, gui.pil_image.size, "fit")
+            gui.image_points = random_trajectory(size)
+            gui.point_grid.rebuild(gui.image_points.xy)
+            gui.checked_points.clear()
+            gui.redraw_image()
+            gui.update()
+
+        def _select(size=size):
+            _setup_points(size)
+            events = [SimpleNamespace(x=x, y=y) for x, y in clicks]
+
+            def _run():
+                for event in events:
+                    gui.select_point(event)
+
+            return _run
+
+        def _to_image_point(size=size):
+            _setup_points(size)
+
+            def _run():
+                for x, y in clicks:
+                    gui.to_image_point(x, y)
+
+            return _run
+
+        def _panel(size=size):
+            _setup_points(size)
+            if gui.trajectory_panel is None or not gui.trajectory_panel.winfo_exists():
+                gui.toggle_trajectory_panel()
+            gui.update()
+
+            def _run():
+                gui.update_trajectory_panel_content()
+                gui.update_idletasks()
+
+            return _run
+
+        yield Case(f"select_point[n={size}]", _select, PICK_BATCH)
+        yield Case(f"to_image_point[n={size}]", _to_image_point, PICK_BATCH)
+        yield Case(f"trajectory_panel_refresh[n={size}]", _panel)
+
+
+# -------------------------------------------------------------------------------
+# Runner
+# -------------------------------------------------------------------------------
+
+CORE_BENCHMARKS = (bench_render, bench_pick, bench_angles, bench_json)
+
+
+def measure(case: Case, min_runs: int, min_time: float) -> dict:
+    """Time a case at least min_runs times and during min_time seconds (after one warm-up run)"""
+
+    run = case.setup()
+    run()  # Warm-up: caches, lazy imports, first allocation
+
+    times = []
+    start = time.perf_counter()
+    while len(times) < min_runs or time.perf_counter() - start < min_time:
+        run_start = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - run_start) * 1000 / case.batch)
+
+    return {
+        "median_ms": statistics.median(times),
+        "min_ms": min(times),
+        "mean_ms": statistics.fmean(times),
+        "runs": len(times),
+    }
+
+
+def host_info() -> dict:
+    """Description of the machine and the libraries, saved with the results"""
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pillow": PIL.__version__,
+    }
+
+
+def load_baseline(file_path: str) -> dict:
+    """Get thresholds from a results file written with -o (median x THRESHOLD_MARGIN of every case)
+
+    A warning is printed if the baseline was measured on another machine or with other libraries.
+    """
+
+    with open(file_path, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    host = host_info()
+    different = [
+        f"{key} {baseline.get(key)!r} != {value!r}"
+        for key, value in host.items()
+        if baseline.get(key) != value
+    ]
+    if different:
+        print(
+            f"Warning: {file_path} was measured on another machine ({', '.join(different)}),"
+            " the comparison isn't meaningful",
+            file=sys.stderr,
+        )
+
+    return {
+        result["name"]: result["median_ms"] * THRESHOLD_MARGIN
+        for result in baseline["results"]
+        if result["status"] != "skipped"
+    }
+
+
+def check(result: dict, thresholds: dict) -> None:
+    # Compare the median of a result to its threshold
+    threshold = thresholds.get(result["name"])
+    result["threshold_ms"] = threshold
+
+    if threshold is None:
+        result["status"] = "no threshold"
+    elif result["median_ms"] > threshold:
+        result["status"] = "regression"
+    else:
+        result["status"] = "ok"
+
+
+def selected(name: str, keywords: list[str] | None) -> bool:
+    return not keywords or any(keyword in name for keyword in keywords)
+
+
+def collect_cases(keywords, skip_gui: bool):
+    """Yield (case, result of the skip or None)"""
+
+    for benchmark in CORE_BENCHMARKS:
+        for case in benchmark():
+            if selected(case.name, keywords):
+                yield case, None
+
+    gui, reason = (None, "--no-gui") if skip_gui else create_gui()
+    for case in bench_gui(gui) if gui is not None else _gui_case_names():
+        if selected(case.name, keywords):
+            yield case, reason
+
+    if gui is not None:
+        gui.master.destroy()
+
+
+def _gui_case_names():
+    # Names of the GUI cases without creating them, to report them as skipped
+    for playmat in PLAYMATS:
+        for zoom in ZOOMS:
+            yield Case(f"draw_image[{playmat},zoom={zoom}]", None)
+    for size in POINT_COUNTS:
+        for name in ("select_point", "to_image_point", "trajectory_panel_refresh"):
+            yield Case(f"{name}[n={size}]", None)
+
+
+def print_result(result: dict) -> None:
+    if result["status"] == "skipped":
+        print(f"{'skipped':>12}  {result['name']}: {result['reason']}")
+        return
+
+    threshold = result["threshold_ms"]
+    print(
+        f"{result['median_ms']:>9.3f} ms  {result['name']}"
+        f" (min {result['min_ms']:.3f} ms, {result['runs']} runs"
+        + (f", threshold {threshold:.3f} ms" if threshold is not None else "")
+        + f") {result['status'] if result['status'] != 'ok' else ''}"
+    )
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="run.py", description="Benchmark the rendering, picking and I/O hot paths"
+    )
+    parser.add_argument(
+        "-k",
+        dest="keywords",
+        action="append",
+        help="only run the cases whose name contains this text (can be repeated)",
+    )
+    parser.add_argument("-o", "--output", help="write the results to this json file")
+    parser.add_argument(
+        "--min-runs", type=int, default=5, help="minimum number of timed runs of a case"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.5,
+        help="minimum time spent to measure a case in seconds",
+    )
+    parser.add_argument("--no-gui", action="store_true", help="skip the GUI benchmarks")
+    parser.add_argument(
+        "--thresholds",
+        default=THRESHOLDS_FILE,
+        help="json file of the thresholds in ms (measured on this machine)",
+    )
+    parser.add_argument(
+        "--baseline",
+        help=f"results file (-o) of a previous run on this machine, used instead of the thresholds"
+        f" (its medians x {THRESHOLD_MARGIN})",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="exit with 1 if a case is above its threshold"
+    )
+    parser.add_argument(
+        "--write-thresholds",
+        action="store_true",
+        help=f"save the measured medians x {THRESHOLD_MARGIN} as the new thresholds",
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = create_parser().parse_args(argv)
+
+    thresholds = {}
+    if os.path.exists(args.thresholds):
+        with open(args.thresholds, encoding="utf-8") as file:
+            thresholds = json.load(file)
+
+    # The results are compared to the baseline, thresholds.json is only kept for --write-thresholds
+    limits = load_baseline(args.baseline) if args.baseline else thresholds
+
+    results = []
+    for case, skip_reason in collect_cases(args.keywords, args.no_gui):
+        if skip_reason is not None:
+            result = {"name": case.name, "status": "skipped", "reason": skip_reason}
+        else:
+            result = {"name": case.name, **measure(case, args.min_runs, args.min_time)}
+            check(result, limits)
+
+        print_result(result)
+        results.append(result)
+
+    regressions = [result for result in results if result["status"] == "regression"]
+    print(
+        f"{len(results)} cases, {len(regressions)} regressions,"
+        f" {sum(result['status'] == 'skipped' for result in results)} skipped"
+    )
+
+    if args.output:
+        report = {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            **host_info(),
+            "canvas_size": CANVAS_SIZE,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=4)
+
+    if args.write_thresholds:
+        # Keeps the thresholds of the cases that weren't run (GUI cases without display, -k)
+        for result in results:
+            if result["status"] != "skipped":
+                thresholds[result["name"]] = _round_up(result["median_ms"] * THRESHOLD_MARGIN)
+        with open(args.thresholds, "w", encoding="utf-8") as file:
+            json.dump(dict(sorted(thresholds.items())), file, indent=4)
+            file.write("\n")
+
+    return 1 if args.check and regressions else 0
+
+
+def _round_up(value: float) -> float:
+    # 2 significant digits, the thresholds stay readable
+    if value <= 0:
+        return 0.0
+    digits = 1 - math.floor(math.log10(value))
+    return math.ceil(value * 10**digits) / 10**digits
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,385 @@
+"""Headless Trajectory Picker toolkit, processes trajectory files in batch without the GUI
+
+Usage examples (from the src folder):
+    uv run cli.py validate ../trajectories
+    uv run cli.py convert ../trajectories --to csv -o ../csv
+    uv run cli.py mirror ../trajectories --width 3000 -o ../mirrored
+    uv run cli.py mirror ../trajectories --axis y --height 2000 -o ../mirrored
+    uv run cli.py angles ../trajectories -o ../with_angles
+    uv run cli.py simplify ../trajectories --tolerance 2 -o ../simplified
+    uv run cli.py export ../trajectories --fields angle,direction -o ../export
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import trajectory_manager
+from trajectory import FIELDS
+
+TRAJECTORY_EXTENSIONS = (".json", ".csv", trajectory_manager.BINARY_EXTENSION)
+OPTIONAL_FIELDS = FIELDS[2:]
+
+
+def find_trajectory_files(paths: list[str]) -> list[tuple[str, str]]:
+    """Expand the directories of paths into the trajectory files they contain
+
+    Args:
+        paths (list[str]): files and directories given on the command line
+
+    Returns:
+        files (list[tuple[str, str]]): (path, path relative to its input directory) of every
+            trajectory file, sorted inside a directory. The relative path of a file given
+            directly is its name.
+    """
+
+    files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, filenames in sorted(os.walk(path)):
+                files.extend(
+                    (
+                        os.path.join(root, filename),
+                        os.path.relpath(os.path.join(root, filename), path),
+                    )
+                    for filename in sorted(filenames)
+                    if filename.lower().endswith(TRAJECTORY_EXTENSIONS)
+                )
+        else:
+            files.append((path, os.path.basename(path)))
+
+    return files
+
+
+def validate_trajectory(coordinates, actions: list[str], width, height) -> list[str]:
+    """Check a loaded trajectory
+
+    Args:
+        coordinates (Trajectory): the trajectory to check
+        actions (list[str]): the actions saved with the trajectory
+        width (float | None): width of the image, the points must be inside it if set
+        height (float | None): height of the image, the points must be inside it if set
+
+    Returns:
+        errors (list[str]): a description of every problem, empty if the trajectory is valid
+    """
+
+    errors = []
+
+    if len(coordinates) == 0:
+        errors.append("the trajectory is empty")
+
+    missing = np.flatnonzero(np.isnan(coordinates.xy).any(axis=1))
+    if len(missing):
+        errors.append(f"points without coordinates: {(missing + 1).tolist()}")
+
+    for size, column, axis in ((width, coordinates.x, "x"), (height, coordinates.y, "y")):
+        if size is not None:
+            outside = np.flatnonzero((column < 0) | (column > size))
+            if len(outside):
+                errors.append(f"{axis} outside of [0, {size}]: {(outside + 1).tolist()}")
+
+    if actions:
+        unknown = {
+            action
+            for actions_set in coordinates.action_sets
+            for action in actions_set
+            if action not in actions
+        }
+        if unknown:
+            errors.append(f"unknown actions: {sorted(unknown)}")
+
+    return errors
+
+
+def process_file(task: tuple) -> tuple[str, bool, str]:
+    """Run a command on one file, executed inside a worker process
+
+    Args:
+        task (tuple): (command, input file path, output file path, options dict)
+
+    Returns:
+        result (tuple[str, bool, str]): the input file path, True on success, a message
+    """
+
+    command, file_path, output_path, options = task
+
+    try:
+        coordinates, actions = trajectory_manager.load_trajectory_file(file_path)
+
+        if command == "validate":
+            errors = validate_trajectory(
+                coordinates, actions, options["width"], options["height"]
+            )
+            if errors:
+                return file_path, False, "; ".join(errors)
+            return file_path, True, f"{len(coordinates)} points"
+
+        message = output_path
+        if command == "simplify":
+            removed = trajectory_manager.simplify_trajectory(
+                coordinates, options["tolerance"], options["method"]
+            )
+            message += f" ({removed} points removed)"
+
+        if command == "mirror":
+            axis = options["axis"]
+            size = options["width"] if axis == "x" else options["height"]
+            trajectory_manager.mirror_trajectory(coordinates, size, axis)
+
+        fields = options["fields"]
+        if fields is None:
+            fields = trajectory_manager.used_fields(coordinates)
+            # The actions are only saved with the action field
+            if actions and "action" not in fields:
+                fields.append("action")
+
+        # The angles are recalculated when asked or when they are exported without being set
+        if command == "angles" or ("angle" in fields and np.isnan(coordinates.angle).any()):
+            trajectory_manager.calculate_angle(coordinates)
+            if "angle" not in fields:
+                fields = fields + ["angle"]
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        trajectory_manager.save_trajectory_file(
+            output_path, coordinates, actions, fields, options["compact"]
+        )
+
+        return file_path, True, message
+
+    except Exception as e:
+        return file_path, False, str(e)
+
+
+def output_path_for(relative_path: str, args: argparse.Namespace) -> str | None:
+    """Get the path of the file written for an input file (None for the commands that don't write)
+
+    The tree of the input directories is kept under the output directory, so two files with
+    the same name in different subdirectories don't overwrite each other.
+
+    Args:
+        relative_path (str): path of the input file relative to its input directory
+        args (argparse.Namespace): the parsed command line
+
+    Returns:
+        output_path (str | None): path of the written file
+    """
+
+    if args.command == "validate":
+        return None
+
+    name, extension = os.path.splitext(relative_path)
+    if args.command == "convert":
+        extension = "." + args.to
+
+    return os.path.join(args.output, name + extension)
+
+
+def find_duplicate_outputs(tasks: list[tuple]) -> dict[str, list[str]]:
+    """Get the output paths written by more than one input file (output path -> input paths)"""
+
+    inputs = {}
+    for _, file_path, output_path, _ in tasks:
+        if output_path is not None:
+            inputs.setdefault(os.path.normcase(os.path.abspath(output_path)), []).append(file_path)
+
+    return {output_path: paths for output_path, paths in inputs.items() if len(paths) > 1}
+
+
+def parse_fields(value: str) -> list[str]:
+    """argparse type of --fields, a comma separated list of optional FIELDS"""
+
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+
+    for field in fields:
+        if field not in OPTIONAL_FIELDS:
+            raise argparse.ArgumentTypeError(
+                f"unknown field {field!r} (choose from {', '.join(OPTIONAL_FIELDS)})"
+            )
+
+    return fields
+
+
+def image_size(args: argparse.Namespace) -> tuple:
+    """Get the (width, height) given with --width/--height or read from --image"""
+
+    width, height = args.width, getattr(args, "height", None)
+
+    if args.image is not None:
+        from PIL import Image  # Only needed to read the size of the image
+
+        with Image.open(args.image) as image:
+            width = width if width is not None else image.width
+            height = height if height is not None else image.height
+
+    return width, height
+
+
+def report(results) -> int:
+    """Print the result of every file as soon as it's processed and return the number of failures"""
+
+    failures = 0
+
+    for file_path, success, message in results:
+        if success:
+            print(f"ok     {file_path}: {message}")
+        else:
+            failures += 1
+            print(f"error  {file_path}: {message}", file=sys.stderr)
+
+    return failures
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Process Trajectory Picker files (.json, .csv, .trjb) in batch without the GUI",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Options shared by every command
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "inputs", nargs="+", help="trajectory files or directories (searched recursively)"
+    )
+    common.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (default: number of cores)",
+    )
+
+    # Options of the commands that write files
+    writer = argparse.ArgumentParser(add_help=False)
+    writer.add_argument(
+        "-o", "--output", required=True, help="directory of the written files"
+    )
+    writer.add_argument(
+        "--fields",
+        type=parse_fields,
+        default=None,
+        help="comma separated fields to write besides x and y (default: the ones set in the file)",
+    )
+    writer.add_argument(
+        "--compact",
+        action="store_true",
+        help="write the json files without indentation",
+    )
+
+    # Options of the commands that need the size of the image
+    size = argparse.ArgumentParser(add_help=False)
+    size.add_argument("--width", type=float, default=None, help="width of the image")
+    size.add_argument("--image", default=None, help="image to read the size from")
+
+    validate_parser = subparsers.add_parser(
+        "validate", parents=[common, size], help="check that the files can be loaded"
+    )
+    validate_parser.add_argument(
+        "--height", type=float, default=None, help="height of the image"
+    )
+
+    convert_parser = subparsers.add_parser(
+        "convert", parents=[common, writer], help="convert the files to another format"
+    )
+    convert_parser.add_argument(
+        "--to",
+        choices=["json", "csv", trajectory_manager.BINARY_EXTENSION[1:]],
+        required=True,
+    )
+
+    mirror_parser = subparsers.add_parser(
+        "mirror",
+        parents=[common, writer, size],
+        help="mirror the trajectories like the symmetry of the GUI",
+    )
+    mirror_parser.add_argument(
+        "--axis",
+        choices=["x", "y"],
+        default="x",
+        help="mirrored coordinate, x swaps the sides of the playmat (default: x)",
+    )
+    mirror_parser.add_argument(
+        "--height", type=float, default=None, help="height of the image (--axis y)"
+    )
+    subparsers.add_parser(
+        "angles", parents=[common, writer], help="recalculate the angles"
+    )
+    subparsers.add_parser(
+        "export", parents=[common, writer], help="write the files with the chosen --fields"
+    )
+
+    simplify_parser = subparsers.add_parser(
+        "simplify",
+        parents=[common, writer],
+        help="remove the near-collinear points (the points with actions, orientation or wea are kept)",
+    )
+    simplify_parser.add_argument(
+        "--tolerance", type=float, required=True, help="tolerance in image pixels"
+    )
+    simplify_parser.add_argument(
+        "--method",
+        choices=trajectory_manager.SIMPLIFY_METHODS,
+        default=trajectory_manager.SIMPLIFY_METHODS[0],
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    width, height = image_size(args) if hasattr(args, "image") else (None, None)
+    if args.command == "mirror":
+        if args.axis == "x" and width is None:
+            parser.error("mirror needs --width or --image")
+        if args.axis == "y" and height is None:
+            parser.error("mirror --axis y needs --height or --image")
+
+    files = find_trajectory_files(args.inputs)
+    if not files:
+        parser.error("no trajectory file found")
+
+    options = {
+        "width": width,
+        "height": height,
+        "axis": getattr(args, "axis", "x"),
+        "tolerance": getattr(args, "tolerance", None),
+        "method": getattr(args, "method", None),
+        "fields": getattr(args, "fields", None),
+        "compact": getattr(args, "compact", False),
+    }
+    tasks = [
+        (args.command, file_path, output_path_for(relative_path, args), options)
+        for file_path, relative_path in files
+    ]
+
+    # Same relative path in two inputs (or t.json & t.csv converted to the same format),
+    # a file would silently overwrite another one (or two workers would write it together)
+    duplicates = find_duplicate_outputs(tasks)
+    if duplicates:
+        for output_path, paths in duplicates.items():
+            print(f"{output_path} would be written by: {', '.join(paths)}", file=sys.stderr)
+        parser.error("several input files have the same output path")
+
+    # No process pool for a single worker (or a single file)
+    jobs = max(1, min(args.jobs or 1, len(tasks)))
+    if jobs == 1:
+        failures = report(map(process_file, tasks))
+    else:
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            failures = report(executor.map(process_file, tasks, chunksize=chunksize))
+
+    print(f"{len(tasks) - failures}/{len(tasks)} files processed")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
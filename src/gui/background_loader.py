@@ -0,0 +1,211 @@
+import threading  # Worker thread of the loads
+from tkinter import messagebox
+
+LOAD_POLL_INTERVAL = 50  # Time between two checks of the running load in ms
+DRAFT_ONLY_INFO = " (draft only, open the image again for full resolution)"
+
+
+class LoadCancelled(Exception):
+    """Raised inside a load work when the user cancelled it"""
+
+
+class LoadJob:
+    """A file load split between a worker thread and the Tk main thread
+
+    work(progress, cancelled) runs inside the worker thread and must not touch any widget,
+    progress(fraction) reports the progress between 0 and 1 (None when it can't be known) and
+    cancelled() is True once the user cancelled the load, the work can then raise LoadCancelled.
+    finish(result) runs on the main thread with the result of work, only if the load wasn't cancelled.
+    """
+
+    def __init__(self, kind: str, description: str, work, finish):
+        self.kind = kind
+        self.description = description
+        self.work = work
+        self.finish = finish
+
+        self.thread = None
+        self.cancel_event = threading.Event()
+
+        # Written by the worker thread, read by the main thread
+        self.progress = None
+        self.result = None
+        self.error = None
+        self.done = False
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+    def _run(self) -> None:
+        try:
+            self.result = self.work(self._set_progress, self.cancel_event.is_set)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+
+    def _set_progress(self, fraction: float | None) -> None:
+        self.progress = fraction
+
+
+def start_load(self, kind: str, description: str, work, finish) -> None:
+    """Run a load in a worker thread, the loads are done one after the other in their order
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+        kind (str): what is loaded ("image", "trajectory", "actions")
+        description (str): text displayed in the info bar while loading
+        work: function (progress, cancelled) -> result executed inside the worker thread
+        finish: function (result) -> None executed on the main thread once the work is done
+    """
+
+    self.load_queue.append(LoadJob(kind, description, work, finish))
+
+    if self.current_load is None:
+        _start_next_load(self)
+
+
+def cancel_load(self, event=None) -> None:
+    """Cancel the running load and the waiting ones (they can depend on it)
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+        event (tkinter.Event): set to None here because not used
+    """
+
+    if self.current_load is None:
+        return
+
+    # The worker thread stops at its next check, its result is ignored anyway
+    self.current_load.cancel()
+    self.current_load = None
+    self.load_queue.clear()
+
+    if self.load_after_id is not None:
+        self.after_cancel(self.load_after_id)
+        self.load_after_id = None
+
+    _show_load_progress(self, None)
+
+    # The full resolution decode of the displayed image was dropped with the queue
+    if self.image_pyramid is not None and self.image_pyramid.is_draft:
+        if not self.label_image_info["text"].endswith(DRAFT_ONLY_INFO):
+            self.label_image_info["text"] += DRAFT_ONLY_INFO
+
+
+def is_loading(self, kind: str) -> bool:
+    """Check if a load of this kind is running or waiting
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+        kind (str): what is loaded ("image", "trajectory", "actions")
+    """
+
+    jobs = [self.current_load, *self.load_queue]
+    return any(job is not None and job.kind == kind for job in jobs)
+
+
+def _start_next_load(self) -> None:
+    if not self.load_queue:
+        self.current_load = None
+        _show_load_progress(self, None)
+        return
+
+    self.current_load = self.load_queue.popleft()
+    self.current_load.start()
+    _show_load_progress(self, self.current_load)
+
+    self.load_after_id = self.after(LOAD_POLL_INTERVAL, lambda: _poll_load(self))
+
+
+def _poll_load(self) -> None:
+    """Update the progress of the running load and finish it on the main thread once it's done"""
+
+    self.load_after_id = None
+    job = self.current_load
+    if job is None:
+        return
+
+    if not job.done:
+        _show_load_progress(self, job)
+        self.load_after_id = self.after(LOAD_POLL_INTERVAL, lambda: _poll_load(self))
+        return
+
+    try:
+        if isinstance(job.error, LoadCancelled):
+            pass
+        elif job.error is not None:
+            messagebox.showerror("Error", f"Error loading file: {job.error}")
+        else:
+            job.finish(job.result)
+
+    except Exception as e:
+        messagebox.showerror("Error", f"Error loading file: {e}")
+
+    finally:
+        # finish can have cancelled the loads or started new ones
+        if self.current_load is job:
+            _start_next_load(self)
+
+
+def _show_load_progress(self, job: LoadJob | None) -> None:
+    """Display the progress bar and the cancel button of the info bar while a load is running"""
+
+    if job is None:
+        self.load_progress.stop()
+        self.load_progress.configure(mode="determinate", value=0)
+        self.frame_load_progress.pack_forget()
+        return
+
+    if not self.frame_load_progress.winfo_ismapped():
+        self.frame_load_progress.pack(side="left", padx=10)
+
+    self.label_load_info["text"] = job.description
+
+    if job.progress is None:
+        if str(self.load_progress["mode"]) != "indeterminate":
+            self.load_progress.configure(mode="indeterminate")
+            self.load_progress.start(LOAD_POLL_INTERVAL)
+    else:
+        if str(self.load_progress["mode"]) != "determinate":
+            self.load_progress.stop()
+            self.load_progress.configure(mode="determinate")
+        self.load_progress["value"] = job.progress * 100
+
+
+def read_file(file_path: str, progress, cancelled, chunk_size: int = 1 << 20) -> bytes:
+    """Read a whole file by chunks to report the progress and stop when the load is cancelled
+
+    Args:
+        file_path (str): the file to read
+        progress: progress callback of the load, called with the fraction of the file read
+        cancelled: cancelled callback of the load
+        chunk_size (int): size of a read in bytes
+
+    Raises:
+        LoadCancelled: if the load was cancelled
+
+    Returns:
+        content (bytes): the content of the file
+    """
+
+    with open(file_path, "rb") as file:
+        file.seek(0, 2)
+        size = file.tell() or 1
+        file.seek(0)
+
+        chunks = []
+        read = 0
+        while chunk := file.read(chunk_size):
+            if cancelled():
+                raise LoadCancelled()
+
+            chunks.append(chunk)
+            read += len(chunk)
+            progress(read / size)
+
+    return b"".join(chunks)
@@ -1,9 +1,11 @@
 import tkinter as tk
 from tkinter import ttk
 
+from .overlay import TrajectoryOverlay
+
 
 def create_canvas(self):
-    """Create a canvas where the image will be displayed and add two separator
+    """Create a canvas where the image will be displayed, its trajectory overlay and add two separator
 
     Args:
         self (GUI): the GUI object that is manipulated
@@ -13,6 +15,9 @@ def create_canvas(self):
     self.canvas.pack(expand=True, fill=tk.BOTH)
     self.canvas.bind("<Configure>", self.load_last_opened_image)
 
+    # Trajectory items drawn over the background image
+    self.trajectory_overlay = TrajectoryOverlay(self.canvas)
+
     # Canvas / Menu separator
     separator_cm = ttk.Frame(self.canvas, style="primary.TFrame", height="2")
     separator_cm.pack(side="top", fill="x")
@@ -0,0 +1,69 @@
+import os  # Atomic replacement of the config file
+
+import trajectory_manager
+
+CONFIG_SAVE_DELAY = 500  # Time (ms) after the last change before the config is written
+
+
+class ConfigStore:
+    """The config loaded once in memory, the changes are written to the disk in batches
+
+    set only updates the memory and marks the config as dirty, flush writes the whole config once
+    (a temporary file renamed over the config file so a crash never leaves a truncated config).
+    The GUI calls flush CONFIG_SAVE_DELAY ms after the last change and when it's closed.
+    """
+
+    def __init__(self, file_path: str, content: dict | None = None):
+        self.file_path = file_path
+        self.content = dict(content) if content else {}
+        self.dirty = False
+
+    def get(self, key: str, default=None):
+        return self.content.get(key, default)
+
+    def set(self, key: str, value) -> bool:
+        """Change a value in memory
+
+        Args:
+            key (str): the config key
+            value: the new value, it must be json serializable
+
+        Returns:
+            changed (bool): True if the value is a new one and the config has to be written
+        """
+
+        if key in self.content and self.content[key] == value:
+            return False
+
+        self.content[key] = value
+        self.dirty = True
+
+        return True
+
+    def flush(self) -> bool:
+        """Write the config file if it has unsaved changes
+
+        Raises:
+            OSError: if the file can't be written, the config stays dirty
+
+        Returns:
+            written (bool): True if the file was written
+        """
+
+        if not self.dirty:
+            return False
+
+        temporary_path = f"{self.file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, mode="w", encoding="utf-8") as file:
+                file.write(trajectory_manager.json_dumps(self.content))
+            os.replace(temporary_path, self.file_path)
+
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        self.dirty = False
+
+        return True
@@ -0,0 +1,90 @@
+import numpy as np  # Vectorized outcodes
+
+# Cohen-Sutherland outcodes, the side(s) of the rectangle a point is on
+INSIDE = 0
+LEFT = 1
+RIGHT = 2
+BOTTOM = 4
+TOP = 8
+INVALID = LEFT | RIGHT | BOTTOM | TOP  # Points without coordinates (NaN) are never visible
+
+
+def outcodes(points: np.ndarray, rect: tuple) -> np.ndarray:
+    """Cohen-Sutherland outcode of every point
+
+    Args:
+        points (np.ndarray): (N, 2) array of x, y coordinates
+        rect (tuple): (x_min, y_min, x_max, y_max) in the same coordinates as the points
+
+    Returns:
+        codes (np.ndarray): (N,) uint8 array, INSIDE for the points inside the rectangle
+    """
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    x, y = points[:, 0], points[:, 1]
+    x_min, y_min, x_max, y_max = rect
+
+    codes = np.zeros(len(points), dtype=np.uint8)
+    codes[x < x_min] |= LEFT
+    codes[x > x_max] |= RIGHT
+    codes[y < y_min] |= BOTTOM
+    codes[y > y_max] |= TOP
+    codes[np.isnan(points).any(axis=1)] = INVALID
+
+    return codes
+
+
+def visible_points(points: np.ndarray, rect: tuple) -> np.ndarray:
+    """Mask of the points inside the rectangle
+
+    Args:
+        points (np.ndarray): (N, 2) array of x, y coordinates
+        rect (tuple): (x_min, y_min, x_max, y_max) in the same coordinates as the points
+
+    Returns:
+        mask (np.ndarray): (N,) bool array
+    """
+
+    return outcodes(points, rect) == INSIDE
+
+
+def visible_segments(points: np.ndarray, rect: tuple) -> np.ndarray:
+    """Mask of the segments (point i -> point i + 1) intersecting the rectangle
+
+    Cohen-Sutherland trivial tests first: both ends inside is accepted, both ends on the same
+    outer side is rejected. The few remaining segments (crossing a corner region) are only
+    visible if the four corners of the rectangle are not all on the same side of their line.
+
+    Args:
+        points (np.ndarray): (N, 2) array of x, y coordinates
+        rect (tuple): (x_min, y_min, x_max, y_max) in the same coordinates as the points
+
+    Returns:
+        mask (np.ndarray): (N - 1,) bool array, mask[i] for the segment from point i to point i + 1
+    """
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 2:
+        return np.zeros(0, dtype=bool)
+
+    codes = outcodes(points, rect)
+    start, end = codes[:-1], codes[1:]
+
+    visible = (start | end) == INSIDE
+    undecided = ~visible & ((start & end) == INSIDE)
+
+    if undecided.any():
+        indices = np.flatnonzero(undecided)
+        a = points[indices]
+        direction = points[indices + 1] - a
+
+        x_min, y_min, x_max, y_max = rect
+        corners = np.array([[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]])
+
+        # Side of every corner relative to the line of every segment (2D cross product)
+        offsets = corners[None, :, :] - a[:, None, :]
+        sides = direction[:, None, 0] * offsets[:, :, 1] - direction[:, None, 1] * offsets[:, :, 0]
+
+        visible[indices] = (sides.min(axis=1) <= 0) & (sides.max(axis=1) >= 0)
+
+    return visible
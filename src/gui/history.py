@@ -0,0 +1,268 @@
+import time  # Typing bursts of the edits
+from collections import deque  # Bounded undo stack
+from contextlib import contextmanager
+
+import numpy as np
+
+import trajectory_manager
+
+HISTORY_DEPTH = 500  # Number of steps that can be undone
+MERGE_DELAY = 1.0  # Max time (s) between two keystrokes of an entry to undo them together
+
+
+class PointInsert:
+    """A point inserted at idx, created before the insertion"""
+
+    def __init__(self, trajectory, idx: int):
+        self.idx = idx
+        self.angles = _angle_window(trajectory, idx)
+        self.row = None  # Read back when the insertion is undone
+
+    def undo(self, trajectory) -> None:
+        self.row = trajectory.pop(self.idx)
+        _restore_angle_window(trajectory, self.angles)
+
+    def redo(self, trajectory) -> None:
+        trajectory.insert(self.idx, self.row)
+        trajectory_manager.update_angles(trajectory, self.idx)
+
+
+class PointDelete:
+    """A point deleted at idx, created before the deletion"""
+
+    def __init__(self, trajectory, idx: int):
+        self.idx = idx if idx >= 0 else len(trajectory) + idx
+        self.angles = _angle_window(trajectory, self.idx)
+        self.row = trajectory[self.idx]
+
+    def undo(self, trajectory) -> None:
+        trajectory.insert(self.idx, self.row)
+        _restore_angle_window(trajectory, self.angles)
+
+    def redo(self, trajectory) -> None:
+        trajectory.pop(self.idx)
+        trajectory_manager.update_angles(trajectory, self.idx)
+
+
+class PointEdit:
+    """One value of a point changed, created before the change"""
+
+    def __init__(self, trajectory, idx: int, field: int):
+        self.idx = idx if idx >= 0 else len(trajectory) + idx
+        self.field = field
+        self.angles = _angle_window(trajectory, self.idx)
+        self.old_value = trajectory.get(self.idx, field)
+        self.new_value = None  # Read back when the change is undone
+        self.time = time.monotonic()  # Time of the last edit merged into this step
+
+    def undo(self, trajectory) -> None:
+        self.new_value = trajectory.get(self.idx, self.field)
+        trajectory.set(self.idx, self.field, self.old_value)
+        _restore_angle_window(trajectory, self.angles)
+
+    def redo(self, trajectory) -> None:
+        trajectory.set(self.idx, self.field, self.new_value)
+        # Only the coordinates change the headings of the segments
+        if self.field < 2:
+            trajectory_manager.update_angles(trajectory, self.idx)
+
+    def merge(self, step) -> bool:
+        # Every keystroke inside an entry is an edit, the ones of a typing burst are undone
+        # together. An action toggle (field 5) is a click, it's always its own step
+        if not (
+            isinstance(step, PointEdit)
+            and step.idx == self.idx
+            and step.field == self.field
+            and step.field != 5
+            and step.time - self.time <= MERGE_DELAY
+        ):
+            return False
+
+        self.time = step.time
+        return True
+
+
+class PointsRemoved:
+    """Points removed in one step (simplification), created before the removal"""
+
+    def __init__(self, trajectory, indices):
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.points = trajectory.take(self.indices)
+        # Angles of the points before the removed ones, changed by remove_points
+        self.before = self.indices[self.indices > 0] - 1
+        self.angles = trajectory.angle[self.before].copy()
+
+    def undo(self, trajectory) -> None:
+        trajectory.put(self.indices, self.points)
+        trajectory.angle[self.before] = self.angles
+
+    def redo(self, trajectory) -> None:
+        trajectory_manager.remove_points(trajectory, self.indices)
+
+
+class Transform:
+    """An affine transform of the whole trajectory (only its 3x3 matrix is kept)"""
+
+    def __init__(self, matrix):
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+
+    def undo(self, trajectory) -> None:
+        trajectory_manager.transform_trajectory(trajectory, np.linalg.inv(self.matrix))
+
+    def redo(self, trajectory) -> None:
+        trajectory_manager.transform_trajectory(trajectory, self.matrix)
+
+
+class StepGroup:
+    """Steps undone and redone together (deletion of the checked points)"""
+
+    def __init__(self, steps: list):
+        self.steps = steps
+
+    def undo(self, trajectory) -> None:
+        for step in reversed(self.steps):
+            step.undo(trajectory)
+
+    def redo(self, trajectory) -> None:
+        for step in self.steps:
+            step.redo(trajectory)
+
+
+class History:
+    """Undo & redo stacks of the trajectory edits
+
+    A step only keeps what it changed (the removed rows, the previous value of a field, the matrix
+    of a transform and the few angles around the edited point), never a copy of the trajectory,
+    so its memory doesn't depend on the size of the trajectory. The oldest steps are dropped
+    after depth steps.
+    """
+
+    def __init__(self, depth: int = HISTORY_DEPTH):
+        self.undo_steps = deque(maxlen=max(depth, 1))
+        self.redo_steps = []
+        self._group = None
+
+    def push(self, step) -> None:
+        """Save a step that was just applied to the trajectory, the redo stack is cleared"""
+
+        if self._group is not None:
+            self._group.append(step)
+            return
+
+        self.redo_steps.clear()
+
+        if (
+            self.undo_steps
+            and hasattr(self.undo_steps[-1], "merge")
+            and self.undo_steps[-1].merge(step)
+        ):
+            return  # The previous step already restores the value before this one
+
+        self.undo_steps.append(step)
+
+    @contextmanager
+    def group(self):
+        """Push the steps of the with block as one step"""
+
+        self._group = []
+        try:
+            yield
+        finally:
+            steps, self._group = self._group, None
+            if len(steps) == 1:
+                self.push(steps[0])
+            elif steps:
+                self.push(StepGroup(steps))
+
+    def undo(self, trajectory) -> bool:
+        if not self.undo_steps:
+            return False
+
+        step = self.undo_steps.pop()
+        step.undo(trajectory)
+        self.redo_steps.append(step)
+
+        return True
+
+    def redo(self, trajectory) -> bool:
+        if not self.redo_steps:
+            return False
+
+        step = self.redo_steps.pop()
+        step.redo(trajectory)
+        self.undo_steps.append(step)
+
+        return True
+
+    def clear(self) -> None:
+        self.undo_steps.clear()
+        self.redo_steps.clear()
+
+
+def _angle_window(trajectory, idx: int) -> tuple[int, np.ndarray]:
+    """Copy the angles that update_angles can change around idx (before the change)"""
+
+    start = max(idx - 1, 0)
+    return start, trajectory.angle[start : idx + 2].copy()
+
+
+def _restore_angle_window(trajectory, window: tuple[int, np.ndarray]) -> None:
+    start, angles = window
+    trajectory.angle[start : start + len(angles)] = angles
+
+
+def edit_point(self, idx: int, field: int, value) -> None:
+    """Change one value of a point and save the change inside the history
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+        idx (int): index of the point
+        field (int): index of the value inside FIELDS
+        value: the new value, None (or an empty string) to unset it
+
+    Raises:
+        ValueError: if the value can't be stored inside the column of the field
+    """
+
+    step = PointEdit(self.image_points, idx, field)
+    self.image_points = trajectory_manager.update_trajectory(
+        self.image_points, idx, field, value
+    )
+    self.history.push(step)
+    self.update_simplify_preview()
+
+
+def undo(self, event=None) -> None:
+    """Undo the last edit of the trajectory / control + z
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+        event (tkinter.Event): set to None here because not used
+    """
+
+    if self.history.undo(self.image_points):
+        _refresh_after_history(self)
+
+
+def redo(self, event=None) -> None:
+    """Redo the last undone edit of the trajectory / control + y
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+        event (tkinter.Event): set to None here because not used
+    """
+
+    if self.history.redo(self.image_points):
+        _refresh_after_history(self)
+
+
+def _refresh_after_history(self) -> None:
+    # The indices may have moved, the selection and the checked points are reset
+    self.selected_point_idx = None
+    self.checked_points.clear()
+    self.trajectory_overlay.select(None)
+
+    self.point_grid.rebuild(self.image_points.xy)
+    self.update_trajectory_panel_content()
+    self.redraw_image()
+    self.update_simplify_preview()
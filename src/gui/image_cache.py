@@ -0,0 +1,192 @@
+import hashlib  # Cache keys
+import json  # Header of the cache files
+import os  # Cache directory operations
+import struct  # Header of the cache files
+
+import numpy as np  # Memory-mapped levels
+from PIL import Image  # Image management
+
+IMAGE_CACHE_SIZE = 512 * 1024 * 1024  # Maximum size of the cache directory in bytes
+CACHE_EXTENSION = ".pyr"
+CACHE_MAGIC = b"TPYR"
+CACHE_ALIGNMENT = 4096  # The levels start on a page boundary so they can be mapped directly
+
+
+class ImageCache:
+    """Directory of decoded images and their pyramid levels, stored raw to be memory-mapped
+
+    A cache file is named after the path of the image and its modification time and size, so an
+    edited image is decoded again. Loading a cached image maps its levels instead of decoding the
+    file: it takes a few milliseconds and the pages are shared between all the running instances.
+    The least recently used files are removed once the directory is bigger than max_bytes.
+
+    Layout of a cache file: CACHE_MAGIC, the size of the header (little-endian uint32), the json
+    header (format, mode and the size & offset of every level) and the raw levels.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = IMAGE_CACHE_SIZE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def load(self, filename: str) -> tuple[list[Image.Image], str | None] | None:
+        """Map the cached levels of an image
+
+        Args:
+            filename (str): path of the image
+
+        Returns:
+            cached (tuple | None): (levels, format of the image file), None if the image isn't cached
+        """
+
+        cache_path = self._cache_path(filename)
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+
+        try:
+            with open(cache_path, "rb") as file:
+                magic, header_size = struct.unpack("<4sI", file.read(8))
+                if magic != CACHE_MAGIC:
+                    return None
+                header = json.loads(file.read(header_size))
+
+            levels = []
+            for width, height, offset in header["levels"]:
+                size = width * height * len(header["mode"])
+                data = np.memmap(
+                    cache_path, dtype=np.uint8, mode="r", offset=offset, shape=(size,)
+                )
+                levels.append(
+                    Image.frombuffer(
+                        header["mode"], (width, height), data, "raw", header["mode"], 0, 1
+                    )
+                )
+
+        except (OSError, ValueError, KeyError, struct.error):
+            return None  # Incomplete or corrupted file, the image is decoded again
+
+        # Most recently used file for the eviction
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+        return levels, header.get("format")
+
+    def store(self, filename: str, levels: list[Image.Image], format: str | None) -> None:
+        """Write the levels of an image inside the cache and evict the oldest files if needed
+
+        Args:
+            filename (str): path of the image
+            levels (list[Image.Image]): the full resolution image and its reduced copies
+            format (str | None): format of the image file (displayed in the info bar)
+        """
+
+        cache_path = self._cache_path(filename)
+        if cache_path is None or levels[0].mode not in ("L", "RGB", "RGBA"):
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Offsets of the levels, aligned on CACHE_ALIGNMENT after the header (inside the first page)
+        header = {"format": format, "mode": levels[0].mode, "levels": []}
+        offset = CACHE_ALIGNMENT
+        for level in levels:
+            header["levels"].append([level.width, level.height, offset])
+            offset = _align(offset + level.width * level.height * len(level.mode))
+
+        encoded_header = json.dumps(header).encode("utf-8")
+        if 8 + len(encoded_header) > header["levels"][0][2]:
+            return
+
+        # Written next to the final file and renamed, another instance never reads a partial file
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(struct.pack("<4sI", CACHE_MAGIC, len(encoded_header)))
+                file.write(encoded_header)
+                for level, (_, _, level_offset) in zip(levels, header["levels"]):
+                    file.seek(level_offset)
+                    file.write(level.tobytes())
+            os.replace(temporary_path, cache_path)
+
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return
+
+        # Previous versions of the same image are useless now (the temporary files are the
+        # writes in progress of the other instances)
+        prefix = os.path.basename(cache_path).split("-")[0]
+        for entry in self._files():
+            if entry.name.startswith(prefix) and entry.path != cache_path:
+                _remove(entry.path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used files until the cache is under max_bytes"""
+
+        files = sorted(self._files(), key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in files)
+
+        for entry in files:
+            if total <= self.max_bytes:
+                break
+            total -= entry.stat().st_size
+            _remove(entry.path)
+
+    def clear(self) -> int:
+        """Remove every cached image
+
+        Returns:
+            freed (int): number of bytes removed
+        """
+
+        freed = 0
+        for entry in self._files():
+            freed += entry.stat().st_size
+            _remove(entry.path)
+
+        return freed
+
+    def size(self) -> int:
+        """Get the size of the cached images in bytes"""
+
+        return sum(entry.stat().st_size for entry in self._files())
+
+    def _files(self) -> list:
+        if not os.path.isdir(self.directory):
+            return []
+
+        return [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.is_file() and entry.name.endswith(CACHE_EXTENSION)
+        ]
+
+    def _cache_path(self, filename: str) -> str | None:
+        """Get the cache file of an image: hash of its path - hash of its modification time and size"""
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+
+        path_key = hashlib.sha1(os.path.abspath(filename).encode("utf-8")).hexdigest()
+        version_key = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()
+
+        return os.path.join(
+            self.directory, f"{path_key[:16]}-{version_key[:16]}{CACHE_EXTENSION}"
+        )
+
+
+def _align(offset: int) -> int:
+    return -(-offset // CACHE_ALIGNMENT) * CACHE_ALIGNMENT
+
+
+def _remove(path: str) -> None:
+    # Another instance can remove the same file at the same time
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,316 @@
+import math  # Level calculations
+from collections import OrderedDict  # LRU tile cache
+
+import numpy as np  # Affine transformation matrix operations
+from PIL import Image  # Image management
+
+TILE_SIZE = 256  # Width and height of a tile in pixels
+MIN_LEVEL_SIZE = 128  # The smallest side of the last level can't be under this value
+TILE_CACHE_SIZE = 128  # Maximum number of tiles kept in memory
+
+
+class ImagePyramid:
+    """Precomputed 1/2, 1/4, 1/8 ... copies of an image, split in tiles that are cached on demand
+
+    Rendering picks the level that is the closest to the current scale of the view and only
+    composes the tiles that are visible on the canvas, so the affine transformation never
+    works on the full resolution image when the view is zoomed out.
+
+    A draft pyramid is built from a reduced copy of the source (draft decoding), it renders in
+    the coordinates of the full resolution source, the missing levels are upscaled.
+    """
+
+    def __init__(
+        self,
+        pil_image: Image.Image,
+        tile_size: int = TILE_SIZE,
+        cache_size: int = TILE_CACHE_SIZE,
+        source: Image.Image | None = None,
+    ):
+        self.tile_size = tile_size
+        self.cache_size = cache_size
+        self._tiles = OrderedDict()  # (level, tile_x, tile_y) -> tile, oldest first
+        # Full resolution image the pyramid represents, pil_image is a reduced copy of it for a draft
+        self.source = pil_image if source is None else source
+        self.size = self.source.size
+        self.base_scale = pil_image.width / self.size[0]  # Scale of the first level
+        self.is_draft = self.base_scale < 1
+        self._region_key = None  # (level, first and last tiles) of the last composed region
+        self._region = None  # Last composed region, reused while the same tiles are visible
+
+        # Tiles are composed on a blank image, so the mode need to have a simple "empty" value
+        if pil_image.mode not in ("L", "RGB", "RGBA"):
+            pil_image = pil_image.convert("RGBA")
+
+        self.mode = pil_image.mode
+        self.levels = [pil_image]
+
+        # Level n is the level n - 1 reduced by 2 (box filter, fast and without aliasing)
+        while min(self.levels[-1].size) // 2 >= MIN_LEVEL_SIZE:
+            self.levels.append(self.levels[-1].reduce(2))
+
+    @classmethod
+    def from_levels(
+        cls,
+        levels: list[Image.Image],
+        tile_size: int = TILE_SIZE,
+        cache_size: int = TILE_CACHE_SIZE,
+    ) -> "ImagePyramid":
+        """Create a pyramid from levels that were already computed (image cache)
+
+        Args:
+            levels (list[Image.Image]): the full resolution image and its reduced copies
+
+        Returns:
+            pyramid (ImagePyramid): the pyramid, its source is levels[0]
+        """
+
+        pyramid = cls.__new__(cls)
+        pyramid.tile_size = tile_size
+        pyramid.cache_size = cache_size
+        pyramid._tiles = OrderedDict()
+        pyramid.source = levels[0]
+        pyramid.size = levels[0].size
+        pyramid.base_scale = 1.0
+        pyramid.is_draft = False
+        pyramid._region_key = None
+        pyramid._region = None
+        pyramid.mode = levels[0].mode
+        pyramid.levels = list(levels)
+
+        return pyramid
+
+    def level_for_scale(self, scale: float) -> int:
+        """Get the level to use for a scale, the one with the closest resolution to the view
+
+        Args:
+            scale (float): the scale of the view (canvas pixels per image pixel)
+
+        Returns:
+            level (int): index of the level inside self.levels
+        """
+
+        if scale <= 0:
+            return 0
+
+        level = round(math.log2(self.base_scale / scale))
+
+        return min(max(level, 0), len(self.levels) - 1)
+
+    def get_tile(self, level: int, tile_x: int, tile_y: int) -> Image.Image:
+        """Get a tile from the cache or crop it from its level if it's not cached
+
+        Args:
+            level (int): index of the level of the tile
+            tile_x (int): column of the tile
+            tile_y (int): row of the tile
+
+        Returns:
+            tile (Image.Image): the tile, smaller than tile_size on the right and bottom borders
+        """
+
+        key = (level, tile_x, tile_y)
+        tile = self._tiles.get(key)
+
+        if tile is not None:
+            self._tiles.move_to_end(key)  # Most recently used
+            return tile
+
+        level_image = self.levels[level]
+        left = tile_x * self.tile_size
+        top = tile_y * self.tile_size
+        tile = level_image.crop(
+            (
+                left,
+                top,
+                min(left + self.tile_size, level_image.width),
+                min(top + self.tile_size, level_image.height),
+            )
+        )
+
+        self._tiles[key] = tile
+        if len(self._tiles) > self.cache_size:
+            self._tiles.popitem(last=False)  # Remove the least recently used tile
+
+        return tile
+
+    def render(
+        self,
+        size: tuple[int, int],
+        mat_affine: np.ndarray,
+        resample=Image.NEAREST,
+        reduction: int = 1,
+    ) -> Image.Image:
+        """Render the part of the image that is visible through the mat_affine view
+
+        Args:
+            size (tuple[int, int]): width and height of the canvas
+            mat_affine (np.ndarray): 3x3 affine matrix from image coordinates to canvas coordinates
+            resample: interpolation method used by the affine transformation
+            reduction (int): render at 1 / reduction of the canvas resolution and upscale the result
+                (draft quality, used while the view is moving)
+
+        Returns:
+            dst (Image.Image): the rendered image, same result as a transform of the full image
+        """
+
+        if reduction > 1:
+            mat_reduction = np.eye(3)
+            mat_reduction[0, 0] = mat_reduction[1, 1] = 1 / reduction
+            draft = self.render(
+                (-(-size[0] // reduction), -(-size[1] // reduction)),  # Rounded up
+                np.dot(mat_reduction, mat_affine),
+                resample,
+            )
+            return draft.resize(
+                size, Image.NEAREST, box=(0, 0, size[0] / reduction, size[1] / reduction)
+            )
+
+        canvas_width, canvas_height = size
+
+        # Affine transformation matrix from canvas to image data
+        mat_inv = np.linalg.inv(mat_affine)
+
+        scale = math.sqrt(abs(np.linalg.det(mat_affine[:2, :2])))
+        level = self.level_for_scale(scale)
+        level_image = self.levels[level]
+
+        # Level image pixels per full resolution image pixels (reduce round up odd sizes)
+        mat_level = np.eye(3)
+        mat_level[0, 0] = level_image.width / self.size[0]
+        mat_level[1, 1] = level_image.height / self.size[1]
+        mat_inv = np.dot(mat_level, mat_inv)
+
+        # Corners of the canvas inside the level image
+        corners = np.dot(
+            mat_inv,
+            (
+                (0, canvas_width, 0, canvas_width),
+                (0, 0, canvas_height, canvas_height),
+                (1.0, 1.0, 1.0, 1.0),
+            ),
+        )
+
+        # Visible part of the level image (with a margin of one pixel for the interpolation)
+        left = max(math.floor(corners[0].min()) - 1, 0)
+        top = max(math.floor(corners[1].min()) - 1, 0)
+        right = min(math.ceil(corners[0].max()) + 1, level_image.width)
+        bottom = min(math.ceil(corners[1].max()) + 1, level_image.height)
+
+        # The image is entirely outside the canvas
+        if left >= right or top >= bottom:
+            return Image.new(self.mode, size)
+
+        first_tile_x, last_tile_x = left // self.tile_size, (right - 1) // self.tile_size
+        first_tile_y, last_tile_y = top // self.tile_size, (bottom - 1) // self.tile_size
+
+        region_key = (level, first_tile_x, first_tile_y, last_tile_x, last_tile_y)
+
+        # Compose the visible tiles
+        if region_key == self._region_key:
+            region = self._region
+        elif first_tile_x == last_tile_x and first_tile_y == last_tile_y:
+            region = self.get_tile(level, first_tile_x, first_tile_y)
+        else:
+            region = Image.new(
+                self.mode,
+                (
+                    min((last_tile_x + 1) * self.tile_size, level_image.width)
+                    - first_tile_x * self.tile_size,
+                    min((last_tile_y + 1) * self.tile_size, level_image.height)
+                    - first_tile_y * self.tile_size,
+                ),
+            )
+            for tile_y in range(first_tile_y, last_tile_y + 1):
+                for tile_x in range(first_tile_x, last_tile_x + 1):
+                    region.paste(
+                        self.get_tile(level, tile_x, tile_y),
+                        (
+                            (tile_x - first_tile_x) * self.tile_size,
+                            (tile_y - first_tile_y) * self.tile_size,
+                        ),
+                    )
+
+        self._region_key = region_key
+        self._region = region
+
+        # Move the origin to the top left corner of the composed region
+        mat_inv[0, 2] -= first_tile_x * self.tile_size
+        mat_inv[1, 2] -= first_tile_y * self.tile_size
+
+        # Affine transformation of the composed region
+        return region.transform(
+            size,  # Output size
+            Image.AFFINE,  # Affine transformation
+            (
+                mat_inv[0, 0],
+                mat_inv[0, 1],
+                mat_inv[0, 2],
+                mat_inv[1, 0],
+                mat_inv[1, 1],
+                mat_inv[1, 2],
+            ),  # Affine transformation matrix (output to input transformation matrix)
+            resample,  # Interpolation method
+        )
+
+
+def draft_reduction(image_size: tuple[int, int], canvas_size: tuple[int, int]) -> int:
+    """Get the reduction (power of 2) of the image that is enough to display it fitted to the canvas
+
+    It's the level that the pyramid would render at this scale, so a draft decoded with this
+    reduction gives the same first frame as the full resolution image.
+
+    Args:
+        image_size (tuple[int, int]): width and height of the full resolution image
+        canvas_size (tuple[int, int]): width and height of the canvas
+
+    Returns:
+        reduction (int): 1 if the image is not displayed smaller than its resolution
+    """
+
+    scale = min(canvas_size[0] / image_size[0], canvas_size[1] / image_size[1])
+    if scale <= 0 or scale >= 1:
+        return 1
+
+    reduction = 2 ** round(math.log2(1 / scale))
+
+    # A tiny canvas (not mapped yet) doesn't need a draft smaller than the last level
+    while reduction > 1 and min(image_size) // reduction < MIN_LEVEL_SIZE:
+        reduction //= 2
+
+    return reduction
+
+
+def decode_draft(filename: str, source: Image.Image, reduction: int) -> Image.Image:
+    """Decode a reduced copy of a JPEG image, faster than decoding it at full resolution
+
+    The image is decoded directly at the reduced size (draft mode, DCT scaling). The other
+    formats can't be partially decoded, a draft of them would only be ready after a full decode
+    so they don't have one (see has_draft).
+
+    Args:
+        filename (str): path of the image
+        source (Image.Image): the opened (not decoded yet) full resolution image
+        reduction (int): the reduction of the draft
+
+    Returns:
+        draft (Image.Image): the reduced copy, about 1 / reduction of the source size
+    """
+
+    draft = Image.open(filename)
+    draft.draft(
+        draft.mode,
+        (-(-source.width // reduction), -(-source.height // reduction)),
+    )
+    draft.load()
+    return draft
+
+
+def has_draft(source: Image.Image) -> bool:
+    """Check if a reduced copy of the image can be decoded before the full resolution one
+
+    Args:
+        source (Image.Image): the opened (not decoded yet) full resolution image
+    """
+
+    return source.format == "JPEG"
@@ -18,6 +18,25 @@ def create_info_bar(self):
         frame_statusbar,
         text="(x, y)",
     )
+    # Number of mouse events merged by the render loop (see render_loop.py)
+    self.label_render_info = ttk.Label(
+        frame_statusbar,
+        text="Coalesced events: 0",
+    )
+    # Progress of the file loaded in the background (see background_loader.py), only packed while loading
+    self.frame_load_progress = ttk.Frame(frame_statusbar)
+    self.label_load_info = ttk.Label(self.frame_load_progress, text="")
+    self.load_progress = ttk.Progressbar(
+        self.frame_load_progress, length=120, mode="determinate", maximum=100
+    )
+    self.button_load_cancel = ttk.Button(
+        self.frame_load_progress, text="Cancel", command=self.cancel_load
+    )
+    self.label_load_info.pack(side=tk.LEFT)
+    self.load_progress.pack(side=tk.LEFT, padx=5)
+    self.button_load_cancel.pack(side=tk.LEFT)
+
     self.label_image_info.pack(side=tk.RIGHT)
     self.label_image_pixel.pack(side=tk.LEFT)
+    self.label_render_info.pack(side=tk.LEFT, padx=10)
     frame_statusbar.pack(side=tk.BOTTOM, fill=tk.X)
@@ -0,0 +1,146 @@
+import cProfile  # Session profiling
+import os  # Default path of the profile
+import time  # Span timing
+from collections import deque  # Last durations of every span
+from contextlib import nullcontext
+from tkinter import filedialog, messagebox
+
+import numpy as np  # Percentiles
+
+HUD_FRAMES = 120  # Number of frames used for the percentiles of the HUD
+HUD_POSITION = (10, 10)  # Top left corner of the HUD in canvas pixels
+HUD_FONT = ("Courier", 9)
+HUD_COLOR = "#eeb604"
+
+_NO_SPAN = nullcontext()  # Returned by span when the instrumentation is disabled
+
+
+class _Span:
+    def __init__(self, instrumentation, name: str):
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.instrumentation.record(self.name, (time.perf_counter() - self.start) * 1000)
+
+
+class Instrumentation:
+    """Durations of the rendering stages, only measured while enabled
+
+    with instrumentation.span("transform"): ... times the block and keeps the last HUD_FRAMES
+    durations of every span name. When disabled span returns a shared empty context manager,
+    so an instrumented block only costs an attribute check.
+    """
+
+    def __init__(self, enabled: bool = False, size: int = HUD_FRAMES):
+        self.enabled = enabled
+        self.size = size
+        self.durations = {}  # Span name -> deque of the last durations in ms
+
+    def span(self, name: str):
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, duration: float) -> None:
+        if name not in self.durations:
+            self.durations[name] = deque(maxlen=self.size)
+        self.durations[name].append(duration)
+
+    def percentiles(self, name: str) -> tuple[float, float, float] | None:
+        """Get (last, p50, p95) of a span in ms, None if it was never measured"""
+
+        durations = self.durations.get(name)
+        if not durations:
+            return None
+
+        p50, p95 = np.percentile(durations, (50, 95))
+        return durations[-1], float(p50), float(p95)
+
+    def clear(self) -> None:
+        self.durations.clear()
+
+
+def update_hud(self) -> None:
+    """Display the frame times and the duration of the rendering stages over the canvas
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+    """
+
+    if not self.instrumentation.enabled:
+        if self.hud_item is not None:
+            self.canvas.delete(self.hud_item)
+            self.hud_item = None
+        return
+
+    lines = []
+    for name in ("frame", "transform", "photoimage", "canvas_background", "canvas_overlay", "panel"):
+        values = self.instrumentation.percentiles(name)
+        if values is not None:
+            lines.append(f"{name:<17} {values[0]:7.2f} ms  p50 {values[1]:7.2f}  p95 {values[2]:7.2f}")
+
+    items = self.trajectory_overlay.item_count() + (self.background_item is not None)
+    lod = " (level of detail)" if self.trajectory_overlay.lod else ""
+    lines.append(f"canvas items      {items}{lod}")
+    lines.append(f"frames            {len(self.instrumentation.durations.get('frame', ()))}")
+
+    if self.hud_item is None:
+        self.hud_item = self.canvas.create_text(
+            *HUD_POSITION, anchor="nw", font=HUD_FONT, fill=HUD_COLOR, tags=("hud",)
+        )
+    self.canvas.itemconfig(self.hud_item, text="\n".join(lines))
+    self.canvas.tag_raise(self.hud_item)  # Above the trajectory & the preview
+
+
+def toggle_profiling(self) -> None:
+    """Start profiling the session with cProfile, or stop it and save the stats to a .prof file
+
+    The stats can be read with pstats or snakeviz. Only the main thread (events & rendering) is profiled.
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+    """
+
+    if self.profiler is None:
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+        return
+
+    stop_profiling(self, ask=True)
+
+
+def stop_profiling(self, ask: bool = False) -> None:
+    """Stop the running profiling and save its stats
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+        ask (bool): True to choose the file, False to save it next to the config (on exit)
+    """
+
+    if self.profiler is None:
+        return
+
+    self.profiler.disable()
+    profiler, self.profiler = self.profiler, None
+    self.profile_session.set(0)
+
+    default_name = time.strftime("trajectory_picker_%Y%m%d_%H%M%S.prof")
+    if ask:
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".prof",
+            filetypes=[("Profile", ".prof")],
+            initialfile=default_name,
+        )
+        if not file_path:
+            return
+    else:
+        file_path = os.path.join(os.path.dirname(self.CONFIG_FILE), default_name)
+
+    try:
+        profiler.dump_stats(file_path)
+    except OSError as e:
+        messagebox.showerror("Error", f"Error saving the profile: {e}")
@@ -2,25 +2,69 @@
 
 import tkinter as tk  # Window creation
 from tkinter import image_names, ttk, StringVar, filedialog, messagebox  # Open file
+from tkinter import simpledialog  # Parameters of the transforms
 from PIL import Image, ImageTk  # Image management
-import math  # Revolution calculations
 import numpy as np  # Affine transformation matrix operations
 import os  # Directory operations
+import time  # Frame timing
+from collections import deque  # Last frame times
 import json  # Json operations
 
 import trajectory_manager
 
 from .actions_panel import toggle_actions_panel
+from .background_loader import (
+    start_load,
+    cancel_load,
+    is_loading,
+    read_file,
+    LoadCancelled,
+)
 from .canvas import create_canvas
+from .config_store import ConfigStore, CONFIG_SAVE_DELAY
+from .culling import visible_points, visible_segments
+from .history import (
+    History,
+    PointInsert,
+    PointDelete,
+    Transform,
+    edit_point,
+    undo,
+    redo,
+    HISTORY_DEPTH,
+)
+from .image_cache import ImageCache, IMAGE_CACHE_SIZE
+from .image_pyramid import ImagePyramid, decode_draft, draft_reduction, has_draft
 from .info_bar import create_info_bar
+from .instrumentation import (
+    Instrumentation,
+    update_hud,
+    toggle_profiling,
+    stop_profiling,
+)
 from .menu_bar import (
     create_menu_bar,
     toggle_wea_checkbutton,
     toggle_export_action_checkbutton,
     toggle_export_action_command,
 )
+from .overlay import POINT_RADIUS
+from .point_grid import PointGrid
+from .render_loop import (
+    schedule_render,
+    render_frame,
+    start_gesture,
+    end_gesture,
+    DRAFT_REDUCTION,
+)
 from .shortcuts import create_default_shortcuts
+from .simplify_panel import (
+    toggle_simplify_panel,
+    draw_simplify_preview,
+    update_simplify_preview,
+)
 from .trajectory_panel import toggle_trajectory_panel, update_trajectory_panel_content
+from .view_transform import ViewTransform
 
 
 class GUI(tk.Frame):
@@ -33,6 +77,21 @@ class GUI(tk.Frame):
     toggle_export_action_checkbutton = toggle_export_action_checkbutton
     toggle_export_action_command = toggle_export_action_command
     create_default_shortcuts = create_default_shortcuts
+    schedule_render = schedule_render
+    render_frame = render_frame
+    start_gesture = start_gesture
+    end_gesture = end_gesture
+    start_load = start_load
+    cancel_load = cancel_load
+    is_loading = is_loading
+    edit_point = edit_point
+    update_hud = update_hud
+    toggle_simplify_panel = toggle_simplify_panel
+    draw_simplify_preview = draw_simplify_preview
+    update_simplify_preview = update_simplify_preview
+    toggle_profiling = toggle_profiling
+    undo = undo
+    redo = redo
     toggle_trajectory_panel = toggle_trajectory_panel
     update_trajectory_panel_content = update_trajectory_panel_content
 
@@ -47,31 +106,46 @@ class GUI(tk.Frame):
 
         self.CONFIG_FILE = CONFIG_FILE
 
-        # Config
-        self.CONFIG = (
-            self.load_json_file(self.CONFIG_FILE)
-            if self.load_json_file(self.CONFIG_FILE)
-            else {}
-        )
+        # Config, read once and written in batches by save_config
+        self.CONFIG = ConfigStore(self.CONFIG_FILE, self.load_json_file(self.CONFIG_FILE))
+        self.config_after_id = None
 
         # Set the self.vars to the content of the config
         self.assign_config()
 
+        # Image to canvas transformation with its cached forward & inverse matrices
+        self.view = ViewTransform()
+        self.view.set_coordinate_system(self.coordinate_system.get(), 0)
+
         # Basic window setting
         self.master.geometry("600x400")
+        # Closing the window also writes the pending config changes
+        self.master.protocol("WM_DELETE_WINDOW", self.menu_quit_clicked)
 
         self.pil_image = None  # Image to display
+        # Decoded images and their pyramid levels, memory-mapped on the next launches
+        self.image_cache = ImageCache(
+            os.path.join(os.path.dirname(self.CONFIG_FILE), ".image_cache"),
+            self.CONFIG.get("image_cache_size", IMAGE_CACHE_SIZE),
+        )
+        self.image_pyramid = None  # Reduced copies of the image used for the rendering
+        self.background_item = None  # Canvas item of the rendered image
+        self.background_key = None  # View of the current background, to know if it changed
         self.my_title = "Trajectory Picker"
 
         # Window title
         self.master.title(self.my_title)
 
         # Trajectory points
-        self.image_points = []  # list of (x, y) tuples in image coordinates
+        self.image_points = (
+            trajectory_manager.Trajectory()
+        )  # Points in image coordinates, stored in NumPy columns
+        self.point_grid = PointGrid()  # Spatial index of the points used for the selection
+        # Undo & redo of the edits, only the changes are kept
+        self.history = History(self.CONFIG.get("history_depth", HISTORY_DEPTH))
 
         # Selected point index
         self.selected_point_idx = None
-        self.min_distance = None
 
         # Preview point
         self.preview_mode = False  # True while we’re waiting for a click
@@ -86,12 +160,44 @@ class GUI(tk.Frame):
 
         # Trajectory panel variable to know if toggle_trajectory_panel have to display the panel or close it
         self.trajectory_panel = None
+        self.trajectory_rows = []  # Recycled widgets of the points visible inside the panel
+        self.trajectory_row_layout = None  # Options used to create the rows
+
+        # Simplification window and the mask of the points kept by its preview
+        self.simplify_panel = None
+        self.simplify_mask = None
+        self.simplify_preview_item = None
+        self.simplify_after_id = None
 
         # Variable to toggle symmetry
         self.symmetry = False
 
-        # Variable to get which point to delete
-        self.checkbox_del_widgets = []
+        # Indices of the points checked inside the trajectory panel, to know which point to delete
+        self.checked_points = set()
+
+        # Render loop state, mouse motions are coalesced into one render per frame
+        self.render_after_id = None
+        self.render_view = False
+        self.render_overlay = False
+        self.render_preview_pointer = None
+        self.render_info_pointer = None
+        self.last_render_time = time.perf_counter()
+        self.coalesced_events = 0
+
+        # Progressive rendering, draft quality while a gesture is active
+        self.gesture_active = False
+        self.refine_after_id = None
+        self.frame_times = deque(maxlen=60)  # Duration of the last draws in ms
+
+        # Timing of the rendering stages displayed by the HUD, nothing is measured while it's hidden
+        self.instrumentation = Instrumentation(bool(self.performance_hud.get()))
+        self.hud_item = None
+        self.profiler = None  # cProfile.Profile of the session while profiling
+
+        # Files loaded inside a worker thread, one after the other
+        self.current_load = None
+        self.load_queue = deque()
+        self.load_after_id = None
 
         # Wait for the basic generation of the GUI before loading other widgets
         self.master.update()
@@ -104,14 +210,61 @@ class GUI(tk.Frame):
 
     # Close the window
     def menu_quit_clicked(self, event=None):
+        stop_profiling(self)  # Saved next to the config
+        self.flush_config()
         self.master.destroy()
 
     # Set image in the canvas
     def set_image(self, filename):
         if not filename:
             return
-        # Open with PIL.Image
-        self.pil_image = Image.open(filename)
+
+        canvas_size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+
+        def _decode(progress, cancelled):
+            # Already decoded during a previous launch, the levels are only mapped
+            cached = self.image_cache.load(filename)
+            if cached is not None:
+                levels, image_format = cached
+                levels[0].format = image_format  # Displayed in the info bar
+                return levels[0], ImagePyramid.from_levels(levels)
+
+            # Open with PIL.Image and decode it inside the worker thread
+            pil_image = Image.open(filename)
+
+            # The first frame only needs the image at the zoom_fit scale: decode a reduced copy,
+            # the full resolution is decoded afterwards (see show_image). Only JPEG images can
+            # be decoded reduced, the others (PNG playmats) are decoded once at full resolution
+            reduction = draft_reduction(pil_image.size, canvas_size)
+            if reduction > 1 and has_draft(pil_image):
+                draft = decode_draft(filename, pil_image, reduction)
+                if cancelled():
+                    raise LoadCancelled()
+                return pil_image, ImagePyramid(draft, source=pil_image)
+
+            pil_image.load()
+            if cancelled():
+                raise LoadCancelled()
+            # Build the reduced copies of the image (1/2, 1/4, ...) once for all the renderings
+            image_pyramid = ImagePyramid(pil_image)
+            self.image_cache.store(filename, image_pyramid.levels, pil_image.format)
+            return pil_image, image_pyramid
+
+        self.start_load(
+            "image",
+            f"Loading {os.path.basename(filename)}",
+            _decode,
+            lambda result: self.show_image(filename, *result),
+        )
+
+    def show_image(self, filename, pil_image, image_pyramid):
+        # Display the image decoded by set_image
+        self.pil_image = pil_image
+        self.image_pyramid = image_pyramid
+        # The bottom left coordinate system depends of the height of the image
+        self.view.set_coordinate_system(
+            self.coordinate_system.get(), self.pil_image.height
+        )
         # Set the affine transformation matrix to display the entire image
         self.zoom_fit(self.pil_image.width, self.pil_image.height)
         # Display the image
@@ -127,6 +280,30 @@ class GUI(tk.Frame):
         # Setting the current directory
         # os.chdir(os.path.dirname(filename))"""
 
+        # Replace the draft by the full resolution image once it's decoded
+        if image_pyramid.is_draft:
+
+            def _decode_full_resolution(progress, cancelled):
+                pil_image.load()
+                if cancelled():
+                    raise LoadCancelled()
+                image_pyramid = ImagePyramid(pil_image)
+                self.image_cache.store(filename, image_pyramid.levels, pil_image.format)
+                return image_pyramid
+
+            self.start_load(
+                "image",
+                f"Decoding {os.path.basename(filename)} at full resolution",
+                _decode_full_resolution,
+                self.swap_image_pyramid,
+            )
+
+    def swap_image_pyramid(self, image_pyramid):
+        # Display the full resolution pyramid if its image is still the displayed one
+        if image_pyramid.source is self.pil_image:
+            self.image_pyramid = image_pyramid
+            self.redraw_image()
+
     # -------------------------------------------------------------------------------
     # Save & load file / Config wrapper
     # -------------------------------------------------------------------------------
@@ -151,10 +328,17 @@ class GUI(tk.Frame):
             messagebox.showwarning("No data", "There are no actions to save.")
             return
 
+        filetypes = [("JSON files", "*.json")]
+        if data_type == "trajectory":
+            filetypes.append(("CSV files", "*.csv"))
+            filetypes.append(
+                ("Binary files", f"*{trajectory_manager.BINARY_EXTENSION}")
+            )
+
         file_path = filedialog.asksaveasfilename(
-            title=f"Save {type} file",
+            title=f"Save {data_type} file",
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json")],
+            filetypes=filetypes,
         )
 
         if file_path:
@@ -162,7 +346,9 @@ class GUI(tk.Frame):
             try:
                 if file_extension == ".json":
                     if data_type == "trajectory":
-                        json_trajectory = trajectory_manager.coordinates_to_json(
+                        # Streamed from the columns, without building the list of dicts
+                        trajectory_manager.write_json_trajectory(
+                            file_path,
                             self.image_points,
                             self.actions,
                             self.angle.get(),
@@ -170,26 +356,47 @@ class GUI(tk.Frame):
                             self.direction.get(),
                             self.action.get(),
                             self.wea.get(),
+                            compact=self.compact_json.get(),
                         )
-                        self.save_json_file(file_path, json_trajectory)
                         self.save_config("last_opened_trajectory", file_path)
 
                     elif data_type == "actions":
                         json_actions = trajectory_manager.format_actions_to_json(
                             self.actions
                         )
-                        self.save_json_file(file_path, json_actions)
+                        self.save_json_file(
+                            file_path, json_actions, self.compact_json.get()
+                        )
                         self.save_config("last_opened_actions", file_path)
 
-                # elif file_extension == ".csv":
-                #     trajectory_manager.coordinates_to_csv(
-                #         self.image_points,
-                #         file_path,
-                #         self.angle.get(),
-                #         self.orientation.get(),
-                #         self.direction.get(),
-                #         self.action.get(),
-                #     )
+                elif file_extension == ".csv" and data_type == "trajectory":
+                    trajectory_manager.coordinates_to_csv(
+                        self.image_points,
+                        file_path,
+                        self.angle.get(),
+                        self.orientation.get(),
+                        self.direction.get(),
+                        self.action.get(),
+                        self.wea.get(),
+                    )
+                    self.save_config("last_opened_trajectory", file_path)
+
+                elif (
+                    file_extension == trajectory_manager.BINARY_EXTENSION
+                    and data_type == "trajectory"
+                ):
+                    trajectory_manager.coordinates_to_binary(
+                        self.image_points,
+                        self.actions,
+                        file_path,
+                        self.angle.get(),
+                        self.orientation.get(),
+                        self.direction.get(),
+                        self.action.get(),
+                        self.wea.get(),
+                    )
+                    self.save_config("last_opened_trajectory", file_path)
+
                 else:
                     messagebox.showerror("Unsupported File", "File type not supported.")
             except Exception as e:
@@ -200,6 +407,9 @@ class GUI(tk.Frame):
     ):
         """Load the trajectory or the actions file chosen by the user depending of the content_type
 
+        The file is read and parsed inside a worker thread (see background_loader.py), the result
+        is applied on the main thread by apply_loaded_file once it's ready.
+
         Args:
             self (GUI): the GUI object that is manipulated
             event (tkinter.Event): set to None here because not used
@@ -207,7 +417,12 @@ class GUI(tk.Frame):
             content_type (str): a str that represents the type of content to know how to handle the content
         """
 
-        if not self.pil_image and content_type == "trajectory":
+        # The image can still be loading, the trajectory will be applied after it
+        if (
+            not self.pil_image
+            and not self.is_loading("image")
+            and content_type == "trajectory"
+        ):
             messagebox.showinfo(
                 "No image",
                 "You don't have any image set so the trajectory won't be rendered, you need to pick an image first",
@@ -215,102 +430,171 @@ class GUI(tk.Frame):
             return
 
         if file_path is None:
-            file_path = filedialog.askopenfilename(
-                filetypes=[
-                    # ("JSON & CSV", ".json .csv"),
+            if content_type == "trajectory":
+                filetypes = [
+                    (
+                        "JSON, CSV & binary",
+                        f".json .csv {trajectory_manager.BINARY_EXTENSION}",
+                    ),
                     ("JSON", ".json"),
-                    # ("CSV", ".csv"),
-                ],
+                    ("CSV", ".csv"),
+                    ("Binary", trajectory_manager.BINARY_EXTENSION),
+                ]
+            else:
+                filetypes = [("JSON", ".json")]
+
+            file_path = filedialog.askopenfilename(
+                filetypes=filetypes,
                 initialdir=os.getcwd(),  # Current directory
             )
 
         if file_path:
             file_extension = os.path.splitext(file_path)[-1].lower()
 
-            try:
-                if file_extension == ".json":
-                    json_data = self.load_json_file(file_path)
-
-                    # Actions type file
-                    if content_type == "actions":
-                        response = "yes"
-                        if len(self.actions) != 0:
-                            response = messagebox.askquestion(
-                                "Actions",
-                                "You have already some actions that are defined, would you like to overwrite them ?",
-                            )
-
-                        if response == "yes":
-                            self.actions = trajectory_manager.format_json_to_actions(
-                                json_data
-                            )
-                            self.save_config("last_opened_actions", file_path)
-
-                    # Trajectory type file (could also have the actions inside the same file)
-                    elif content_type == "trajectory":
-                        # Actions & trajectory in the same file
-                        if isinstance(json_data[1], list):
-                            response = "yes"
-
-                            if len(self.actions) != 0 or len(self.image_points) != 0:
-                                response = messagebox.askquestion(
-                                    "Trajectory & actions",
-                                    "You have already some actions or trajectory that are defined, would you like to overwrite them ?",
-                                )
-
-                            if response == "yes":
-                                self.actions = (
-                                    trajectory_manager.format_json_to_actions(
-                                        json_data[0]
-                                    )
-                                )
-
-                                self.image_points = self.reload_config(
-                                    trajectory_manager.format_json_to_trajectory(
-                                        json_data[1]
-                                    )
-                                )
-
-                                self.save_config("last_opened_trajectory", file_path)
-
-                        # Only the trajectory inside the file
-                        elif isinstance(json_data[0], dict):
-                            response = "yes"
-
-                            if len(self.image_points) != 0:
-                                response = messagebox.askquestion(
-                                    "Trajectory",
-                                    "You have already some trajectory that is defined, would you like to overwrite it ?",
-                                )
-
-                            if response == "yes":
-                                self.image_points = self.reload_config(
-                                    trajectory_manager.format_json_to_trajectory(
-                                        json_data
-                                    )
-                                )
-                                self.save_config("last_opened_trajectory", file_path)
-
-                        else:
-                            messagebox.showerror(
-                                "Importing error",
-                                "An error has occured during the importation of the file",
-                            )
-                            return
-
-                    self.redraw_image()
-                    if self.trajectory_panel is not None:
-                        self.update_trajectory_panel_content()
-
-                # elif file_extension == ".csv":
-                #     self.image_points = trajectory_manager.csv_to_coordinates(file_path)
-                #     self.redraw_image()
+            if file_extension != ".json" and (
+                content_type != "trajectory"
+                or file_extension not in (".csv", trajectory_manager.BINARY_EXTENSION)
+            ):
+                messagebox.showerror("Unsupported File", "File type not supported.")
+                return
 
-                else:
-                    messagebox.showerror("Unsupported File", "File type not supported.")
+            self.start_load(
+                content_type,
+                f"Loading {os.path.basename(file_path)}",
+                lambda progress, cancelled: self.read_loaded_file(
+                    file_path, file_extension, content_type, progress, cancelled
+                ),
+                lambda content: self.apply_loaded_file(file_path, content_type, content),
+            )
 
-            except Exception as e:
-                messagebox.showerror("Error", f"Error loading file: {e}")
+    def read_loaded_file(
+        self,
+        file_path: str,
+        file_extension: str,
+        content_type: str,
+        progress,
+        cancelled,
+    ) -> tuple:
+        """Read and parse a file for load_file, executed inside the worker thread (no widget here)
+
+        Args:
+            self (GUI): the GUI object that is manipulated
+            file_path (str): the file to load
+            file_extension (str): the lowercase extension of the file
+            content_type (str): "trajectory" or "actions"
+            progress: progress callback of the load
+            cancelled: cancelled callback of the load
+
+        Returns:
+            content (tuple): (actions, trajectory), None for the parts that are not inside the file,
+                             or None if the content of the json file is not valid
+        """
+
+        if file_extension == ".json":
+            json_data = json.loads(read_file(file_path, progress, cancelled))
+            progress(None)  # Converting the points, no progress
+
+            # Actions type file
+            if content_type == "actions":
+                return trajectory_manager.format_json_to_actions(json_data), None
+
+            # Actions & trajectory in the same file
+            if isinstance(json_data[1], list):
+                return (
+                    trajectory_manager.format_json_to_actions(json_data[0]),
+                    trajectory_manager.format_json_to_trajectory(json_data[1]),
+                )
+
+            # Only the trajectory inside the file
+            elif isinstance(json_data[0], dict):
+                return None, trajectory_manager.format_json_to_trajectory(json_data)
+
+            return None
+
+        # Trajectory only (the actions are not saved inside a csv file)
+        elif file_extension == ".csv":
+            trajectory = trajectory_manager.Trajectory()
+
+            for idx, row in enumerate(trajectory_manager.iter_csv_rows(file_path)):
+                if idx % trajectory_manager.CSV_CHUNK_SIZE == 0 and cancelled():
+                    raise LoadCancelled()
+                trajectory.append(row)
+
+            return None, trajectory
+
+        # Trajectory & actions (if they were saved with the trajectory)
+        else:
+            trajectory, actions = trajectory_manager.binary_to_coordinates(file_path)
+            return actions or None, trajectory
+
+    def apply_loaded_file(self, file_path: str, content_type: str, content) -> None:
+        """Ask before overwriting the current data and set the loaded content, on the main thread
+
+        Args:
+            self (GUI): the GUI object that is manipulated
+            file_path (str): the loaded file
+            content_type (str): "trajectory" or "actions"
+            content (tuple | None): the result of read_loaded_file
+        """
+
+        if content is None:
+            messagebox.showerror(
+                "Importing error",
+                "An error has occured during the importation of the file",
+            )
+            return
+
+        actions, trajectory = content
+
+        # Actions type file
+        if content_type == "actions":
+            response = "yes"
+            if len(self.actions) != 0:
+                response = messagebox.askquestion(
+                    "Actions",
+                    "You have already some actions that are defined, would you like to overwrite them ?",
+                )
+
+            if response == "yes":
+                self.actions = actions
+                self.save_config("last_opened_actions", file_path)
+
+        # Actions & trajectory in the same file
+        elif actions is not None:
+            response = "yes"
+
+            if len(self.actions) != 0 or len(self.image_points) != 0:
+                response = messagebox.askquestion(
+                    "Trajectory & actions",
+                    "You have already some actions or trajectory that are defined, would you like to overwrite them ?",
+                )
+
+            if response == "yes":
+                self.actions = actions
+                self.image_points = self.reload_config(trajectory)
+                self.history.clear()  # The steps were done on the previous trajectory
+                self.save_config("last_opened_trajectory", file_path)
+
+        # Only the trajectory inside the file
+        else:
+            response = "yes"
+
+            if len(self.image_points) != 0:
+                response = messagebox.askquestion(
+                    "Trajectory",
+                    "You have already some trajectory that is defined, would you like to overwrite it ?",
+                )
+
+            if response == "yes":
+                self.image_points = self.reload_config(trajectory)
+                self.history.clear()  # The steps were done on the previous trajectory
+                self.save_config("last_opened_trajectory", file_path)
+
+        self.point_grid.rebuild(self.image_points.xy)
+        self.redraw_image()
+        if self.trajectory_panel is not None:
+            self.update_trajectory_panel_content()
+        self.update_simplify_preview()
 
     def reload_config(self, trajectory):
         def _reload_menu(menu, menu_index: int):
@@ -325,57 +609,67 @@ class GUI(tk.Frame):
         # Can't pass inside the condition for wea and action two times, or it will break the menu
         action_flag = False
 
-        for point in trajectory:
-            if point[2] is not None and not self.angle.get():
-                self.save_config("angle", 1)
-                _reload_menu(self.trajectory_menu, 2)
-
-            # TODO: check index for last point, don't have to check
-            elif point[2] is None and self.angle.get():
-                trajectory = trajectory_manager.calculate_angle(trajectory)
-
-            if point[3] is not None and not self.orientation.get():
-                self.save_config("orientation", 1)
-                _reload_menu(self.trajectory_menu, 3)
-
-            if point[4] is not None and not self.direction.get():
-                self.save_config("direction", 1)
-                _reload_menu(self.trajectory_menu, 4)
-
-            # if point[6] and not self.wea.get() and not action_flag:
-            #     action_flag = True
-            #     print("wea")
-            #     self.save_config("action", 1)
-            #     self.save_config("wea", 1)
-            #     _reload_menu(self.action_sub_menu, 0)
-            #     _reload_menu(self.action_sub_menu, 1)
-            #     self.toggle_wea_checkbutton(True)
-            #     self.toggle_export_action_checkbutton(True)
-            #
-            # elif self.actions and not self.action.get() and not action_flag:
-            #     action_flag = True
-            #     print("action")
-            #     self.save_config("action", 1)
-            #     _reload_menu(self.action_sub_menu, 0)
-            #     self.toggle_wea_checkbutton(True)
-            #     self.toggle_export_action_checkbutton(True)
+        if trajectory is None:
+            return trajectory_manager.Trajectory()
+
+        # Checked once per column instead of once per point (csv logs can have 100k+ points)
+        fields = trajectory_manager.used_fields(trajectory)
+
+        if "angle" in fields and not self.angle.get():
+            self.save_config("angle", 1)
+            _reload_menu(self.trajectory_menu, 2)
+
+        # The last point has no segment so its angle doesn't have to be set
+        if self.angle.get() and np.isnan(trajectory.angle[:-1]).any():
+            trajectory = trajectory_manager.calculate_angle(trajectory)
+
+        if "orientation" in fields and not self.orientation.get():
+            self.save_config("orientation", 1)
+            _reload_menu(self.trajectory_menu, 3)
+
+        if "direction" in fields and not self.direction.get():
+            self.save_config("direction", 1)
+            _reload_menu(self.trajectory_menu, 4)
+
+        # if "wea" in fields and not self.wea.get() and not action_flag:
+        #     action_flag = True
+        #     print("wea")
+        #     self.save_config("action", 1)
+        #     self.save_config("wea", 1)
+        #     _reload_menu(self.action_sub_menu, 0)
+        #     _reload_menu(self.action_sub_menu, 1)
+        #     self.toggle_wea_checkbutton(True)
+        #     self.toggle_export_action_checkbutton(True)
+        #
+        # elif self.actions and not self.action.get() and not action_flag:
+        #     action_flag = True
+        #     print("action")
+        #     self.save_config("action", 1)
+        #     _reload_menu(self.action_sub_menu, 0)
+        #     self.toggle_wea_checkbutton(True)
+        #     self.toggle_export_action_checkbutton(True)
 
         return trajectory
 
     def save_config(self, key, value):
-        # Save the config inside .json file based on a key / value system
-
-        json_config = self.load_json_file(self.CONFIG_FILE)
+        # Update the config in memory, the file is written once the changes stop for CONFIG_SAVE_DELAY ms
+        if not self.CONFIG.set(key, value):
+            return
 
-        if json_config is not None:
-            # Update with new key / value pair
-            json_config[key] = value
+        if self.config_after_id is not None:
+            self.after_cancel(self.config_after_id)
+        self.config_after_id = self.after(CONFIG_SAVE_DELAY, self.flush_config)
 
-            self.save_json_file(self.CONFIG_FILE, json_config)
+    def flush_config(self):
+        # Write the pending config changes inside the .json file
+        if self.config_after_id is not None:
+            self.after_cancel(self.config_after_id)
+            self.config_after_id = None
 
-        else:
-            json_config = {key: value}
-            self.save_json_file(self.CONFIG_FILE, json_config)
+        try:
+            self.CONFIG.flush()
+        except OSError as e:
+            messagebox.showerror("Error", f"Error saving the config: {e}")
 
     def assign_config(self) -> None:
         """Set all the differents object vars to the value that are saved in the config
@@ -396,6 +690,14 @@ class GUI(tk.Frame):
         self.wea = tk.IntVar(value=self.CONFIG.get("wea", 0))
         self.export_action = tk.IntVar(value=self.CONFIG.get("export_action", 0))
 
+        self.render_mode = tk.StringVar(value=self.CONFIG.get("render_mode", "standard"))
+        self.smooth = tk.IntVar(value=self.CONFIG.get("smooth", 0))
+
+        self.compact_json = tk.IntVar(value=self.CONFIG.get("compact_json", 0))
+
+        self.performance_hud = tk.IntVar(value=self.CONFIG.get("performance_hud", 0))
+        self.profile_session = tk.IntVar(value=0)  # Not saved, a profiling is only for a session
+
         return None
 
     def load_last_opened_image(self, event=None):
@@ -444,9 +746,16 @@ class GUI(tk.Frame):
         if file_path:
             self.save_config("last_opened_image", file_path)
 
-    def save_json_file(self, file_path, content):
+    def clear_image_cache(self, event=None):
+        # Remove the decoded images stored by the previous launches
+        freed = self.image_cache.clear()
+        messagebox.showinfo(
+            "Image cache", f"Image cache cleared ({freed / (1024 * 1024):.1f} MB freed)."
+        )
+
+    def save_json_file(self, file_path, content, compact: bool = False):
         with open(file_path, mode="w") as file:
-            return json.dump(content, file, indent=4)
+            return file.write(trajectory_manager.json_dumps(content, compact))
 
     def load_json_file(self, file_path) -> None | list:
         if os.path.exists(self.CONFIG_FILE):
@@ -483,6 +792,11 @@ class GUI(tk.Frame):
 
             if response == "yes":
                 self.previous_cs = self.coordinate_system.get()
+                self.view.set_coordinate_system(
+                    self.previous_cs,
+                    self.pil_image.height if self.pil_image else 0,
+                )
+                self.redraw_image()
 
             elif self.previous_cs != self.coordinate_system.get():
                 self.coordinate_system.set(self.previous_cs)
@@ -517,6 +831,16 @@ class GUI(tk.Frame):
             else:
                 self.toggle_export_action_command(False)
 
+        # Render the background again with the new quality
+        elif option_name in ("render_mode", "smooth"):
+            self.redraw_image()
+
+        # Start or stop measuring the rendering stages
+        elif option_name == "performance_hud":
+            self.instrumentation.enabled = bool(option_tk_var.get())
+            self.instrumentation.clear()
+            self.update_hud()
+
         # Basic treatment for all options
         if response == "yes":
             self.save_config(option_name, option_tk_var.get())
@@ -533,32 +857,51 @@ class GUI(tk.Frame):
     def delete_point(self, event=None, selection_mode=False):
         # Middle right mouse button pressed / delete latest point
         if event is None and self.image_points is not None:
-            points_to_pop = [
-                i
-                for i, checkbox_value in enumerate(self.checkbox_del_widgets)
-                if checkbox_value.get() == 1
-            ]
-            points_to_pop.reverse()  # Reverse it to not delete the wrong ones
-            for index in points_to_pop:
-                self.image_points.pop(index)
+            points_to_pop = sorted(
+                self.checked_points, reverse=True
+            )  # Reverse it to not delete the wrong ones
+            self.checked_points.clear()
+            # Undone in one step
+            with self.history.group():
+                for index in points_to_pop:
+                    self.history.push(PointDelete(self.image_points, index))
+                    self.image_points.pop(index)
+                    trajectory_manager.update_angles(self.image_points, index)
+                    self.point_grid.remove(index)
+                    self.trajectory_overlay.remove(index)  # Update the trajectory drawing
 
             self.update_trajectory_panel_content(
                 points_to_pop
             )  # Update the content of the floating panel
-            self.redraw_image()  # Update the new trajectory drawing
+            self.draw_preview()  # The index of the preview changed
 
         else:
             # Delete the selected point
             if self.image_points and self.selected_point_idx is not None:
+                self.history.push(PointDelete(self.image_points, self.selected_point_idx))
                 self.image_points.pop(self.selected_point_idx)
+                trajectory_manager.update_angles(
+                    self.image_points, self.selected_point_idx
+                )
+                self.point_grid.remove(self.selected_point_idx)
+                self.trajectory_overlay.remove(self.selected_point_idx)
                 self.update_trajectory_panel_content(self.selected_point_idx)
                 self.selected_point_idx = None
-                self.redraw_image()  # Update the new trajectory drawing
+                self.draw_preview()
 
             elif self.image_points and selection_mode is False:
+                self.history.push(PointDelete(self.image_points, -1))
                 self.image_points.pop()  # Remove the last point
+                self.point_grid.remove(len(self.image_points))
+                self.trajectory_overlay.remove(len(self.image_points))
                 self.update_trajectory_panel_content(len(self.image_points))
-                self.redraw_image()  # Update the new trajectory drawing
+                self.draw_preview()
+
+        # Level of detail: the removed points are redrawn once, at the next frame
+        if self.trajectory_overlay.lod_dirty:
+            self.schedule_render(overlay=True)
+
+        self.update_simplify_preview()
 
     def select_point(self, event):
         selection_radius = 30
@@ -566,23 +909,19 @@ class GUI(tk.Frame):
         self.selected_point_idx = None
 
         if self.image_points is not None:
-            for idx, point in enumerate(self.image_points):
-                x, y = point[0], point[1]
-                image_point = self.to_image_point(event.x, event.y)
-                if image_point is not None:
-                    x_clicked, y_cliked = image_point[0], image_point[1]
-                else:
-                    return
-
-                distance = math.sqrt((x_clicked - x) ** 2 + (y_cliked - y) ** 2)
+            image_point = self.to_image_point(event.x, event.y)
+            if image_point is None:
+                return
 
-                if distance <= selection_radius:
-                    if self.min_distance is None or distance < self.min_distance:
-                        self.min_distance = distance
-                        self.selected_point_idx = idx
+            # Closest point inside the selection radius, only the cells around the click are checked
+            self.selected_point_idx = self.point_grid.nearest(
+                image_point[0], image_point[1], selection_radius
+            )
 
-            self.redraw_image()
-            self.min_distance = None
+            # Only the color of the previous and new selected points change
+            self.trajectory_overlay.select(self.selected_point_idx)
+            if self.trajectory_overlay.lod_dirty:
+                self.schedule_render(overlay=True)
 
     def create_preview(self, event=None):
         # Control p keys pressed / create a preview point that can be added to the canva on click
@@ -603,11 +942,18 @@ class GUI(tk.Frame):
         self.move_preview(event)
 
     def move_preview(self, event):
-        # Create and (re)draw the transparent preview point
+        # Move the transparent preview point at the next frame
+        if not self.preview_mode or event is None:
+            return
+
+        self.schedule_render(preview_pointer=(event.x, event.y))
+
+    def set_preview_point(self, x, y):
+        # Set the coordinates of the preview point from the canvas coordinates of the mouse
         if not self.preview_mode:
             return
 
-        preview_point_coords = self.to_image_point(event.x, event.y)
+        preview_point_coords = self.to_image_point(x, y)
         if preview_point_coords is not None:
             self.preview_point_coords = [
                 [
@@ -623,16 +969,29 @@ class GUI(tk.Frame):
             self.preview_point_coords = trajectory_manager.coordinates_to_float64(
                 self.preview_point_coords
             )
-            self.redraw_image()
 
     def create_point(self, event):
+        # The last motion may not be rendered yet, the point is created where the click is
+        self.set_preview_point(event.x, event.y)
+        if not self.preview_point_coords:
+            return
+
+        self.history.push(PointInsert(self.image_points, len(self.image_points)))
         self.image_points.append(self.preview_point_coords[0])
-        self.image_points = trajectory_manager.calculate_angle(self.image_points)
+        # Only the angle of the previous point changes
+        trajectory_manager.update_angles(self.image_points, len(self.image_points) - 1)
+        self.point_grid.insert(
+            len(self.image_points) - 1,
+            self.image_points[-1][0],
+            self.image_points[-1][1],
+        )
         self.preview_mode = False
         self.preview_point_coords = None
         self.master.unbind("<Button-1>", self.select_point_bind)
         self.update_trajectory_panel_content()
-        self.redraw_image()
+        self.draw_point(len(self.image_points) - 1, inserted=True)
+        self.draw_preview()
+        self.update_simplify_preview()
         self.canvas.unbind("<Motion>", self.preview_motion_bind)
         self.canvas.unbind("<Button-1>", self.preview_button_bind)
         self.master.unbind("<Escape>", self.preview_escape_bind)
@@ -656,15 +1015,20 @@ class GUI(tk.Frame):
         if self.pil_image is None:
             return
         self.translate(event.x - self.__old_event.x, event.y - self.__old_event.y)
-        self.redraw_image()  # Redraw the image
+        self.start_gesture()
+        self.schedule_render(view=True)  # Redraw the image at the next frame
         self.__old_event = event
 
     def change_coordinates(self, event):
-        # Drag the mouse / change coordinates
+        # Drag the mouse / change coordinates at the next frame
         if self.pil_image is None:
             return
 
-        image_point = self.to_image_point(event.x, event.y)
+        self.schedule_render(info_pointer=(event.x, event.y))
+
+    def update_coordinates_label(self, x, y):
+        # Display the image coordinates of the mouse inside the info bar
+        image_point = self.to_image_point(x, y)
         if image_point is not None:
             self.label_image_pixel["text"] = (
                 f"({image_point[0]:.0f}, {image_point[1]:.0f})"
@@ -710,7 +1074,8 @@ class GUI(tk.Frame):
             else:
                 # Rotate clockwise when scrolled up
                 self.rotate_at(5, event.x, event.y)
-        self.redraw_image()  # Redraw the image
+        self.start_gesture()
+        self.schedule_render(view=True)  # Redraw the image at the next frame
 
     def rotate_image(self, deg: float):
         if self.pil_image is None:
@@ -720,7 +1085,8 @@ class GUI(tk.Frame):
         half_canvas_height = self.canvas.winfo_height() // 2
 
         self.rotate_at(deg, half_canvas_width, half_canvas_height)
-        self.redraw_image()
+        self.start_gesture()
+        self.schedule_render(view=True)
 
     # -------------------------------------------------------------------------------
     # Data floating panel management -> Point data
@@ -729,46 +1095,91 @@ class GUI(tk.Frame):
     def toggle_symmetry(self):
         """Change the symmetry based on the value of the checkbutton from the trajectory menu"""
 
-        if self.image_points is None:
+        self.transform_points("mirror_x")
+
+    def transform_points(self, transform: str) -> None:
+        """Apply a geometric transform to the whole trajectory, the headings follow the points
+
+        Args:
+            self (GUI): the GUI object that is manipulated
+            transform (str): "mirror_x", "mirror_y", "rotate_180", "translate", "rotate" or "scale"
+        """
+
+        if self.image_points is None or self.pil_image is None:
             return
 
-        for idx, point in enumerate(self.image_points):
-            old_x = point[0]
-            new_x = np.float64(self.pil_image.width - old_x)
-            if isinstance(new_x, np.float64):
-                self.image_points = trajectory_manager.update_trajectory(
-                    self.image_points, idx, 0, new_x
-                )
-            else:
+        width, height = self.pil_image.size
+        center = (width / 2, height / 2)  # Rotations and scales keep the middle of the image
+
+        if transform == "mirror_x":
+            matrix = trajectory_manager.mirror_matrix(width, "x")
+
+        elif transform == "mirror_y":
+            matrix = trajectory_manager.mirror_matrix(height, "y")
+
+        elif transform == "rotate_180":
+            matrix = trajectory_manager.rotation_matrix(180, center)
+
+        elif transform == "translate":
+            offset = simpledialog.askstring(
+                "Translate", "Offset in pixels (x, y):", parent=self.master
+            )
+            if not offset:
                 return
+            try:
+                offset_x, offset_y = (float(value) for value in offset.split(","))
+            except ValueError:
+                messagebox.showerror("Error", f"Invalid offset: {offset}")
+                return
+            matrix = trajectory_manager.translation_matrix(offset_x, offset_y)
 
+        elif transform == "rotate":
+            degrees = simpledialog.askfloat(
+                "Rotate", "Angle in degrees (around the middle of the image):", parent=self.master
+            )
+            if degrees is None:
+                return
+            matrix = trajectory_manager.rotation_matrix(degrees, center)
+
+        elif transform == "scale":
+            scale = simpledialog.askfloat(
+                "Scale", "Scale factor (from the middle of the image):", parent=self.master
+            )
+            if not scale:
+                return
+            matrix = trajectory_manager.scale_matrix(scale, center=center)
+
+        else:
+            raise ValueError(f"Unknown transform: {transform}")
+
+        trajectory_manager.transform_trajectory(self.image_points, matrix)
+        self.history.push(Transform(matrix))
+
+        self.point_grid.rebuild(self.image_points.xy)
         self.update_trajectory_panel_content()
         self.redraw_image()
+        self.update_simplify_preview()
 
     # -------------------------------------------------------------------------------
     # Affine transformation for image display
     # -------------------------------------------------------------------------------
 
+    @property
+    def mat_affine(self):
+        # Affine transformation matrix used to display the image
+        return self.view.mat_affine
+
     def reset_transform(self):
         # Restore affine transformation to initialization (scale 1, no movement)
-        self.mat_affine = np.eye(3)  # 3x3 unit matrix
+        self.view.reset()
 
     def translate(self, offset_x, offset_y):
         # Shift keybinding
-        mat = np.eye(3)  # 3x3 unit matrix
-        mat[0, 2] = float(offset_x)
-        mat[1, 2] = float(offset_y)
-
-        self.mat_affine = np.dot(mat, self.mat_affine)
+        self.view.translate(offset_x, offset_y)
 
     def scale(self, scale: float):
         # Scaling
-        self.scalre_value = scale
-        mat = np.eye(3)  # 3x3 unit matrix
-        mat[0, 0] = scale
-        mat[1, 1] = scale
-
-        self.mat_affine = np.dot(mat, self.mat_affine)
+        self.view.scale(scale)
 
     def scale_at(self, scale: float, cx: float, cy: float):
         # Scale around coordinates (cx, cy)
@@ -782,13 +1193,7 @@ class GUI(tk.Frame):
 
     def rotate(self, deg: float):
         # Revolution
-        mat = np.eye(3)  # Identity matrix
-        mat[0, 0] = math.cos(math.pi * deg / 180)
-        mat[1, 0] = math.sin(math.pi * deg / 180)
-        mat[0, 1] = -mat[1, 0]
-        mat[1, 1] = mat[0, 0]
-
-        self.mat_affine = np.dot(mat, self.mat_affine)
+        self.view.rotate(deg)
 
     def rotate_at(self, deg: float, cx: float, cy: float):
         # Rotate around coordinates (cx, cy)
@@ -842,23 +1247,8 @@ class GUI(tk.Frame):
         if self.pil_image is None:
             return []
 
-        self.mat_affine_copy = (
-            self.mat_affine.copy()
-        )  # Use a copy of the mat_affine or the image rendering will have trouble
-
-        # There's two way to change the coordinates system here
-        if self.coordinate_system.get() == "bottom-left":
-            # A clean way using matrix and flipping the Y axis and translating the origin
-            self.mat_affine_copy[1][2] += (
-                self.mat_affine_copy[1][1] * self.pil_image.height
-            )  # Adding to the default origin (top left) the height of the image multiplied by the current scale_value
-            self.mat_affine_copy[1][1] = -self.mat_affine_copy[1][1]  # Flipping axis
-
-            # And a tricky way using a hardwriting of the y value with the result of a subsatraction of the height of the image and the previous y value
-            # This will only do the work for rendering the good y value, but not for the future calculations of the points
-            # image_point[1] = abs(self.pil_image.height - image_point[1])
-
-        image_point = np.dot(np.linalg.inv(self.mat_affine_copy), (x, y, 1.0))
+        # The inverse matrix (with the coordinate system) is cached by the view
+        image_point = np.dot(self.view.inverse, (x, y, 1.0))
 
         if (
             image_point[0] < 0
@@ -874,21 +1264,16 @@ class GUI(tk.Frame):
         if self.pil_image is None:
             return None
 
-        self.mat_affine_copy = (
-            self.mat_affine.copy()
-        )  # Use a copy of the mat_affine or the image rendering will have trouble
+        canvas_coords = np.dot(self.view.forward, (image_x, image_y, 1.0))
 
-        # There's two way to change the coordinates system here
-        if self.coordinate_system.get() == "bottom-left":
-            # A clean way using matrix and flipping the Y axis and translating the origin
-            self.mat_affine_copy[1][2] += (
-                self.mat_affine_copy[1][1] * self.pil_image.height
-            )  # Adding to the default origin (top left) the height of the image multiplied by the current scale_value
-            self.mat_affine_copy[1][1] = -self.mat_affine_copy[1][1]  # Flipping axis
+        return canvas_coords[0], canvas_coords[1]
 
-        canvas_coords = np.dot(self.mat_affine_copy, (image_x, image_y, 1.0))
+    def to_canvas_points(self, image_points):
+        # Batched version of to_canvas_point for an (N, 2) array of image coordinates
+        if self.pil_image is None:
+            return None
 
-        return canvas_coords[0], canvas_coords[1]
+        return self.view.to_canvas(image_points)
 
     # -------------------------------------------------------------------------------
     # Drawing image
@@ -900,105 +1285,133 @@ class GUI(tk.Frame):
 
         self.pil_image = pil_image
 
+        start = time.perf_counter()
+
+        self.draw_background()
+        self.draw_overlay()
+
+        frame_time = (time.perf_counter() - start) * 1000
+        self.frame_times.append(frame_time)
+
+        if self.instrumentation.enabled:
+            self.instrumentation.record("frame", frame_time)
+            self.update_hud()
+
+    def draw_background(self):
+        # (Re)render the image only if the image, the affine matrix, the canvas size or the quality changed
+
         # Canva size
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
 
-        # Find the affine transformation matrix from canvas to image data
-        # (Find the inverse of the affine transformation matrix for display)
-        mat_inv = np.linalg.inv(self.mat_affine)
-
-        # Convert a numpy array to a tuple for affine transformation
-        affine_inv = (
-            mat_inv[0, 0],
-            mat_inv[0, 1],
-            mat_inv[0, 2],
-            mat_inv[1, 0],
-            mat_inv[1, 1],
-            mat_inv[1, 2],
-        )
+        # The pyramid is built by set_image, but the image can also be given directly
+        if self.image_pyramid is None or self.image_pyramid.source is not self.pil_image:
+            self.image_pyramid = ImagePyramid(self.pil_image)
 
-        # Affine transformation of PIL image data
-        dst = self.pil_image.transform(
-            (canvas_width, canvas_height),  # Output size
-            Image.AFFINE,  # Affine transformation
-            affine_inv,  # Affine transformation matrix (output to input transformation matrix)
-            Image.NEAREST,  # Interpolation method, nearest neighbor
+        # Progressive mode: draft quality while the view moves, full quality once it stops
+        draft = self.render_mode.get() == "progressive" and self.gesture_active
+
+        if draft or not self.smooth.get():
+            resample = Image.NEAREST  # Interpolation method, nearest neighbor
+        else:
+            resample = Image.BILINEAR  # Smoother but slower
+
+        background_key = (
+            self.image_pyramid,
+            self.mat_affine.tobytes(),
+            canvas_width,
+            canvas_height,
+            draft,
+            resample,
         )
+        if background_key == self.background_key:
+            return
 
-        im = ImageTk.PhotoImage(image=dst)
+        # Affine transformation of the visible tiles from the closest pyramid level
+        with self.instrumentation.span("transform"):
+            dst = self.image_pyramid.render(
+                (canvas_width, canvas_height),  # Output size
+                self.mat_affine,  # Affine transformation matrix (image to canvas)
+                resample,
+                DRAFT_REDUCTION if draft else 1,
+            )
 
-        # Clear previous drawing
-        self.canvas.delete("all")
+        with self.instrumentation.span("photoimage"):
+            im = ImageTk.PhotoImage(image=dst)
+
+        # Image rendering, the item is created once and only its image is replaced
+        with self.instrumentation.span("canvas_background"):
+            if self.background_item is None:
+                self.background_item = self.canvas.create_image(
+                    0,
+                    0,  # Image display position (upper left coordinate)
+                    anchor="nw",  # Anchor, origin at upper left
+                    image=im,  # Display image data
+                    tags=("background",),
+                )
+                self.canvas.tag_lower(self.background_item)
+            else:
+                self.canvas.itemconfig(self.background_item, image=im)
 
-        # Image rendering
-        self.canvas.create_image(
-            0,
-            0,  # Image display position (upper left coordinate)
-            anchor="nw",  # Anchor, origin at upper left
-            image=im,  # Display image data
-        )
+        self.image = im  # Keep a reference or the image is garbage collected
+        self.background_key = background_key
 
-        self.image = im
+    def draw_overlay(self):
+        # Move the trajectory items to the current canvas coordinates of the points
 
-        # Preview point drawing
-        if self.preview_point_coords:
-            index = len(self.image_points)
-            preview_point_coords = [
-                self.to_canvas_point(x, y)
-                for x, y, _, _, _, _, _ in self.preview_point_coords
-            ]
-            for x, y in preview_point_coords:
-                self.canvas.create_oval(
-                    x - 7,
-                    y - 7,
-                    x + 7,
-                    y + 7,
-                    fill="white",
-                    outline="black",
-                    stipple="gray50",
-                )
-                self.canvas.create_text(
-                    x, y, text=str(index + 1), fill="black", font=("Helvetica", 9)
-                )
+        # Project all the points in one call
+        with self.instrumentation.span("canvas_overlay"):
+            image_points = self.image_points.xy
+            canvas_points = self.to_canvas_points(image_points)
 
-        # Lines and point drawing
-        if len(self.image_points) > 0:
-            # Convert all image points to canvas points
-            canvas_points = [
-                self.to_canvas_point(x, y) for x, y, _, _, _, _, _ in self.image_points
-            ]
-            # Draw lines
-            for i in range(len(canvas_points) - 1):
-                x1, y1 = canvas_points[i]
-                x2, y2 = canvas_points[i + 1]
-                self.canvas.create_line(x1, y1, x2, y2, fill="white", width=2)
-
-            # Draw points
-            for index, (x, y) in enumerate(canvas_points):
-                if index == self.selected_point_idx:
-                    self.canvas.create_oval(
-                        x - 7,
-                        y - 7,
-                        x + 7,
-                        y + 7,
-                        fill="red",
-                        outline="black",
-                        tags=("point",),
-                    )
-                else:
-                    self.canvas.create_oval(
-                        x - 7,
-                        y - 7,
-                        x + 7,
-                        y + 7,
-                        fill="white",
-                        outline="black",
-                        tags=("point",),
-                    )
-                self.canvas.create_text(
-                    x, y, text=str(index + 1), fill="black", font=("Helvetica", 9)
-                )
+            # Only the points inside the canvas and the segments crossing it get canvas items,
+            # the canvas goes back to point coordinates with the inverse view transform
+            visible_rect = self.view.visible_rect(
+                self.canvas.winfo_width(), self.canvas.winfo_height(), POINT_RADIUS
+            )
+            self.trajectory_overlay.sync(
+                canvas_points,
+                self.selected_point_idx,
+                visible_points(image_points, visible_rect),
+                visible_segments(image_points, visible_rect),
+            )
+
+        self.draw_preview()
+        self.draw_simplify_preview()
+
+    def draw_point(self, idx: int, inserted: bool = False):
+        """Only draw the items of one point that was inserted or moved, and its adjacent segments
+
+        Args:
+            self (GUI): the GUI object that is manipulated
+            idx (int): index of the point inside self.image_points
+            inserted (bool): True if the point is new, False if it was only moved
+        """
+
+        if self.pil_image is None:
+            return
+
+        x, y = self.to_canvas_point(self.image_points[idx][0], self.image_points[idx][1])
+
+        if inserted:
+            self.trajectory_overlay.insert(idx, x, y)
+        else:
+            self.trajectory_overlay.move(idx, x, y)
+
+        # Level of detail: every edit of the frame is redrawn in one rebuild
+        if self.trajectory_overlay.lod_dirty:
+            self.schedule_render(overlay=True)
+
+    def draw_preview(self):
+        # Move the transparent preview point, or remove it if there is no preview
+
+        if self.preview_point_coords:
+            x, y = self.to_canvas_point(
+                self.preview_point_coords[0][0], self.preview_point_coords[0][1]
+            )
+            self.trajectory_overlay.show_preview(x, y, len(self.image_points))
+        else:
+            self.trajectory_overlay.hide_preview()
 
     def redraw_image(self):
         # Redraw the image
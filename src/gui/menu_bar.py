@@ -48,6 +48,23 @@ def create_menu_bar(self):
 
     self.file_menu.add_separator()
 
+    # Save the json files without indentation (smaller and faster)
+    self.file_menu.add_checkbutton(
+        label="Compact JSON",
+        variable=self.compact_json,
+        onvalue=1,
+        offvalue=0,
+        command=lambda option_name="compact_json",
+        option_tk_var=self.compact_json: self.wrapper_options(
+            option_name, option_tk_var
+        ),
+    )
+
+    # Remove the decoded images cached on the disk
+    self.file_menu.add_command(label="Clear image cache", command=self.clear_image_cache)
+
+    self.file_menu.add_separator()
+
     # Quit app
     self.file_menu.add_command(
         label="Exit", command=self.menu_quit_clicked, accelerator="Ctrl + Q"
@@ -92,6 +109,73 @@ def create_menu_bar(self):
         accelerator="Ctrl + L",
     )
 
+    self.image_menu.add_separator()
+
+    #
+    # Rendering sub-menu
+    #
+    self.rendering_sub_menu = tk.Menu(
+        self.image_menu,
+    )
+    self.image_menu.add_cascade(label="Rendering", menu=self.rendering_sub_menu)
+
+    # Always render at full quality
+    self.rendering_sub_menu.add_radiobutton(
+        label="Standard",
+        variable=self.render_mode,
+        value="standard",
+        command=lambda option_name="render_mode",
+        option_tk_var=self.render_mode: self.wrapper_options(
+            option_name, option_tk_var
+        ),
+    )
+
+    # Draft quality while moving the image, full quality once it stops
+    self.rendering_sub_menu.add_radiobutton(
+        label="Progressive",
+        variable=self.render_mode,
+        value="progressive",
+        command=lambda option_name="render_mode",
+        option_tk_var=self.render_mode: self.wrapper_options(
+            option_name, option_tk_var
+        ),
+    )
+
+    self.rendering_sub_menu.add_separator()
+
+    # Bilinear interpolation for the full quality render
+    self.rendering_sub_menu.add_checkbutton(
+        label="Smooth (bilinear)",
+        variable=self.smooth,
+        onvalue=1,
+        offvalue=0,
+        command=lambda option_name="smooth",
+        option_tk_var=self.smooth: self.wrapper_options(option_name, option_tk_var),
+    )
+
+    self.rendering_sub_menu.add_separator()
+
+    # Frame time & duration of the rendering stages over the canvas
+    self.rendering_sub_menu.add_checkbutton(
+        label="Performance HUD",
+        variable=self.performance_hud,
+        onvalue=1,
+        offvalue=0,
+        command=lambda option_name="performance_hud",
+        option_tk_var=self.performance_hud: self.wrapper_options(
+            option_name, option_tk_var
+        ),
+    )
+
+    # cProfile of the session, saved to a .prof file when it's stopped
+    self.rendering_sub_menu.add_checkbutton(
+        label="Profile session",
+        variable=self.profile_session,
+        onvalue=1,
+        offvalue=0,
+        command=self.toggle_profiling,
+    )
+
     #
     # Trajectory menu
     #
@@ -130,11 +214,29 @@ def create_menu_bar(self):
     )
 
     #
-    # Symmetry checkbutton
+    # Symmetry & transforms sub-menu (the whole trajectory is transformed, headings included)
     #
-    self.trajectory_menu.add_command(
+    self.transform_sub_menu = tk.Menu(
+        self.trajectory_menu,
+    )
+    self.trajectory_menu.add_cascade(
+        label="Symmetry & transforms", menu=self.transform_sub_menu
+    )
+
+    self.transform_sub_menu.add_command(
         label="Change symmetry", command=self.toggle_symmetry
     )
+    for label, transform in (
+        ("Mirror vertically", "mirror_y"),
+        ("Rotate 180°", "rotate_180"),
+        ("Translate...", "translate"),
+        ("Rotate...", "rotate"),
+        ("Scale...", "scale"),
+    ):
+        self.transform_sub_menu.add_command(
+            label=label,
+            command=lambda transform=transform: self.transform_points(transform),
+        )
 
     #
     # Angle checkbutton
@@ -251,6 +353,21 @@ def create_menu_bar(self):
         accelerator="Middle click",
     )
 
+    # Remove the near-collinear points, with a preview on the canvas
+    self.trajectory_menu.add_command(
+        label="Simplify...",
+        command=self.toggle_simplify_panel,
+    )
+
+    # Undo & redo the edits of the trajectory
+    self.trajectory_menu.add_separator()
+    self.trajectory_menu.add_command(
+        label="Undo", command=self.undo, accelerator="Control + Z"
+    )
+    self.trajectory_menu.add_command(
+        label="Redo", command=self.redo, accelerator="Control + Y"
+    )
+
     # TODO: Option & help menu
     """self.options_menu = tk.Menu(
         self.menu_bar,
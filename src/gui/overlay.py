@@ -0,0 +1,540 @@
+import tkinter as tk
+
+import numpy as np
+
+from . import culling
+
+POINT_RADIUS = 7  # Radius of the point ovals in canvas pixels
+POINT_COLOR = "white"
+SELECTED_POINT_COLOR = "red"
+SEGMENT_COLOR = "white"
+LABEL_FONT = ("Helvetica", 9)
+
+# Level of detail: used when the points are closer on the canvas than LOD_SPACING pixels
+LOD_MIN_POINTS = 500  # Shorter trajectories are always drawn in full detail
+LOD_SPACING = 2 * POINT_RADIUS  # Median canvas distance between two points to enter the lod
+LOD_HYSTERESIS = 1.25  # Full detail only comes back above LOD_SPACING * LOD_HYSTERESIS
+MARKER_CELL = 2 * POINT_RADIUS  # One marker per cell of this size (canvas pixels)
+LABEL_CELL = 40  # One label per cell of this size, the others would overlap
+
+
+class TrajectoryOverlay:
+    """Persistent canvas items drawn over the background image for the trajectory
+
+    Each visible point index owns one oval, one text label and the segment going to the next
+    point. Items are kept between two redraws: they are moved with canvas.coords and recoloured
+    with canvas.itemconfig instead of being deleted and recreated.
+    Only the points inside the canvas and the segments crossing it have items (culling.py),
+    so a redraw costs what is on screen, not the length of the trajectory.
+    When the view doesn't change, insert, remove and move only touch the items of the changed
+    point index and its two adjacent segments (plus the visible labels of the following points).
+    Every item is also tagged by its kind ("point", "label", "segment", "preview") to keep
+    the stacking order: segments < points < labels < preview.
+
+    Level of detail: when a long trajectory is zoomed out (median distance between two points
+    under LOD_SPACING canvas pixels) the per-point items are replaced by polylines for the
+    segments crossing the canvas (split at the points without coordinates), one marker per
+    MARKER_CELL cell inside the canvas and one label per LABEL_CELL cell. The full detail items come back once the view is zoomed in. Rebuilding them costs the
+    length of the trajectory, so insert, remove, move and select only mark them dirty and the
+    render loop calls flush once per frame (a drag or a grouped deletion is one rebuild).
+    """
+
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+
+        # Canvas coordinates of every point, (N, 2) array
+        self.coords = np.empty((0, 2))
+
+        # Canvas item ids of the visible points and segments, point index -> item id
+        self.points = {}
+        self.labels = {}
+        self.segments = {}  # segments[i] goes from point i to point i + 1
+
+        self.selected_idx = None
+
+        # Canvas item ids of the preview point (oval, label)
+        self.preview = None
+
+        # Level of detail items: the polylines and the markers / labels reused between two syncs
+        self.lod = False
+        self.lod_lines = []
+        self.lod_points = []
+        self.lod_labels = []
+        self.lod_indices = []  # Point index of every marker
+        self.lod_dirty = False  # The coordinates or the selection changed since the last rebuild
+
+    def sync(
+        self,
+        canvas_points: np.ndarray,
+        selected_idx: int | None = None,
+        point_mask: np.ndarray | None = None,
+        segment_mask: np.ndarray | None = None,
+    ) -> None:
+        """Move the items of the visible points to canvas_points, create the missing ones and delete the others
+
+        Args:
+            canvas_points (np.ndarray): (N, 2) canvas coordinates of every point of the trajectory
+            selected_idx (int | None): index of the selected point, drawn in another color
+            point_mask (np.ndarray | None): (N,) mask of the visible points, computed from the
+                canvas size if None
+            segment_mask (np.ndarray | None): (N - 1,) mask of the visible segments, computed
+                from the canvas size if None
+        """
+
+        self.coords = np.asarray(canvas_points, dtype=np.float64).reshape(-1, 2)
+
+        if self._use_lod():
+            self._clear_detail()
+            self.lod = True
+            self.selected_idx = selected_idx
+            self._draw_lod()
+            return
+
+        if self.lod:
+            self._clear_lod()
+            self.lod = False
+            self.lod_dirty = False
+
+        rect = self._canvas_rect()
+        if point_mask is None:
+            point_mask = culling.visible_points(self.coords, rect)
+        if segment_mask is None:
+            segment_mask = culling.visible_segments(self.coords, rect)
+
+        point_indices = np.flatnonzero(point_mask).tolist()
+        segment_indices = np.flatnonzero(segment_mask).tolist()
+
+        # The previous selected item could be reused for another point
+        if self.selected_idx in self.points:
+            self.canvas.itemconfig(self.points[self.selected_idx], fill=POINT_COLOR)
+        self.selected_idx = None
+
+        # Delete the items that left the canvas (or whose point doesn't exist anymore)
+        self._retain(self.points, point_indices)
+        self._retain(self.labels, point_indices)
+        self._retain(self.segments, segment_indices)
+
+        for idx in segment_indices:
+            self._draw_segment(idx)
+        for idx in point_indices:
+            self._draw_point(idx)
+
+        self.select(selected_idx)
+
+        self._restack()
+
+    def insert(self, idx: int, x: float, y: float) -> None:
+        """Create the items of a point inserted at idx and link it to its neighbours
+
+        Args:
+            idx (int): index of the new point
+            x (float): x canvas coordinate of the new point
+            y (float): y canvas coordinate of the new point
+        """
+
+        self.coords = np.insert(self.coords, idx, (x, y), axis=0)
+
+        if self.selected_idx is not None and self.selected_idx >= idx:
+            self.selected_idx += 1
+
+        if self.lod:
+            self.lod_dirty = True
+            return
+
+        # The items of the following points move one index up, the segment previous -> next
+        # keeps its index and now goes to the new point
+        self.points = _shift(self.points, idx, 1)
+        self.labels = _shift(self.labels, idx, 1)
+        self.segments = _shift(self.segments, idx, 1)
+
+        rect = self._canvas_rect()
+        self._update_point(idx, rect)
+        self._update_segment(idx - 1, rect)
+        self._update_segment(idx, rect)
+
+        self._relabel(idx + 1)
+        self._restack()
+
+    def remove(self, idx: int) -> None:
+        """Delete the items of the point at idx and link its neighbours together
+
+        Args:
+            idx (int): index of the removed point
+        """
+
+        self.coords = np.delete(self.coords, idx, axis=0)
+
+        if self.selected_idx == idx:
+            self.selected_idx = None
+        elif self.selected_idx is not None and self.selected_idx > idx:
+            self.selected_idx -= 1
+
+        if self.lod:
+            self.lod_dirty = True
+            return
+
+        # Items of the removed point and of the segment to the next one
+        for items in (self.points, self.labels, self.segments):
+            if idx in items:
+                self.canvas.delete(items.pop(idx))
+
+        self.points = _shift(self.points, idx + 1, -1)
+        self.labels = _shift(self.labels, idx + 1, -1)
+        self.segments = _shift(self.segments, idx + 1, -1)
+
+        # The segment from the previous point now goes to the next one (or is deleted for the last point)
+        self._update_segment(idx - 1, self._canvas_rect())
+
+        self._relabel(idx)
+
+        # The segment can be new (the previous one was outside the canvas), it goes under the points
+        self._restack()
+
+    def move(self, idx: int, x: float, y: float) -> None:
+        """Move the items of the point at idx and its two adjacent segments
+
+        Args:
+            idx (int): index of the moved point
+            x (float): new x canvas coordinate of the point
+            y (float): new y canvas coordinate of the point
+        """
+
+        self.coords[idx] = (x, y)
+
+        if self.lod:
+            self.lod_dirty = True
+            return
+
+        rect = self._canvas_rect()
+        self._update_point(idx, rect)
+        self._update_segment(idx - 1, rect)
+        self._update_segment(idx, rect)
+
+        self._restack()
+
+    def select(self, idx: int | None) -> None:
+        """Recolour the previous selected point and the new one
+
+        Args:
+            idx (int | None): index of the new selected point, None to unselect
+        """
+
+        if idx is not None and idx >= len(self.coords):
+            idx = None
+
+        if self.lod:
+            # The selected point always has a marker, even if its cell already had one
+            if idx != self.selected_idx:
+                self.selected_idx = idx
+                self.lod_dirty = True
+            return
+
+        if self.selected_idx in self.points:
+            self.canvas.itemconfig(self.points[self.selected_idx], fill=POINT_COLOR)
+
+        # A selected point outside the canvas gets its color once it's drawn
+        if idx in self.points:
+            self.canvas.itemconfig(self.points[idx], fill=SELECTED_POINT_COLOR)
+        self.selected_idx = idx
+
+    def flush(self) -> None:
+        """Rebuild the level of detail items if an edit or a selection changed them"""
+
+        if self.lod and self.lod_dirty:
+            self._draw_lod()
+
+    def show_preview(self, x: float, y: float, index: int) -> None:
+        """Create or move the transparent preview point
+
+        Args:
+            x (float): x canvas coordinate of the preview
+            y (float): y canvas coordinate of the preview
+            index (int): index that the point will have once created
+        """
+
+        if self.preview is None:
+            self.preview = (
+                self.canvas.create_oval(
+                    x - POINT_RADIUS,
+                    y - POINT_RADIUS,
+                    x + POINT_RADIUS,
+                    y + POINT_RADIUS,
+                    fill=POINT_COLOR,
+                    outline="black",
+                    stipple="gray50",
+                    tags=("preview",),
+                ),
+                self.canvas.create_text(
+                    x,
+                    y,
+                    text=str(index + 1),
+                    fill="black",
+                    font=LABEL_FONT,
+                    tags=("preview",),
+                ),
+            )
+
+        else:
+            oval, label = self.preview
+            self.canvas.coords(
+                oval,
+                x - POINT_RADIUS,
+                y - POINT_RADIUS,
+                x + POINT_RADIUS,
+                y + POINT_RADIUS,
+            )
+            self.canvas.coords(label, x, y)
+            self.canvas.itemconfig(label, text=str(index + 1))
+
+    def hide_preview(self) -> None:
+        """Delete the preview point items if they exist"""
+
+        if self.preview is not None:
+            for item in self.preview:
+                self.canvas.delete(item)
+            self.preview = None
+
+    def _draw_point(self, idx: int) -> None:
+        """Create or move the oval and the label of the point idx
+
+        Args:
+            idx (int): index of the point
+        """
+
+        x, y = self.coords[idx].tolist()
+
+        if idx in self.points:
+            self.canvas.coords(
+                self.points[idx],
+                x - POINT_RADIUS,
+                y - POINT_RADIUS,
+                x + POINT_RADIUS,
+                y + POINT_RADIUS,
+            )
+            self.canvas.coords(self.labels[idx], x, y)
+            return
+
+        self.points[idx] = self.canvas.create_oval(
+            x - POINT_RADIUS,
+            y - POINT_RADIUS,
+            x + POINT_RADIUS,
+            y + POINT_RADIUS,
+            fill=SELECTED_POINT_COLOR if idx == self.selected_idx else POINT_COLOR,
+            outline="black",
+            tags=("point",),
+        )
+        self.labels[idx] = self.canvas.create_text(
+            x, y, text=str(idx + 1), fill="black", font=LABEL_FONT, tags=("label",)
+        )
+
+    def _draw_segment(self, idx: int) -> None:
+        """Create or move the segment from the point idx to the point idx + 1
+
+        Args:
+            idx (int): index of the first point of the segment
+        """
+
+        x1, y1, x2, y2 = self.coords[idx : idx + 2].ravel().tolist()
+
+        if idx in self.segments:
+            self.canvas.coords(self.segments[idx], x1, y1, x2, y2)
+        else:
+            self.segments[idx] = self.canvas.create_line(
+                x1, y1, x2, y2, fill=SEGMENT_COLOR, width=2, tags=("segment",)
+            )
+
+    def _update_point(self, idx: int, rect: tuple) -> None:
+        # Draw the point idx if it's inside rect, delete its items otherwise
+        if culling.visible_points(self.coords[idx : idx + 1], rect)[0]:
+            self._draw_point(idx)
+        elif idx in self.points:
+            self.canvas.delete(self.points.pop(idx))
+            self.canvas.delete(self.labels.pop(idx))
+
+    def _update_segment(self, idx: int, rect: tuple) -> None:
+        # Draw the segment idx if it exists and crosses rect, delete its item otherwise
+        if 0 <= idx < len(self.coords) - 1 and culling.visible_segments(
+            self.coords[idx : idx + 2], rect
+        )[0]:
+            self._draw_segment(idx)
+        elif idx in self.segments:
+            self.canvas.delete(self.segments.pop(idx))
+
+    def _retain(self, items: dict, indices: list) -> None:
+        # Delete the items whose index isn't in indices
+        keep = set(indices)
+        for idx in [idx for idx in items if idx not in keep]:
+            self.canvas.delete(items.pop(idx))
+
+    def _canvas_rect(self) -> tuple:
+        # Canvas area where a point is visible, with the radius of its oval around the canvas
+        return (
+            -POINT_RADIUS,
+            -POINT_RADIUS,
+            self.canvas.winfo_width() + POINT_RADIUS,
+            self.canvas.winfo_height() + POINT_RADIUS,
+        )
+
+    def _relabel(self, start: int) -> None:
+        """Update the text of the visible labels from start to the end after an index shift
+
+        Args:
+            start (int): index of the first label to update
+        """
+
+        for index, label in self.labels.items():
+            if index >= start:
+                self.canvas.itemconfig(label, text=str(index + 1))
+
+    def item_count(self) -> int:
+        """Number of canvas items drawn for the trajectory"""
+
+        if self.lod:
+            return len(self.lod_lines) + len(self.lod_points) + len(self.lod_labels)
+        return len(self.points) + len(self.labels) + len(self.segments)
+
+    def _use_lod(self) -> bool:
+        """Check if the points are too close on the canvas to be drawn one by one"""
+
+        if len(self.coords) < LOD_MIN_POINTS:
+            return False
+
+        steps = np.diff(np.asarray(self.coords, dtype=np.float64), axis=0)
+        spacing = np.nanmedian(np.hypot(steps[:, 0], steps[:, 1]))
+
+        # A bit of hysteresis, the mode doesn't flicker while zooming around the limit
+        return spacing < (LOD_SPACING * LOD_HYSTERESIS if self.lod else LOD_SPACING)
+
+    def _draw_lod(self) -> None:
+        """Draw the trajectory with the level of detail items from self.coords"""
+
+        self.lod_dirty = False
+
+        canvas_points = np.asarray(self.coords, dtype=np.float64).reshape(-1, 2).copy()
+        canvas_points[~np.isfinite(canvas_points).all(axis=1)] = np.nan
+
+        # Polylines without the consecutive points inside the same pixel (NaN rows are kept,
+        # NaN != NaN), one per run of segments crossing the canvas: they stop at the points
+        # without coordinates and outside the canvas like the full detail segments
+        rounded = np.rint(canvas_points)
+        moved = np.r_[True, (rounded[1:] != rounded[:-1]).any(axis=1)]
+        line = rounded[moved]
+        segments = culling.visible_segments(line, self._canvas_rect()).astype(np.int8)
+        edges = np.diff(np.r_[0, segments, 0])
+        runs = zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist())
+
+        polylines = [line[start : stop + 1].ravel().tolist() for start, stop in runs]
+        while len(self.lod_lines) > len(polylines):
+            self.canvas.delete(self.lod_lines.pop())
+        for item_idx, coords in enumerate(polylines):
+            if item_idx >= len(self.lod_lines):
+                self.lod_lines.append(
+                    self.canvas.create_line(
+                        *coords, fill=SEGMENT_COLOR, width=2, tags=("segment", "lod")
+                    )
+                )
+            else:
+                self.canvas.coords(self.lod_lines[item_idx], *coords)
+
+        # Markers: only inside the canvas, and the first point of every cell
+        visible = culling.visible_points(canvas_points, self._canvas_rect())
+        visible_indices = np.flatnonzero(visible)
+        markers = _first_per_cell(canvas_points[visible_indices], MARKER_CELL)
+        marker_indices = visible_indices[markers]
+
+        if self.selected_idx is not None and visible[self.selected_idx : self.selected_idx + 1].any():
+            marker_indices = np.union1d(marker_indices, [self.selected_idx])
+
+        # Labels: the first marker of every label cell, the labels of the others would overlap it
+        labelled = marker_indices[_first_per_cell(canvas_points[marker_indices], LABEL_CELL)]
+
+        self.lod_indices = marker_indices.tolist()
+        self._sync_pool(self.lod_points, canvas_points[marker_indices], self._create_lod_point, POINT_RADIUS)
+        self._sync_pool(self.lod_labels, canvas_points[labelled], self._create_lod_label, 0)
+
+        for item, index in zip(self.lod_points, self.lod_indices):
+            color = SELECTED_POINT_COLOR if index == self.selected_idx else POINT_COLOR
+            self.canvas.itemconfig(item, fill=color)
+        for item, index in zip(self.lod_labels, labelled.tolist()):
+            self.canvas.itemconfig(item, text=str(index + 1))
+
+        self._restack()
+
+    def _sync_pool(self, pool: list, canvas_points: np.ndarray, create, radius: float) -> None:
+        # Move the items of the pool to canvas_points, create the missing ones and delete the others
+        # radius is the one of the ovals, 0 for the labels positioned by their center
+        while len(pool) > len(canvas_points):
+            self.canvas.delete(pool.pop())
+
+        for item_idx, (x, y) in enumerate(canvas_points.tolist()):
+            if item_idx >= len(pool):
+                pool.append(create(x, y))
+            elif radius:
+                self.canvas.coords(pool[item_idx], x - radius, y - radius, x + radius, y + radius)
+            else:
+                self.canvas.coords(pool[item_idx], x, y)
+
+    def _create_lod_point(self, x: float, y: float) -> int:
+        return self.canvas.create_oval(
+            x - POINT_RADIUS,
+            y - POINT_RADIUS,
+            x + POINT_RADIUS,
+            y + POINT_RADIUS,
+            fill=POINT_COLOR,
+            outline="black",
+            tags=("point", "lod"),
+        )
+
+    def _create_lod_label(self, x: float, y: float) -> int:
+        return self.canvas.create_text(
+            x, y, fill="black", font=LABEL_FONT, tags=("label", "lod")
+        )
+
+    def _clear_detail(self) -> None:
+        """Delete the full detail items (one oval, label and segment per point)"""
+
+        for items in (self.points, self.labels, self.segments):
+            if items:
+                self.canvas.delete(*items.values())
+                items.clear()
+
+    def _clear_lod(self) -> None:
+        """Delete the level of detail items"""
+
+        self.canvas.delete("lod")
+        self.lod_lines = []
+        self.lod_points = []
+        self.lod_labels = []
+        self.lod_indices = []
+
+    def _restack(self) -> None:
+        """Raise every kind of item above the previous one (the background stays under all)"""
+
+        for tag in ("segment", "point", "label", "preview"):
+            self.canvas.tag_raise(tag)
+
+
+def _first_per_cell(canvas_points: np.ndarray, cell_size: float) -> np.ndarray:
+    """Indices of the first point of every cell of a cell_size grid (sorted)
+
+    Args:
+        canvas_points (np.ndarray): (N, 2) canvas coordinates without NaN
+        cell_size (float): size of a cell in canvas pixels
+
+    Returns:
+        indices (np.ndarray): indices inside canvas_points
+    """
+
+    if len(canvas_points) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    cells = np.floor(canvas_points / cell_size).astype(np.int64)
+    _, first = np.unique(cells, axis=0, return_index=True)
+
+    return np.sort(first)
+
+
+def _shift(items: dict, start: int, offset: int) -> dict:
+    """Move the items of the indices from start by offset (insertion or removal of a point)"""
+
+    return {idx + offset if idx >= start else idx: item for idx, item in items.items()}
@@ -0,0 +1,143 @@
+import math  # Cell & distance calculations
+
+CELL_SIZE = 30  # Size of a cell in image pixels, the same as the selection radius
+
+
+class PointGrid:
+    """Uniform grid over the image coordinates of the trajectory points, used for picking
+
+    Every cell stores the indices of the points inside it, so a nearest point query only
+    looks at the few cells around the clicked position instead of every point.
+    Appending and moving a point are O(1), inserting or removing a point in the middle of
+    the trajectory shifts the following indices (O(n), but only on edition, not on click).
+    """
+
+    def __init__(self, cell_size: float = CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> list of point indices
+        self.coords = []  # (x, y) of every point index, None if the point has no finite coordinates
+
+    def rebuild(self, points) -> None:
+        """Index all the points again
+
+        Args:
+            points: iterable of points, the two first values of a point are its x and y coordinates
+        """
+
+        self.cells = {}
+        self.coords = []
+
+        for idx, point in enumerate(points):
+            self.coords.append(None)
+            self.move(idx, point[0], point[1])
+
+    def insert(self, idx: int, x, y) -> None:
+        """Index a new point inserted at idx
+
+        Args:
+            idx (int): index of the new point
+            x: x image coordinate of the point
+            y: y image coordinate of the point
+        """
+
+        if idx < len(self.coords):
+            self._shift(idx, 1)
+
+        self.coords.insert(idx, None)
+        self.move(idx, x, y)
+
+    def remove(self, idx: int) -> None:
+        """Remove the point at idx from the index
+
+        Args:
+            idx (int): index of the removed point
+        """
+
+        self._discard(idx)
+        self.coords.pop(idx)
+
+        if idx < len(self.coords):
+            self._shift(idx + 1, -1)
+
+    def move(self, idx: int, x, y) -> None:
+        """Update the coordinates of the point at idx
+
+        Args:
+            idx (int): index of the moved point
+            x: new x image coordinate of the point (not indexed if it's not a finite number)
+            y: new y image coordinate of the point (not indexed if it's not a finite number)
+        """
+
+        self._discard(idx)
+
+        try:
+            coords = (float(x), float(y))
+        except (TypeError, ValueError):
+            return  # A coordinate entry can be empty while the user is typing
+
+        if not (math.isfinite(coords[0]) and math.isfinite(coords[1])):
+            return  # An unset coordinate of the trajectory is NaN
+
+        self.coords[idx] = coords
+        self.cells.setdefault(self._cell(*coords), []).append(idx)
+
+    def nearest(self, x: float, y: float, radius: float) -> int | None:
+        """Find the closest point to (x, y) inside the radius
+
+        Args:
+            x (float): x image coordinate of the query
+            y (float): y image coordinate of the query
+            radius (float): maximum distance in image pixels
+
+        Returns:
+            idx (int | None): index of the closest point (the lowest index on ties), None if there is no point
+        """
+
+        min_cell_x, min_cell_y = self._cell(x - radius, y - radius)
+        max_cell_x, max_cell_y = self._cell(x + radius, y + radius)
+
+        nearest_idx = None
+        min_distance = None
+
+        for cell_x in range(min_cell_x, max_cell_x + 1):
+            for cell_y in range(min_cell_y, max_cell_y + 1):
+                for idx in self.cells.get((cell_x, cell_y), ()):
+                    point_x, point_y = self.coords[idx]
+                    distance = math.hypot(x - point_x, y - point_y)
+
+                    if distance <= radius and (
+                        min_distance is None
+                        or distance < min_distance
+                        or (distance == min_distance and idx < nearest_idx)
+                    ):
+                        min_distance = distance
+                        nearest_idx = idx
+
+        return nearest_idx
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        """Get the cell that contains (x, y)"""
+
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def _discard(self, idx: int) -> None:
+        """Remove idx from its cell if it's indexed"""
+
+        coords = self.coords[idx]
+        if coords is None:
+            return
+
+        cell = self._cell(*coords)
+        self.cells[cell].remove(idx)
+        if not self.cells[cell]:
+            del self.cells[cell]
+
+        self.coords[idx] = None
+
+    def _shift(self, start: int, offset: int) -> None:
+        """Add offset to every stored index greater or equal to start"""
+
+        for indices in self.cells.values():
+            for i, idx in enumerate(indices):
+                if idx >= start:
+                    indices[i] = idx + offset
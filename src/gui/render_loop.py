@@ -0,0 +1,134 @@
+import time  # Frame timing
+
+FRAME_INTERVAL = 16  # Minimum time between two renders in ms (~60 frames per second)
+REFINE_DELAY = 150  # Time without gesture (ms) before the full quality render in progressive mode
+DRAFT_REDUCTION = 2  # Resolution divider of the background during a gesture in progressive mode
+
+
+def schedule_render(
+    self,
+    view: bool = False,
+    preview_pointer: tuple[int, int] | None = None,
+    info_pointer: tuple[int, int] | None = None,
+    overlay: bool = False,
+) -> None:
+    """Mark what changed and render it at the next frame, at most one render is done per frame
+
+    Mouse motion events arrive faster than the view can be drawn, so they only save the latest
+    state here and every event received while a render is waiting is coalesced into it.
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+        view (bool): True if the image and the trajectory need to be redrawn (the view moved)
+        preview_pointer (tuple[int, int] | None): last canvas position of the mouse for the preview point
+        info_pointer (tuple[int, int] | None): last position of the mouse for the info bar coordinates
+        overlay (bool): True if the level of detail items of the trajectory need to be rebuilt
+    """
+
+    self.render_view |= view
+    self.render_overlay |= overlay
+    if preview_pointer is not None:
+        self.render_preview_pointer = preview_pointer
+    if info_pointer is not None:
+        self.render_info_pointer = info_pointer
+
+    if self.render_after_id is not None:
+        # A render is already waiting, the event will be applied with it
+        self.coalesced_events += 1
+        return
+
+    elapsed = (time.perf_counter() - self.last_render_time) * 1000
+    delay = int(FRAME_INTERVAL - elapsed)
+
+    if delay > 0:
+        self.render_after_id = self.after(delay, self.render_frame)
+    else:
+        self.render_after_id = self.after_idle(self.render_frame)
+
+
+def render_frame(self) -> None:
+    """Apply the latest pointer state and render what was marked by schedule_render
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+    """
+
+    self.render_after_id = None
+    self.last_render_time = time.perf_counter()
+
+    view, overlay, preview_pointer, info_pointer = (
+        self.render_view,
+        self.render_overlay,
+        self.render_preview_pointer,
+        self.render_info_pointer,
+    )
+    self.render_view = False
+    self.render_overlay = False
+    self.render_preview_pointer = None
+    self.render_info_pointer = None
+
+    if preview_pointer is not None:
+        self.set_preview_point(*preview_pointer)
+
+    if view:
+        self.redraw_image()  # The preview is also drawn
+    else:
+        if overlay:
+            self.trajectory_overlay.flush()
+        if preview_pointer is not None:
+            self.draw_preview()
+
+    if info_pointer is not None:
+        self.update_coordinates_label(*info_pointer)
+
+    update_render_info(self)
+
+
+def start_gesture(self) -> None:
+    """Mark the view as moving (drag, zoom, rotation) and delay the full quality render
+
+    In progressive mode the background is drawn in draft quality while the gesture is active,
+    once no gesture happened for REFINE_DELAY ms it's drawn once again at full quality.
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+    """
+
+    self.gesture_active = True
+
+    if self.refine_after_id is not None:
+        self.after_cancel(self.refine_after_id)
+    self.refine_after_id = self.after(REFINE_DELAY, self.end_gesture)
+
+
+def end_gesture(self) -> None:
+    """Render the view at full quality after a gesture
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+    """
+
+    self.refine_after_id = None
+    self.gesture_active = False
+
+    # Only redraw the background if it was drawn in draft quality
+    if self.render_mode.get() == "progressive":
+        self.redraw_image()
+        update_render_info(self)
+
+
+def update_render_info(self) -> None:
+    """Display the frame times and the coalesced events inside the info bar
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+    """
+
+    if self.frame_times:
+        average = sum(self.frame_times) / len(self.frame_times)
+        self.label_render_info["text"] = (
+            f"Frame: {self.frame_times[-1]:.1f} ms (avg {average:.1f} ms)"
+            f" | Coalesced events: {self.coalesced_events}"
+        )
+    else:
+        self.label_render_info["text"] = f"Coalesced events: {self.coalesced_events}"
@@ -112,6 +112,16 @@ def create_default_shortcuts(self):
         lambda event=None, data_type="trajectory": self.save_file(event, data_type),
     )
 
+    #
+    # Undo the last edit of the trajectory / control + z
+    #
+    self.menu_bar.bind_all("<Control-z>", self.undo)
+
+    #
+    # Redo the last undone edit / control + y
+    #
+    self.menu_bar.bind_all("<Control-y>", self.redo)
+
     #
     # Close the app / control + q
     #
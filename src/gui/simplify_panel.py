@@ -0,0 +1,249 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+import numpy as np
+
+import trajectory_manager
+
+from .history import PointsRemoved
+
+TABLE_WIDTH_MM = 3000  # Width of the table shown by the playmat, to convert millimetres to pixels
+PREVIEW_DELAY = 100  # Time (ms) after the last change of the options before the preview is computed
+PREVIEW_COLOR = "#00bc8c"
+PREVIEW_WIDTH = 2
+MIN_POINTS = 3  # Smallest trajectory that can be simplified
+TOO_FEW_POINTS = f"The trajectory needs at least {MIN_POINTS} points to be simplified."
+
+
+def toggle_simplify_panel(self, event=None) -> None:
+    """Open the simplification window with its live preview, or close it
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+        event (tkinter.Event): set to None here because not used
+    """
+
+    if self.simplify_panel is not None and self.simplify_panel.winfo_exists():
+        _close_simplify_panel(self)
+        return
+
+    if self.pil_image is None or len(self.image_points) < MIN_POINTS:
+        messagebox.showinfo("Simplify", TOO_FEW_POINTS)
+        return
+
+    self.simplify_panel = tk.Toplevel(self.master)
+    self.simplify_panel.title("Simplify trajectory")
+    self.simplify_panel.transient(self.master)
+    self.simplify_panel.resizable(False, False)
+    self.simplify_panel.protocol("WM_DELETE_WINDOW", lambda: _close_simplify_panel(self))
+
+    frame = ttk.Frame(self.simplify_panel, padding=10)
+    frame.pack(fill=tk.BOTH, expand=True)
+
+    self.simplify_method = tk.StringVar(
+        value=self.CONFIG.get("simplify_method", trajectory_manager.SIMPLIFY_METHODS[0])
+    )
+    self.simplify_tolerance = tk.StringVar(value=self.CONFIG.get("simplify_tolerance", 2))
+    self.simplify_unit = tk.StringVar(value=self.CONFIG.get("simplify_unit", "px"))
+
+    # Method
+    ttk.Label(frame, text="Method:").grid(row=0, column=0, sticky="w")
+    for column, (label, method) in enumerate(
+        (("Douglas-Peucker", "douglas-peucker"), ("Visvalingam", "visvalingam")), start=1
+    ):
+        ttk.Radiobutton(
+            frame,
+            text=label,
+            variable=self.simplify_method,
+            value=method,
+            command=lambda: _schedule_preview(self),
+        ).grid(row=0, column=column, sticky="w", padx=5)
+
+    # Tolerance & unit
+    ttk.Label(frame, text="Tolerance:").grid(row=1, column=0, sticky="w", pady=5)
+    ttk.Spinbox(
+        frame,
+        from_=0,
+        to=1000,
+        increment=0.5,
+        width=8,
+        textvariable=self.simplify_tolerance,
+    ).grid(row=1, column=1, sticky="w", padx=5)
+    unit_frame = ttk.Frame(frame)
+    unit_frame.grid(row=1, column=2, sticky="w")
+    for unit in ("px", "mm"):
+        ttk.Radiobutton(
+            unit_frame,
+            text=unit,
+            variable=self.simplify_unit,
+            value=unit,
+            command=lambda: _schedule_preview(self),
+        ).pack(side=tk.LEFT, padx=5)
+    self.simplify_tolerance.trace_add("write", lambda *args: _schedule_preview(self))
+
+    # Number of removed points
+    self.label_simplify_info = ttk.Label(frame, text="")
+    self.label_simplify_info.grid(row=2, column=0, columnspan=3, sticky="w", pady=5)
+
+    # Buttons
+    button_frame = ttk.Frame(frame)
+    button_frame.grid(row=3, column=0, columnspan=3, sticky="e")
+    ttk.Button(button_frame, text="Cancel", command=lambda: _close_simplify_panel(self)).pack(
+        side=tk.RIGHT
+    )
+    ttk.Button(button_frame, text="Apply", command=lambda: _apply_simplify(self)).pack(
+        side=tk.RIGHT, padx=5
+    )
+
+    _update_simplify_preview(self)
+
+
+def draw_simplify_preview(self) -> None:
+    """Draw the simplified trajectory over the canvas while the simplification window is open
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+    """
+
+    if self.simplify_mask is None or len(self.simplify_mask) != len(self.image_points):
+        if self.simplify_preview_item is not None:
+            self.canvas.delete(self.simplify_preview_item)
+            self.simplify_preview_item = None
+        return
+
+    canvas_points = self.to_canvas_points(self.image_points.xy[self.simplify_mask])
+    canvas_points = canvas_points[~np.isnan(canvas_points).any(axis=1)]
+    if len(canvas_points) < 2:
+        if self.simplify_preview_item is not None:
+            self.canvas.delete(self.simplify_preview_item)
+            self.simplify_preview_item = None
+        return
+
+    coords = canvas_points.ravel().tolist()
+    if self.simplify_preview_item is None:
+        self.simplify_preview_item = self.canvas.create_line(
+            *coords,
+            fill=PREVIEW_COLOR,
+            width=PREVIEW_WIDTH,
+            dash=(6, 4),
+            tags=("simplify_preview",),
+        )
+    else:
+        self.canvas.coords(self.simplify_preview_item, *coords)
+    self.canvas.tag_raise(self.simplify_preview_item)
+
+
+def update_simplify_preview(self) -> None:
+    """Compute the preview again after an edit of the trajectory, if the simplification window is open
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+    """
+
+    if self.simplify_panel is not None and self.simplify_panel.winfo_exists():
+        _schedule_preview(self)
+
+
+def _tolerance_pixels(self) -> float | None:
+    # Tolerance of the window in image pixels, None if the entry isn't a positive number
+    try:
+        tolerance = float(self.simplify_tolerance.get())
+    except (tk.TclError, ValueError):
+        return None
+
+    if tolerance < 0:
+        return None
+
+    if self.simplify_unit.get() == "mm":
+        tolerance *= self.pil_image.width / TABLE_WIDTH_MM
+
+    return tolerance
+
+
+def _schedule_preview(self) -> None:
+    # The preview is computed once the options stop changing (typing, spinbox held down)
+    if self.simplify_after_id is not None:
+        self.after_cancel(self.simplify_after_id)
+    self.simplify_after_id = self.after(PREVIEW_DELAY, lambda: _update_simplify_preview(self))
+
+
+def _update_simplify_preview(self) -> None:
+    self.simplify_after_id = None
+
+    if self.simplify_panel is None or not self.simplify_panel.winfo_exists():
+        return
+
+    # Points can still be deleted from the canvas while the window is open
+    if len(self.image_points) < MIN_POINTS:
+        self.label_simplify_info["text"] = TOO_FEW_POINTS
+        self.simplify_mask = None
+        draw_simplify_preview(self)  # Removes the preview line
+        return
+
+    tolerance = _tolerance_pixels(self)
+    if tolerance is None:
+        self.label_simplify_info["text"] = "The tolerance must be a positive number"
+        return
+
+    self.simplify_mask = trajectory_manager.simplify_mask(
+        self.image_points, tolerance, self.simplify_method.get()
+    )
+
+    kept = int(self.simplify_mask.sum())
+    total = len(self.image_points)
+    self.label_simplify_info["text"] = (
+        f"{total} -> {kept} points ({total - kept} removed, {(total - kept) / total:.0%})"
+    )
+
+    draw_simplify_preview(self)
+
+
+def _apply_simplify(self) -> None:
+    if len(self.image_points) < MIN_POINTS:
+        _close_simplify_panel(self)
+        messagebox.showinfo("Simplify", TOO_FEW_POINTS)
+        return
+
+    tolerance = _tolerance_pixels(self)
+    if tolerance is None:
+        return
+
+    # Computed again, the trajectory may have been edited since the last preview
+    mask = trajectory_manager.simplify_mask(
+        self.image_points, tolerance, self.simplify_method.get()
+    )
+    removed = np.flatnonzero(~mask)
+
+    if len(removed):
+        step = PointsRemoved(self.image_points, removed)
+        trajectory_manager.remove_points(self.image_points, removed)
+        self.history.push(step)
+
+    self.save_config("simplify_method", self.simplify_method.get())
+    self.save_config("simplify_tolerance", self.simplify_tolerance.get())
+    self.save_config("simplify_unit", self.simplify_unit.get())
+
+    _close_simplify_panel(self)
+
+    # The indices moved, the selection and the checked points are reset
+    self.selected_point_idx = None
+    self.checked_points.clear()
+    self.trajectory_overlay.select(None)
+    self.point_grid.rebuild(self.image_points.xy)
+    self.update_trajectory_panel_content()
+    self.redraw_image()
+
+    messagebox.showinfo("Simplify", f"{len(removed)} points removed.")
+
+
+def _close_simplify_panel(self) -> None:
+    if self.simplify_after_id is not None:
+        self.after_cancel(self.simplify_after_id)
+        self.simplify_after_id = None
+
+    if self.simplify_panel is not None and self.simplify_panel.winfo_exists():
+        self.simplify_panel.destroy()
+    self.simplify_panel = None
+
+    self.simplify_mask = None
+    draw_simplify_preview(self)  # Removes the preview line
@@ -3,10 +3,11 @@ import tkinter as tk
 from tkinter import image_names, ttk, messagebox
 import numpy as np
 
-from trajectory_manager import update_trajectory
+from trajectory_manager import update_angles
 
 MIN_HEIGHT = 320
 MIN_WIDTH = 300
+ROW_PADDING = 10  # Vertical space above and under the widgets of a point
 
 
 def toggle_trajectory_panel(self, event=None) -> None:
@@ -72,13 +73,14 @@ def toggle_trajectory_panel(self, event=None) -> None:
         )
         scrollbar.pack(side="right", fill="y")
 
-        # Linking the scrollbar to the canvas
-        self.trajectory_form_canvas.configure(yscrollcommand=scrollbar.set)
+        # Linking the scrollbar to the canvas, the visible rows are updated each time the view moves
+        def _yscroll(first, last):
+            scrollbar.set(first, last)
+            _refresh_visible_rows(self)
+
+        self.trajectory_form_canvas.configure(yscrollcommand=_yscroll)
         self.trajectory_form_canvas.bind(
-            "<Configure>",
-            lambda event: self.trajectory_form_canvas.configure(
-                scrollregion=self.trajectory_form_canvas.bbox("all")
-            ),
+            "<Configure>", lambda event: _refresh_visible_rows(self)
         )
 
         # Function and binding to use the mousewheel for scrolling
@@ -97,12 +99,6 @@ def toggle_trajectory_panel(self, event=None) -> None:
         #
         # canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
-        # Content inside the canvas where the content will be displayed
-        self.trajectory_form_frame = ttk.Frame(self.trajectory_form_canvas)
-        self.trajectory_form_canvas.create_window(
-            (0, 0), window=self.trajectory_form_frame, anchor="nw"
-        )
-
         # Frame without scroll for the close button
         button_frame = ttk.Frame(content_frame)
         button_frame.grid(row=1, column=0, pady=10)
@@ -142,335 +138,453 @@ def toggle_trajectory_panel(self, event=None) -> None:
 def update_trajectory_panel_content(
     self, delete_point_idx: list[int] | int | None = None
 ) -> None:
-    """Delete, add & update the point_frames depending of the context
+    """Update the rows of the panel after points were added, deleted or edited
+
+    Only the rows that are visible inside trajectory_form_canvas exist (see _PointRow), so an
+    update costs the same with 10 or 1000 points.
 
     Args:
         self (GUI): the GUI object that is manipulated
-        delete_point_idx (list[int] | int | None): index (list or only one) of the point_frame(s) to delete
+        delete_point_idx (list[int] | int | None): index (list or only one) of the deleted point(s)
     """
 
-    # Delete point cases
+    # Delete point cases, the checked points after a deleted one move up
     if isinstance(delete_point_idx, int):
-        _delete_point_frame(self, delete_point_idx)
+        _shift_checked_points(self, delete_point_idx)
 
     elif isinstance(delete_point_idx, list):
-        for index in delete_point_idx:
-            _delete_point_frame(self, index)
-
-    # Add point case
-    if len(self.trajectory_point_frames) + 1 == len(self.image_points):
-        _add_point_frame(self)
-
-    # Clear the var to not delete non existent index based on the checkbox widgets values (see delete_point in main_panel.py)
-    self.checkbox_del_widgets.clear()
-
-    # Update the point_frames content
-    for i in range(len(self.image_points)):
-        point_frame = self.trajectory_point_frames[i]
-        _clear_frame(point_frame)
-        # point_frame.grid_forget()
-        _update_point_frame(self, i)
-
-    # Without the following the freshly created items aren't displayed inside the scrollregion if there is too much widget
-    self.trajectory_panel.update_idletasks()  # Ensure every widget are displayed before the next command
-    self.trajectory_form_canvas.configure(
-        scrollregion=self.trajectory_form_canvas.bbox(
-            "all"
-        )  # Update the scrollregion to display all widgets
-    )
+        for index in sorted(delete_point_idx, reverse=True):
+            _shift_checked_points(self, index)
+
+    if self.trajectory_panel is None or not self.trajectory_panel.winfo_exists():
+        return
 
+    # The widgets of a row depends of the options, the rows are recreated only if they changed
+    with self.instrumentation.span("panel"):
+        if _row_layout(self) != self.trajectory_row_layout:
+            _create_trajectory_panel_content(self)
+        else:
+            _refresh_visible_rows(self, rebind=True)
 
-def _delete_point_frame(self, delete_point_idx: int) -> None:
-    """Delete a specific point_frame based on the delete_point_idx
+
+def _shift_checked_points(self, delete_point_idx: int) -> None:
+    """Remove a deleted point from the checked points and move up the following ones
 
     Args:
         self (GUI): the GUI object that is manipulated
-        delete_point_idx (int): index of the point_frame to delete
+        delete_point_idx (int): index of the deleted point
     """
 
-    point_frame_to_delete = self.trajectory_point_frames[delete_point_idx]
-    self.trajectory_point_frames.pop(delete_point_idx)
-    point_frame_to_delete.destroy()
+    self.checked_points = {
+        idx if idx < delete_point_idx else idx - 1
+        for idx in self.checked_points
+        if idx != delete_point_idx
+    }
+
+
+def _row_layout(self) -> tuple:
+    """Get the options that change the widgets of a row
+
+    Args:
+        self (GUI): the GUI object that is manipulated
+    """
 
-    for i, frame in enumerate(self.trajectory_point_frames):
-        frame.grid_forget()
-        frame.grid(row=i, column=0, pady=10)
+    return (
+        self.angle.get(),
+        self.orientation.get(),
+        self.direction.get(),
+        self.action.get(),
+        self.wea.get(),
+    )
 
 
-def _add_point_frame(self) -> None:
-    """Create a new point_frame at the end of the others
+def _create_trajectory_panel_content(self) -> None:
+    """Reset precedent rows, measure the height of a row with the current options & display the rows
 
     Args:
         self (GUI): the GUI object that is manipulated
     """
 
-    point_frame = ttk.Frame(self.trajectory_form_frame)
-    point_frame.grid(row=len(self.image_points) - 1, column=0, pady=10)
-    self.trajectory_point_frames.append(point_frame)
+    # Clear precedent content
+    for row in self.trajectory_rows:
+        row.destroy()
+    self.trajectory_rows = []
+    self.trajectory_scrollregion = None
+    self.trajectory_row_height = None  # Nothing is displayed until the row is measured
+    self.trajectory_row_layout = _row_layout(self)
+
+    # Every row has the same widgets, so the first one gives the height of all of them
+    row = _PointRow(self)
+    row.frame.update_idletasks()
+    self.trajectory_row_height = row.frame.winfo_reqheight() + 2 * ROW_PADDING
+    self.trajectory_row_width = row.frame.winfo_reqwidth()
+    self.trajectory_rows.append(row)
 
+    # One mousewheel step scrolls one row
+    self.trajectory_form_canvas.configure(yscrollincrement=self.trajectory_row_height)
 
-def _clear_frame(frame: tk.Frame) -> None:
-    """Remove all widgets from a tk.Frame object
+    _refresh_visible_rows(self, rebind=True)
+
+
+def _refresh_visible_rows(self, rebind: bool = False) -> None:
+    """Bind the recycled rows to the points that are visible inside trajectory_form_canvas
 
     Args:
-        frame: tk.Frame object that need all his widgets to be destroyed
+        self (GUI): the GUI object that is manipulated
+        rebind (bool): reload the content of every visible row, even if it already shows its point
     """
 
-    for widget in frame.winfo_children():
-        widget.destroy()
+    canvas = self.trajectory_form_canvas
+    row_height = self.trajectory_row_height
 
+    if row_height is None:
+        return
+
+    # The scrollregion is as high as all the rows, even if most of them doesn't exist
+    scrollregion = (
+        0,
+        0,
+        self.trajectory_row_width,
+        len(self.image_points) * row_height,
+    )
+    if scrollregion != self.trajectory_scrollregion:
+        self.trajectory_scrollregion = scrollregion
+        canvas.configure(scrollregion=scrollregion)
+
+    first_idx = max(int(canvas.canvasy(0) // row_height), 0)
+    rows_number = canvas.winfo_height() // row_height + 2
+
+    # More rows are needed if the panel is higher
+    while len(self.trajectory_rows) < rows_number:
+        self.trajectory_rows.append(_PointRow(self))
+
+    # A point is always shown by the same row, so scrolling only reloads the rows that appear
+    visible_rows = set()
+    for idx in range(first_idx, min(first_idx + rows_number, len(self.image_points))):
+        row = self.trajectory_rows[idx % len(self.trajectory_rows)]
+        visible_rows.add(row)
+        if rebind or row.idx != idx:
+            row.bind(idx)
+
+    for row in self.trajectory_rows:
+        if row not in visible_rows:
+            row.hide()
 
-def _create_trajectory_panel_content(self) -> None:
-    """Reset precedent content, init layout & add content
+
+def _get_row(self, idx: int):
+    """Get the row that shows the point idx, None if the point is not visible
 
     Args:
         self (GUI): the GUI object that is manipulated
+        idx (int): index of the point
     """
 
-    # Clear precedent content
-    self.checkbox_del_widgets.clear()
-    self.trajectory_point_frames = []
+    if (
+        self.trajectory_panel is None
+        or not self.trajectory_panel.winfo_exists()
+        or not self.trajectory_rows
+        or idx < 0
+    ):
+        return None
 
-    # Init the point_frames layout
-    for i in range(len(self.image_points)):
-        point_frame = ttk.Frame(self.trajectory_form_frame)
-        point_frame.grid(row=i, column=0, pady=10)
-        self.trajectory_point_frames.append(point_frame)
+    row = self.trajectory_rows[idx % len(self.trajectory_rows)]
 
-    # Add content to the point_frames
-    update_trajectory_panel_content(self)
+    return row if row.idx == idx else None
 
 
 def _update_point_frame(self, idx: int) -> None:
-    """(Re)create every widget inside the point_frame and update their content
-    A better way to do it is to update only their content and not to recreate them each time
+    """Reload the content of the row of the point idx if it's visible
 
     Args:
         self (GUI): the GUI object that is manipulated
-        idx (int): index of frame content that is updated
+        idx (int): index of the point
     """
 
-    point_frame = self.trajectory_point_frames[idx]
-    x, y, angle, orientation, direction, wea, action = self.image_points[idx]
-    options_number = 2
-
-    #
-    # Checkbox
-    #
-    check_var = tk.IntVar()
-    checkbox = ttk.Checkbutton(
-        point_frame,
-        variable=check_var,
-    )
-    self.checkbox_del_widgets.insert(idx, check_var)
-    checkbox.grid(row=0, column=0, padx=(10, 0))
-
-    #
-    # Point name
-    #
-    label = ttk.Label(
-        point_frame,
-        text=f"Point n°{idx + 1}:",
-    )
-    label.grid(row=0, column=1)
-
-    #
-    # X label
-    #
-    label = ttk.Label(point_frame, text="x:")
-    label.grid(row=1, column=1, padx=(58, 0))
-
-    #
-    # X entry
-    #
-    x_string = tk.StringVar()
-    x_entry = ttk.Entry(
-        point_frame,
-        width=8,
-        textvariable=x_string,
-    )
-    x_entry.insert(
-        0, format(x, ".0f") if x else ""
-    )  # Set the initial value to the current x rounded
-    x_string.trace_add(
-        "write",
-        lambda *args, new_x=x_string, idx=idx: _coordinate_entry_change(
-            self, new_x=new_x.get(), idx=idx
-        ),
-    )
-    x_entry.grid(row=1, column=2, padx=(0, 75))
-
-    #
-    # Y label
-    #
-    label = ttk.Label(point_frame, text="y:")
-    label.grid(row=2, column=1, padx=(58, 0))
-
-    #
-    # Y entry
-    #
-    y_string = tk.StringVar()
-    y_entry = ttk.Entry(
-        point_frame,
-        width=8,
-        textvariable=y_string,
-    )
-    y_entry.insert(
-        0, format(y, ".0f") if y else ""
-    )  # Set the initial value to the current x rounded
-    y_string.trace_add(
-        "write",
-        lambda *args, new_y=y_string, idx=idx: _coordinate_entry_change(
-            self, new_y=new_y.get(), idx=idx
-        ),
-    )
-    y_entry.grid(row=2, column=2, padx=(0, 75))
+    row = _get_row(self, idx)
+    if row is not None:
+        row.bind(idx)
+
+
+def _update_angle_labels(self, idx: int) -> None:
+    """Reload the angle of the point idx and of the previous point (the two adjacent segments)
 
-    #
-    # Angle
-    #
-    if self.angle.get():
-        options_number += 1
+    Args:
+        self (GUI): the GUI object that is manipulated
+        idx (int): index of the moved point
+    """
+
+    for index in (idx - 1, idx):
+        row = _get_row(self, index)
+        if row is not None:
+            row.update_angle()
+
+
+class _PointRow:
+    """Widgets of one point of the panel, recycled to show any point while scrolling
+
+    The widgets are created once with the options that are enabled, bind() only changes their
+    content. The traces of the tk variables are ignored while the content is loaded.
+    """
+
+    def __init__(self, gui):
+        self.gui = gui
+        self.idx = None  # Index of the shown point, None if the row is hidden
+        self.loading = False  # True while bind() fills the widgets
+
+        canvas = gui.trajectory_form_canvas
+        self.frame = ttk.Frame(canvas)
+        self.window = canvas.create_window(
+            0, 0, window=self.frame, anchor="nw", state="hidden"
+        )
+
+        options_number = 2
 
         #
-        # Angle labels
+        # Checkbox
         #
-        label = ttk.Label(point_frame, text="angle:")
-        label.grid(row=options_number, column=1, padx=(32, 0))
-        angle_output = f"{format(angle, '.0f')}°" if angle is not None else ""
-        label = ttk.Label(point_frame, text=angle_output)
-        label.grid(row=options_number, column=2, padx=(0, 75))
-
-    #
-    # Orientation
-    #
-    if self.orientation.get():
-        options_number += 1
+        self.check_var = tk.IntVar()
+        checkbox = ttk.Checkbutton(
+            self.frame,
+            variable=self.check_var,
+            command=self._check_change,
+        )
+        checkbox.grid(row=0, column=0, padx=(10, 0))
 
         #
-        # Orientation label
+        # Point name
         #
-        label = ttk.Label(point_frame, text="orientation:")
-        label.grid(row=options_number, column=1)
+        self.name_label = ttk.Label(self.frame)
+        self.name_label.grid(row=0, column=1)
 
         #
-        # Orientation entry
+        # X label & entry
         #
-        orientation_string = tk.StringVar()
-        orientation_entry = ttk.Entry(
-            point_frame,
-            width=8,
-            textvariable=orientation_string,
-        )
-        orientation_string.trace_add(
-            "write",
-            lambda *args,
-            new_orientation=orientation_string,
-            idx=idx: _orientation_entry_change(self, new_orientation.get(), idx),
-        )
-        orientation_entry.insert(
-            0, format(orientation, ".0f") if orientation else ""
-        )  # Set the initial orientation, empty if not set
-        orientation_entry.grid(row=options_number, column=2, padx=(0, 75))
-
-    #
-    # Direction
-    #
-    if self.direction.get():
-        options_number += 1
+        label = ttk.Label(self.frame, text="x:")
+        label.grid(row=1, column=1, padx=(58, 0))
+
+        self.x_string = tk.StringVar()
+        x_entry = ttk.Entry(self.frame, width=8, textvariable=self.x_string)
+        self.x_string.trace_add("write", lambda *args: self._entry_change("x"))
+        x_entry.grid(row=1, column=2, padx=(0, 75))
+
         #
-        # Direction label
+        # Y label & entry
         #
-        label = ttk.Label(point_frame, text="direction:")
-        label.grid(row=options_number, column=1, padx=(12, 0))
+        label = ttk.Label(self.frame, text="y:")
+        label.grid(row=2, column=1, padx=(58, 0))
+
+        self.y_string = tk.StringVar()
+        y_entry = ttk.Entry(self.frame, width=8, textvariable=self.y_string)
+        self.y_string.trace_add("write", lambda *args: self._entry_change("y"))
+        y_entry.grid(row=2, column=2, padx=(0, 75))
 
         #
-        # Direction entry
+        # Angle labels
         #
-        direction_string = tk.StringVar()
-        direction_entry = ttk.Entry(
-            point_frame,
-            width=8,
-            textvariable=direction_string,
-        )
-        direction_string.trace_add(
-            "write",
-            lambda *args,
-            new_direction=direction_string,
-            idx=idx: _direction_entry_change(self, new_direction.get(), idx),
-        )
-        direction_entry.insert(
-            0, direction if direction else ""
-        )  # Set the initial direction, empty if not set
-        direction_entry.grid(row=options_number, column=2, padx=(0, 75))
+        self.angle_label = None
+        if gui.angle.get():
+            options_number += 1
 
-    #
-    # Action
-    #
-    if self.action.get():
-        options_number += 1
+            label = ttk.Label(self.frame, text="angle:")
+            label.grid(row=options_number, column=1, padx=(32, 0))
+            self.angle_label = ttk.Label(self.frame)
+            self.angle_label.grid(row=options_number, column=2, padx=(0, 75))
 
         #
-        # Action label
+        # Orientation label & entry
         #
-        label = ttk.Label(point_frame, text="action(s):")
-        label.grid(row=options_number, column=1, padx=(12, 0))
+        self.orientation_string = None
+        if gui.orientation.get():
+            options_number += 1
+
+            label = ttk.Label(self.frame, text="orientation:")
+            label.grid(row=options_number, column=1)
+
+            self.orientation_string = tk.StringVar()
+            orientation_entry = ttk.Entry(
+                self.frame, width=8, textvariable=self.orientation_string
+            )
+            self.orientation_string.trace_add(
+                "write", lambda *args: self._entry_change("orientation")
+            )
+            orientation_entry.grid(row=options_number, column=2, padx=(0, 75))
+
+        #
+        # Direction label & entry
+        #
+        self.direction_string = None
+        if gui.direction.get():
+            options_number += 1
+
+            label = ttk.Label(self.frame, text="direction:")
+            label.grid(row=options_number, column=1, padx=(12, 0))
+
+            self.direction_string = tk.StringVar()
+            direction_entry = ttk.Entry(
+                self.frame, width=8, textvariable=self.direction_string
+            )
+            self.direction_string.trace_add(
+                "write", lambda *args: self._entry_change("direction")
+            )
+            direction_entry.grid(row=options_number, column=2, padx=(0, 75))
 
         #
-        # Action menubutton
+        # Action label & menubutton
         #
-        action_menubutton = ttk.Menubutton(point_frame, text="Choose action(s)")
-        action_menu = tk.Menu(
-            action_menubutton,
+        if gui.action.get():
+            options_number += 1
+
+            label = ttk.Label(self.frame, text="action(s):")
+            label.grid(row=options_number, column=1, padx=(12, 0))
+
+            action_menubutton = ttk.Menubutton(self.frame, text="Choose action(s)")
+            # The menu is only filled when it's opened, not each time the row is recycled
+            self.action_menu = tk.Menu(
+                action_menubutton, postcommand=self._fill_action_menu
+            )
+            action_menubutton.configure(menu=self.action_menu)
+            action_menubutton.grid(row=options_number, column=2)
+
+    def bind(self, idx: int) -> None:
+        """Show the point idx inside the row
+
+        Args:
+            idx (int): index of the point
+        """
+
+        self.idx = idx
+        x, y, angle, orientation, direction, action, wea = self.gui.image_points[idx]
+
+        self.loading = True
+
+        self.check_var.set(1 if idx in self.gui.checked_points else 0)
+        self.name_label.configure(text=f"Point n°{idx + 1}:")
+
+        # Set the current coordinates rounded
+        self.x_string.set(format(x, ".0f") if x is not None else "")
+        self.y_string.set(format(y, ".0f") if y is not None else "")
+
+        if self.orientation_string is not None:
+            self.orientation_string.set(
+                format(orientation, ".0f") if orientation is not None else ""
+            )  # Set the orientation, empty if not set
+
+        if self.direction_string is not None:
+            self.direction_string.set(
+                direction if direction is not None else ""
+            )  # Set the direction, empty if not set
+
+        self.loading = False
+
+        self.update_angle()
+
+        canvas = self.gui.trajectory_form_canvas
+        canvas.coords(self.window, 0, idx * self.gui.trajectory_row_height + ROW_PADDING)
+        canvas.itemconfigure(self.window, state="normal")
+
+    def update_angle(self) -> None:
+        """Reload the angle label of the shown point"""
+
+        if self.angle_label is None or self.idx is None:
+            return
+
+        angle = self.gui.image_points[self.idx][2]
+        self.angle_label.configure(
+            text=f"{format(angle, '.0f')}°" if angle is not None else ""
         )
-        action_menubutton.configure(menu=action_menu)
 
+    def hide(self) -> None:
+        """Hide the row, it can be used later to show another point"""
+
+        if self.idx is not None:
+            self.idx = None
+            self.gui.trajectory_form_canvas.itemconfigure(self.window, state="hidden")
+
+    def destroy(self) -> None:
+        """Delete the widgets of the row (they are already destroyed if the panel was closed)"""
+
+        if self.frame.winfo_exists():
+            self.gui.trajectory_form_canvas.delete(self.window)
+            self.frame.destroy()
+
+    def _entry_change(self, field: str) -> None:
+        """Save the value of an entry that was edited by the user
+
+        Args:
+            field (str): the edited field ("x", "y", "orientation" or "direction")
+        """
+
+        if self.loading or self.idx is None:
+            return
+
+        if field == "x":
+            _coordinate_entry_change(self.gui, new_x=self.x_string.get(), idx=self.idx)
+        elif field == "y":
+            _coordinate_entry_change(self.gui, new_y=self.y_string.get(), idx=self.idx)
+        elif field == "orientation":
+            _orientation_entry_change(self.gui, self.orientation_string.get(), self.idx)
+        elif field == "direction":
+            _direction_entry_change(self.gui, self.direction_string.get(), self.idx)
+
+    def _check_change(self) -> None:
+        """Save the checkbox value of the point (used to delete the checked points)"""
+
+        if self.idx is None:
+            return
+
+        if self.check_var.get():
+            self.gui.checked_points.add(self.idx)
+        else:
+            self.gui.checked_points.discard(self.idx)
+
+    def _fill_action_menu(self) -> None:
+        """(Re)create the checkbuttons of the action menu for the shown point"""
+
+        self.action_menu.delete(0, "end")
+
+        if self.idx is None:
+            return
+
+        idx = self.idx
+        current_actions = self.gui.image_points[idx][5]
         choices = {}
 
-        for action in self.actions:
-            if self.image_points is None:
-                return
+        # Keep a reference to the tk variables while the menu exists
+        self.action_choices = [choices]
 
-            if (
-                self.image_points[idx][5] is not None
-                and action in self.image_points[idx][5]
-            ):
+        for action in self.gui.actions:
+            if current_actions is not None and action in current_actions:
                 choices[action] = tk.IntVar(value=1)
-                label = f"({self.image_points[idx][5].index(action) + 1}): {action}"
+                label = f"({current_actions.index(action) + 1}): {action}"
 
             else:
                 choices[action] = tk.IntVar(value=0)
                 label = action
 
-            action_menu.add_checkbutton(
+            self.action_menu.add_checkbutton(
                 label=label,
                 variable=choices[action],
                 onvalue=1,
                 offvalue=0,
                 command=lambda new_choices=choices, idx=idx: _action_checkbutton_change(
-                    self, new_choices, idx
+                    self.gui, new_choices, idx
                 ),
             )
 
-        if self.wea.get():
-            action_menu.add_separator()
+        if self.gui.wea.get():
+            self.action_menu.add_separator()
 
-            if self.image_points[idx][6] is not None:
-                choice = tk.IntVar(value=1)
+            choice = tk.IntVar(value=1 if self.gui.image_points[idx][6] else 0)
+            self.action_choices.append(choice)
 
-            else:
-                choice = tk.IntVar(value=0)
-
-            action_menu.add_checkbutton(
+            self.action_menu.add_checkbutton(
                 label="Wait end of action",
                 variable=choice,
                 command=lambda new_wea=choice, idx=idx: _wea_checkbutton_change(
-                    self, new_wea, idx
+                    self.gui, new_wea, idx
                 ),
             )
 
-        action_menubutton.grid(row=options_number, column=2)
-
 
 def _coordinate_entry_change(
     self, new_x: str | None = None, new_y: str | None = None, idx: int = -1
@@ -492,9 +606,11 @@ def _coordinate_entry_change(
         return
 
     if new_coordinate[1] == "":
-        self.image_points = update_trajectory(
-            self.image_points, idx, new_coordinate[0], new_coordinate[1]
-        )
+        self.edit_point(idx, new_coordinate[0], new_coordinate[1])
+        update_angles(self.image_points, idx)
+        _update_angle_labels(self, idx)
+        self.point_grid.move(idx, *self.image_points[idx][:2])
+        self.draw_point(idx)  # The overlay culls the point without coordinates
         return
 
     try:
@@ -518,11 +634,13 @@ def _coordinate_entry_change(
     if not isinstance(new_coordinate[1], np.float64):
         return
 
-    self.image_points = update_trajectory(
-        self.image_points, idx, new_coordinate[0], new_coordinate[1]
-    )
+    self.edit_point(idx, new_coordinate[0], new_coordinate[1])
+    update_angles(self.image_points, idx)  # Headings of the two adjacent segments
+    _update_angle_labels(self, idx)
 
-    self.redraw_image()
+    # Only the point and its two segments are moved
+    self.point_grid.move(idx, *self.image_points[idx][:2])
+    self.draw_point(idx)
 
 
 def _orientation_entry_change(self, new_orientation: str, idx: int) -> None:
@@ -535,7 +653,7 @@ def _orientation_entry_change(self, new_orientation: str, idx: int) -> None:
     """
 
     if new_orientation == "" or new_orientation == "-":
-        self.image_points = update_trajectory(self.image_points, idx, 3, None)
+        self.edit_point(idx, 3, None)
         return
 
     try:
@@ -552,7 +670,7 @@ def _orientation_entry_change(self, new_orientation: str, idx: int) -> None:
         _update_point_frame(self, idx)
         return
 
-    self.image_points = update_trajectory(self.image_points, idx, 3, new_orientation)
+    self.edit_point(idx, 3, new_orientation)
     # self.redraw_image()
 
 
@@ -565,7 +683,16 @@ def _direction_entry_change(self, new_direction: str, idx: int) -> None:
         idx (int): index of the updated point
     """
 
-    self.image_points = update_trajectory(self.image_points, idx, 4, new_direction)
+    if new_direction == "" or new_direction == "-":
+        self.edit_point(idx, 4, None)
+        return
+
+    try:
+        self.edit_point(idx, 4, new_direction)
+    except ValueError:
+        messagebox.showerror("Error", "Direction must be an integer between -127 and 127")
+        _update_point_frame(self, idx)
+        return
     # self.redraw_image()
 
 
@@ -593,9 +720,7 @@ def _action_checkbutton_change(
             if name not in current_actions:
                 current_actions.append(name)
                 new_actions = current_actions
-                self.image_points = update_trajectory(
-                    self.image_points, idx, 5, new_actions
-                )
+                self.edit_point(idx, 5, new_actions)
                 _update_point_frame(self, idx)
 
         elif var.get() == 0:
@@ -604,9 +729,7 @@ def _action_checkbutton_change(
                 new_actions = current_actions
                 if len(new_actions) == 0:
                     new_actions = None
-                self.image_points = update_trajectory(
-                    self.image_points, idx, 5, new_actions
-                )
+                self.edit_point(idx, 5, new_actions)
                 _update_point_frame(self, idx)
 
 
@@ -621,12 +744,12 @@ def _wea_checkbutton_change(self, new_wea: tk.IntVar, idx: int) -> None:
 
     # Save None and not 0 because it's easier to read when not set
     if not new_wea.get():
-        self.image_points = update_trajectory(self.image_points, idx, 6, None)
+        self.edit_point(idx, 6, None)
     else:
         if self.image_points[idx][5] is None:
             messagebox.showwarning(
                 "No actions set",
                 "You don't have any actions set for this point. The wait for end of point option is useless",
             )
-        self.image_points = update_trajectory(self.image_points, idx, 6, new_wea.get())
+        self.edit_point(idx, 6, new_wea.get())
     # self.redraw_image()
@@ -0,0 +1,173 @@
+import math  # Revolution calculations
+
+import numpy as np  # Affine transformation matrix operations
+
+
+class ViewTransform:
+    """Affine transformation from image coordinates to canvas coordinates
+
+    mat_affine is the transformation used to display the image (top left origin). The forward
+    and inverse matrices also include the coordinate system (bottom left flips the y axis) and
+    are cached: they are only recomputed after translate, scale, rotate, reset or a change of
+    the coordinate system or of the image height.
+    """
+
+    def __init__(self):
+        self.mat_affine = np.eye(3)  # 3x3 unit matrix
+        self.image_height = 0
+        self.coordinate_system = "top-left"
+
+        self._forward = None
+        self._inverse = None
+
+    def reset(self) -> None:
+        """Restore affine transformation to initialization (scale 1, no movement)"""
+
+        self.mat_affine = np.eye(3)
+        self._invalidate()
+
+    def translate(self, offset_x: float, offset_y: float) -> None:
+        """Shift the view
+
+        Args:
+            offset_x (float): shift on the x axis in canvas pixels
+            offset_y (float): shift on the y axis in canvas pixels
+        """
+
+        mat = np.eye(3)  # 3x3 unit matrix
+        mat[0, 2] = float(offset_x)
+        mat[1, 2] = float(offset_y)
+
+        self.mat_affine = np.dot(mat, self.mat_affine)
+        self._invalidate()
+
+    def scale(self, scale: float) -> None:
+        """Scale the view around the canvas origin
+
+        Args:
+            scale (float): scale factor
+        """
+
+        mat = np.eye(3)  # 3x3 unit matrix
+        mat[0, 0] = scale
+        mat[1, 1] = scale
+
+        self.mat_affine = np.dot(mat, self.mat_affine)
+        self._invalidate()
+
+    def rotate(self, deg: float) -> None:
+        """Rotate the view around the canvas origin
+
+        Args:
+            deg (float): angle of the rotation in degrees
+        """
+
+        mat = np.eye(3)  # Identity matrix
+        mat[0, 0] = math.cos(math.pi * deg / 180)
+        mat[1, 0] = math.sin(math.pi * deg / 180)
+        mat[0, 1] = -mat[1, 0]
+        mat[1, 1] = mat[0, 0]
+
+        self.mat_affine = np.dot(mat, self.mat_affine)
+        self._invalidate()
+
+    def set_coordinate_system(self, coordinate_system: str, image_height: int) -> None:
+        """Set the coordinate system of the points and the height of the image used to flip y
+
+        Args:
+            coordinate_system (str): "top-left" or "bottom-left"
+            image_height (int): height of the displayed image
+        """
+
+        if (
+            coordinate_system != self.coordinate_system
+            or image_height != self.image_height
+        ):
+            self.coordinate_system = coordinate_system
+            self.image_height = image_height
+            self._invalidate()
+
+    @property
+    def forward(self) -> np.ndarray:
+        """Matrix from point coordinates (depending of the coordinate system) to canvas coordinates"""
+
+        if self._forward is None:
+            forward = self.mat_affine.copy()
+
+            if self.coordinate_system == "bottom-left":
+                # Adding to the default origin (top left) the height of the image multiplied by the current scale_value
+                forward[:, 2] += forward[:, 1] * self.image_height
+                forward[:, 1] = -forward[:, 1]  # Flipping axis
+
+            self._forward = forward
+
+        return self._forward
+
+    @property
+    def inverse(self) -> np.ndarray:
+        """Matrix from canvas coordinates to point coordinates (depending of the coordinate system)"""
+
+        if self._inverse is None:
+            self._inverse = np.linalg.inv(self.forward)
+
+        return self._inverse
+
+    def to_canvas(self, points: np.ndarray) -> np.ndarray:
+        """Project an (N, 2) array of point coordinates to canvas coordinates in one call
+
+        Args:
+            points (np.ndarray): (N, 2) array of x, y point coordinates
+
+        Returns:
+            canvas_points (np.ndarray): (N, 2) array of x, y canvas coordinates
+        """
+
+        forward = self.forward
+        return np.asarray(points, dtype=np.float64) @ forward[:2, :2].T + forward[:2, 2]
+
+    def to_image(self, points: np.ndarray) -> np.ndarray:
+        """Project an (N, 2) array of canvas coordinates to point coordinates in one call
+
+        Args:
+            points (np.ndarray): (N, 2) array of x, y canvas coordinates
+
+        Returns:
+            image_points (np.ndarray): (N, 2) array of x, y point coordinates
+        """
+
+        inverse = self.inverse
+        return np.asarray(points, dtype=np.float64) @ inverse[:2, :2].T + inverse[:2, 2]
+
+    def visible_rect(self, width: int, height: int, margin: float = 0) -> tuple:
+        """Rectangle of point coordinates displayed by a canvas of the given size
+
+        The corners of the canvas are projected with the inverse matrix, the rectangle is their
+        bounding box (larger than the visible area when the view is rotated).
+
+        Args:
+            width (int): width of the canvas
+            height (int): height of the canvas
+            margin (float): canvas pixels added around the canvas (radius of the points)
+
+        Returns:
+            rect (tuple): (x_min, y_min, x_max, y_max) in point coordinates
+        """
+
+        corners = self.to_image(
+            [
+                (-margin, -margin),
+                (width + margin, -margin),
+                (width + margin, height + margin),
+                (-margin, height + margin),
+            ]
+        )
+        x_min, y_min = corners.min(axis=0)
+        x_max, y_max = corners.max(axis=0)
+
+        return float(x_min), float(y_min), float(x_max), float(y_max)
+
+    def _invalidate(self) -> None:
+        """Forget the cached matrices, they will be recomputed when used"""
+
+        self._forward = None
+        self._inverse = None
@@ -0,0 +1,453 @@
+import numpy as np
+
+FIELDS = ["x", "y", "angle", "orientation", "direction", "action", "wea"]
+
+DIRECTION_UNSET = np.iinfo(np.int8).min  # Value of the direction column when it's not set
+MIN_CAPACITY = 16  # Number of points allocated for an empty trajectory
+
+
+class Trajectory:
+    """Trajectory points stored in contiguous NumPy columns
+
+    x and y are stored together in an (N, 2) float64 array so the points can be projected in one
+    call, angle and orientation are float64 columns (NaN when not set), direction is a small int
+    column (DIRECTION_UNSET when not set), actions are ids of an interned table of action tuples
+    (0 is no action) and wea is a 0 / 1 column. wea is a flag: 0 and unset are the same value,
+    so a wea of 0 is read back as None (like the GUI saves an unchecked wea).
+    The columns have a growable capacity so appending a point is amortized O(1).
+
+    A trajectory also behaves like the previous list of points: trajectory[i] returns the point as
+    a list [x, y, angle, orientation, direction, action, wea] with None for the unset values.
+    """
+
+    def __init__(self, capacity: int = MIN_CAPACITY):
+        capacity = max(capacity, MIN_CAPACITY)
+        self._size = 0
+
+        self._xy = np.full((capacity, 2), np.nan)
+        self._angle = np.full(capacity, np.nan)
+        self._orientation = np.full(capacity, np.nan)
+        self._direction = np.full(capacity, DIRECTION_UNSET, dtype=np.int8)
+        self._action = np.zeros(capacity, dtype=np.int32)
+        self._wea = np.zeros(capacity, dtype=np.int8)
+
+        # Interned action tuples, the id of a tuple is its index (0 is no action)
+        self.action_sets = [()]
+        self._action_set_ids = {(): 0}
+
+    @classmethod
+    def from_rows(cls, rows) -> "Trajectory":
+        """Create a trajectory from a list of points [x, y, angle, orientation, direction, action, wea]
+
+        Args:
+            rows: list of points, each point is a list of len(FIELDS) values
+
+        Returns:
+            trajectory (Trajectory): the new trajectory
+        """
+
+        rows = list(rows)
+        trajectory = cls(len(rows))
+        for row in rows:
+            trajectory.append(row)
+
+        return trajectory
+
+    @classmethod
+    def from_columns(
+        cls,
+        xy,
+        angle=None,
+        orientation=None,
+        direction=None,
+        action_ids=None,
+        wea=None,
+        action_sets=None,
+    ) -> "Trajectory":
+        """Create a trajectory from whole columns in one vectorized copy per column
+
+        Args:
+            xy: (N, 2) x, y coordinates
+            angle, orientation, direction, action_ids, wea: N values, unset if None
+            action_sets (list[tuple] | None): the action table of action_ids, action_sets[0] must be ()
+
+        Returns:
+            trajectory (Trajectory): the new trajectory
+        """
+
+        size = len(xy)
+        trajectory = cls(size)
+        trajectory._size = size
+
+        trajectory._xy[:size] = xy
+        for column, values in (
+            (trajectory._angle, angle),
+            (trajectory._orientation, orientation),
+            (trajectory._direction, direction),
+            (trajectory._action, action_ids),
+            (trajectory._wea, wea),
+        ):
+            if values is not None:
+                column[:size] = values
+
+        if action_sets is not None:
+            trajectory.action_sets = [tuple(actions) for actions in action_sets]
+            trajectory._action_set_ids = {
+                actions: action_id
+                for action_id, actions in enumerate(trajectory.action_sets)
+            }
+
+        return trajectory
+
+    def copy(self) -> "Trajectory":
+        """Copy the trajectory (columns and action table)"""
+
+        trajectory = Trajectory(self._size)
+        trajectory._size = self._size
+        trajectory._xy[: self._size] = self.xy
+        trajectory._angle[: self._size] = self.angle
+        trajectory._orientation[: self._size] = self.orientation
+        trajectory._direction[: self._size] = self.direction
+        trajectory._action[: self._size] = self.action_ids
+        trajectory._wea[: self._size] = self.wea
+        trajectory.action_sets = list(self.action_sets)
+        trajectory._action_set_ids = dict(self._action_set_ids)
+
+        return trajectory
+
+    # -------------------------------------------------------------------------------
+    # Columns (views on the used part of the arrays)
+    # -------------------------------------------------------------------------------
+
+    @property
+    def xy(self) -> np.ndarray:
+        return self._xy[: self._size]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._xy[: self._size, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._xy[: self._size, 1]
+
+    @property
+    def angle(self) -> np.ndarray:
+        return self._angle[: self._size]
+
+    @property
+    def orientation(self) -> np.ndarray:
+        return self._orientation[: self._size]
+
+    @property
+    def direction(self) -> np.ndarray:
+        return self._direction[: self._size]
+
+    @property
+    def action_ids(self) -> np.ndarray:
+        return self._action[: self._size]
+
+    @property
+    def wea(self) -> np.ndarray:
+        return self._wea[: self._size]
+
+    # -------------------------------------------------------------------------------
+    # List of points interface
+    # -------------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        for idx in range(self._size):
+            yield self[idx]
+
+    def __getitem__(self, idx: int) -> list:
+        return [self.get(idx, field) for field in range(len(FIELDS))]
+
+    def append(self, row) -> None:
+        """Add a point at the end of the trajectory
+
+        Args:
+            row: the point [x, y, angle, orientation, direction, action, wea]
+        """
+
+        self._reserve(self._size + 1)
+        self._size += 1
+        self._set_row(self._size - 1, row)
+
+    def insert(self, idx: int, row) -> None:
+        """Insert a point before idx
+
+        Args:
+            idx (int): index of the new point
+            row: the point [x, y, angle, orientation, direction, action, wea]
+        """
+
+        idx = min(max(idx if idx >= 0 else self._size + idx, 0), self._size)
+
+        self._reserve(self._size + 1)
+        for column in self._columns():
+            column[idx + 1 : self._size + 1] = column[idx : self._size]
+        self._size += 1
+        self._set_row(idx, row)
+
+    def pop(self, idx: int = -1) -> list:
+        """Remove a point and return it
+
+        Args:
+            idx (int): index of the removed point, the last one by default
+
+        Returns:
+            row (list): the removed point
+        """
+
+        idx = self._index(idx)
+        row = self[idx]
+
+        for column in self._columns():
+            column[idx : self._size - 1] = column[idx + 1 : self._size]
+        self._size -= 1
+        self._clear(self._size)
+
+        return row
+
+    def take(self, indices) -> "Trajectory":
+        """Copy some points into a new trajectory that shares the same action ids
+
+        Args:
+            indices: sorted indices of the copied points
+
+        Returns:
+            trajectory (Trajectory): the copied points
+        """
+
+        indices = np.asarray(indices, dtype=np.intp)
+        return Trajectory.from_columns(
+            self.xy[indices],
+            self.angle[indices],
+            self.orientation[indices],
+            self.direction[indices],
+            self.action_ids[indices],
+            self.wea[indices],
+            self.action_sets,
+        )
+
+    def delete(self, indices) -> None:
+        """Remove many points in one vectorized step
+
+        Args:
+            indices: indices of the removed points
+        """
+
+        kept = np.ones(self._size, dtype=bool)
+        kept[np.asarray(indices, dtype=np.intp)] = False
+        size = int(kept.sum())
+
+        for column in self._columns():
+            column[:size] = column[: self._size][kept]
+        for idx in range(size, self._size):
+            self._clear(idx)
+        self._size = size
+
+    def put(self, indices, points: "Trajectory") -> None:
+        """Insert points so that they end up at indices, the inverse of delete
+
+        Args:
+            indices: sorted indices of the points once inserted
+            points (Trajectory): the inserted points, taken from this trajectory (same action ids)
+        """
+
+        indices = np.asarray(indices, dtype=np.intp)
+        size = self._size + len(indices)
+        self._reserve(size)
+
+        inserted = np.zeros(size, dtype=bool)
+        inserted[indices] = True
+
+        for column, values in zip(self._columns(), points._columns()):
+            merged = np.empty((size,) + column.shape[1:], column.dtype)
+            merged[inserted] = values[: len(indices)]
+            merged[~inserted] = column[: self._size]
+            column[:size] = merged
+        self._size = size
+
+    def get(self, idx: int, field: int):
+        """Get one value of a point, None if the value is not set
+
+        Args:
+            idx (int): index of the point
+            field (int): index of the value inside FIELDS
+
+        Returns:
+            value: the value with the type of the previous list of points
+        """
+
+        idx = self._index(idx)
+
+        if field < 2:
+            value = self._xy[idx, field]
+            return None if np.isnan(value) else value
+
+        elif field == 2 or field == 3:
+            value = (self._angle if field == 2 else self._orientation)[idx]
+            return None if np.isnan(value) else float(value)
+
+        elif field == 4:
+            value = self._direction[idx]
+            return None if value == DIRECTION_UNSET else int(value)
+
+        elif field == 5:
+            actions = self.action_sets[self._action[idx]]
+            return list(actions) if actions else None
+
+        else:
+            # 0 is stored for an unset wea, both are read as None
+            value = self._wea[idx]
+            return int(value) if value else None
+
+    def set(self, idx: int, field: int, value) -> None:
+        """Set one value of a point
+
+        Args:
+            idx (int): index of the point
+            field (int): index of the value inside FIELDS
+            value: the new value, None (or an empty string) to unset it
+
+        Raises:
+            ValueError: if the value can't be stored inside the column of the field
+        """
+
+        idx = self._index(idx)
+        unset = value is None or (isinstance(value, str) and value == "")
+
+        if field < 2:
+            self._xy[idx, field] = np.nan if unset else float(value)
+
+        elif field == 2:
+            self._angle[idx] = np.nan if unset else float(value)
+
+        elif field == 3:
+            self._orientation[idx] = np.nan if unset else float(value)
+
+        elif field == 4:
+            # DIRECTION_UNSET itself is reserved for the unset direction
+            self._direction[idx] = (
+                DIRECTION_UNSET
+                if unset
+                else _to_int(value, DIRECTION_UNSET + 1, np.iinfo(np.int8).max)
+            )
+
+        elif field == 5:
+            self._action[idx] = self.intern_actions(value)
+
+        elif field == 6:
+            self._wea[idx] = (
+                0 if unset else _to_int(value, np.iinfo(np.int8).min, np.iinfo(np.int8).max)
+            )
+
+        else:
+            raise ValueError(f"Unknown field index: {field}")
+
+    def intern_actions(self, actions) -> int:
+        """Get the id of a list of actions, add it to the action table if it's a new one
+
+        Args:
+            actions (list[str] | None): the actions of a point
+
+        Returns:
+            action_id (int): the id of the actions inside self.action_sets
+        """
+
+        actions = tuple(actions) if actions else ()
+        action_id = self._action_set_ids.get(actions)
+
+        if action_id is None:
+            action_id = len(self.action_sets)
+            self.action_sets.append(actions)
+            self._action_set_ids[actions] = action_id
+
+        return action_id
+
+    # -------------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------------
+
+    def _columns(self) -> tuple:
+        return (
+            self._xy,
+            self._angle,
+            self._orientation,
+            self._direction,
+            self._action,
+            self._wea,
+        )
+
+    def _index(self, idx: int) -> int:
+        """Convert a negative index and check that the index is inside the trajectory"""
+
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError("trajectory index out of range")
+
+        return idx
+
+    def _set_row(self, idx: int, row) -> None:
+        """Set every value of a point, the missing values are unset"""
+
+        self._clear(idx)
+        for field, value in enumerate(row[: len(FIELDS)]):
+            self.set(idx, field, value)
+
+    def _clear(self, idx: int) -> None:
+        """Unset every value of a point"""
+
+        self._xy[idx] = np.nan
+        self._angle[idx] = np.nan
+        self._orientation[idx] = np.nan
+        self._direction[idx] = DIRECTION_UNSET
+        self._action[idx] = 0
+        self._wea[idx] = 0
+
+    def _reserve(self, size: int) -> None:
+        """Grow the capacity of the columns (x2) if size points can't fit inside them"""
+
+        capacity = len(self._angle)
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        def _grow(column, fill_value):
+            grown = np.full((capacity,) + column.shape[1:], fill_value, column.dtype)
+            grown[: self._size] = column[: self._size]
+            return grown
+
+        self._xy = _grow(self._xy, np.nan)
+        self._angle = _grow(self._angle, np.nan)
+        self._orientation = _grow(self._orientation, np.nan)
+        self._direction = _grow(self._direction, DIRECTION_UNSET)
+        self._action = _grow(self._action, 0)
+        self._wea = _grow(self._wea, 0)
+
+
+def _to_int(value, minimum: int, maximum: int) -> int:
+    """Convert a direction or a wea to an int, 1.0 is accepted but not 1.5
+
+    Args:
+        value: the value to convert
+        minimum (int): smallest value the column can store
+        maximum (int): largest value the column can store
+
+    Raises:
+        ValueError: if the value isn't an integral number between minimum and maximum
+    """
+
+    number = float(value)
+    if not number.is_integer():
+        raise ValueError(f"Not an integer: {value!r}")
+    if not minimum <= number <= maximum:
+        raise ValueError(f"Out of range [{minimum}, {maximum}]: {value!r}")
+    return int(number)
@@ -1,10 +1,35 @@
 import csv
+import heapq  # Visvalingam simplification
 import json
+import os
+import struct
+from functools import lru_cache
 from types import new_class
 import numpy as np
-from math import atan2, pi
+from math import pi
 
-FIELDS = ["x", "y", "angle", "orientation", "direction", "action", "wea"]
+from trajectory import DIRECTION_UNSET, FIELDS, Trajectory
+
+try:
+    import orjson  # Optional faster json encoder
+except ImportError:
+    orjson = None
+
+CSV_ACTION_SEPARATOR = ";"  # Separator of the actions of a point inside a csv cell
+CSV_ACTION_ESCAPE = "\\"  # Written before a separator (or an escape) that is part of an action name
+CSV_CHUNK_SIZE = 4096  # Number of points converted at once when writing a csv file
+
+JSON_CHUNK_SIZE = 4096  # Number of points formatted at once when writing a json file
+JSON_INDENT = "    "  # Indentation of the json files (the same as json.dump(indent=4))
+
+# Binary trajectory file: header, packed little-endian records, string table for the actions
+BINARY_EXTENSION = ".trjb"
+BINARY_MAGIC = b"TRJB"
+BINARY_VERSION = 1
+# magic, version, field mask, number of points, offset of the records, offset of the string table
+BINARY_HEADER = struct.Struct("<4sHHQQQ")
+# Little-endian type of every field of FIELDS inside a record
+BINARY_FIELD_TYPES = ["<f8", "<f8", "<f8", "<f8", "i1", "<u4", "i1"]
 
 
 def coordinates_to_json(
@@ -20,39 +45,183 @@ def coordinates_to_json(
 
     coordinates = coordinates_to_int(coordinates)
 
-    mask = [1, 1, is_angle, is_orientation, is_direction, is_action, is_wea]
+    mask = (1, 1, is_angle, is_orientation, is_direction, is_action, is_wea)
+    names, kept = _json_projection(mask)
+
+    points = [dict(zip(names, [value[field] for field in kept])) for value in coordinates]
 
     if mask[5] and len(actions) > 0:
-        json_actions = format_actions_to_json(actions)
-        trajectory = [
-            json_actions,
-            [
-                dict(
-                    zip(
-                        [field for field, keep in zip(FIELDS, mask) if keep],
-                        [val for val, keep in zip(value, mask) if keep],
-                    )
-                )
-                for value in coordinates
-            ],
-        ]
+        trajectory = [format_actions_to_json(actions), points]
 
     else:
-        trajectory = [
-            dict(
-                zip(
-                    [field for field, keep in zip(FIELDS, mask) if keep],
-                    [val for val, keep in zip(value, mask) if keep],
-                )
+        trajectory = points
+
+    return trajectory
+
+
+def write_json_trajectory(
+    file_path: str,
+    coordinates: Trajectory,
+    actions: list,
+    is_angle: int,
+    is_orientation: int,
+    is_direction: int,
+    is_action: int,
+    is_wea: int,
+    compact: bool = False,
+):
+    """Write the same json as coordinates_to_json + json.dump without building the list of dicts
+
+    The points are formatted by chunks of JSON_CHUNK_SIZE straight from the columns with a
+    template compiled once for the mask, and written as soon as a chunk is formatted.
+
+    Args:
+        file_path (str): path of the json file
+        coordinates (Trajectory): the points to save
+        actions (list[str]): the actions saved with the trajectory (if is_action is set)
+        is_angle, is_orientation, is_direction, is_action, is_wea (int): 1 to save the field
+        compact (bool): True to write the json without indentation and spaces
+    """
+
+    mask = (1, 1, is_angle, is_orientation, is_direction, is_action, is_wea)
+    with_actions = bool(mask[5] and len(actions) > 0)
+
+    # The points are inside a second level list when the actions are saved with them
+    depth = 2 if with_actions else 1
+    template, separator = _json_point_template(mask, depth, compact)
+    _, kept = _json_projection(mask)
+
+    if compact:
+        opening, closing, newline = "[", "]", ""
+    else:
+        opening = "[\n" + JSON_INDENT * depth
+        closing = "\n" + JSON_INDENT * (depth - 1) + "]"
+        newline = "\n"
+
+    with open(file_path, mode="w", encoding="utf-8") as file:
+        if with_actions:
+            json_actions = json_dumps(format_actions_to_json(actions), compact)
+            if not compact:
+                json_actions = json_actions.replace("\n", "\n" + JSON_INDENT)
+            file.write("[" + newline + ("" if compact else JSON_INDENT))
+            file.write(json_actions + ("," if compact else ",\n" + JSON_INDENT))
+
+        if len(coordinates) == 0:
+            file.write("[]")
+        else:
+            file.write(opening)
+
+        for start in range(0, len(coordinates), JSON_CHUNK_SIZE):
+            stop = min(start + JSON_CHUNK_SIZE, len(coordinates))
+            columns = [
+                _json_column(coordinates, field, start, stop, depth, compact)
+                for field in kept
+            ]
+
+            if start > 0:
+                file.write(separator)
+            file.write(separator.join([template % values for values in zip(*columns)]))
+
+        if len(coordinates) != 0:
+            file.write(closing)
+
+        if with_actions:
+            file.write(newline + "]")
+
+
+def json_dumps(content, compact: bool = False) -> str:
+    """Encode content to json, with orjson if it's installed and the output is compact
+
+    Args:
+        content: the json content
+        compact (bool): True for no indentation and no spaces, False for json.dump(indent=4)
+
+    Returns:
+        json_content (str): the encoded content
+    """
+
+    if not compact:
+        return json.dumps(content, indent=4)
+
+    if orjson is not None:
+        return orjson.dumps(content).decode("utf-8")
+
+    return json.dumps(content, separators=(",", ":"))
+
+
+@lru_cache
+def _json_projection(mask: tuple) -> tuple[tuple, tuple]:
+    """Get the names and the indices of the kept FIELDS of a mask (computed once per mask)"""
+
+    kept = tuple(field for field, keep in enumerate(mask) if keep)
+    return tuple(FIELDS[field] for field in kept), kept
+
+
+@lru_cache
+def _json_point_template(mask: tuple, depth: int, compact: bool) -> tuple[str, str]:
+    """Get the %-format template of a point and the separator between two points
+
+    Args:
+        mask (tuple): 1 for every field of FIELDS that is saved
+        depth (int): number of lists around the points
+        compact (bool): True for no indentation and no spaces
+
+    Returns:
+        template (str): the template, filled with the json encoded values of the kept fields
+        separator (str): the string between two points
+    """
+
+    names, _ = _json_projection(mask)
+    keys = [json.dumps(name).replace("%", "%%") for name in names]
+
+    if compact:
+        return "{" + ",".join(f"{key}:%s" for key in keys) + "}", ","
+
+    indent = "\n" + JSON_INDENT * (depth + 1)
+    template = (
+        "{"
+        + ",".join(f"{indent}{key}: %s" for key in keys)
+        + "\n"
+        + JSON_INDENT * depth
+        + "}"
+    )
+
+    return template, ",\n" + JSON_INDENT * depth
+
+
+def _json_column(
+    coordinates: Trajectory,
+    field: int,
+    start: int,
+    stop: int,
+    depth: int,
+    compact: bool,
+) -> list[str]:
+    """Get the json encoded values of a field for the points start to stop - 1
+
+    depth and compact are the ones of _json_point_template, used to indent the lists of actions.
+    """
+
+    if field == 5:
+        action_sets = [
+            json_dumps(list(actions), compact).replace(
+                "\n", "\n" + JSON_INDENT * (depth + 1)
             )
-            for value in coordinates
+            if actions
+            else "null"
+            for actions in coordinates.action_sets
         ]
+        return [action_sets[action_id] for action_id in coordinates.action_ids[start:stop].tolist()]
 
-    return trajectory
+    # Same values as the csv cells (ints for x & y), None is null
+    return [
+        "null" if value is None else repr(value)
+        for value in _csv_column(coordinates, field, start, stop)
+    ]
 
 
 def format_json_to_trajectory(json_data):
-    """Convert the content of json_data into a trajectory list and an actions list"""
+    """Convert the content of json_data into a Trajectory"""
 
     formated_json_data = [[dict.get(key, None) for key in FIELDS] for dict in json_data]
     trajectory = coordinates_to_float64(formated_json_data)
@@ -62,51 +231,475 @@ def format_json_to_trajectory(json_data):
 
 
 def coordinates_to_csv(
-    coordinates: list,
+    coordinates: Trajectory,
     file_path: str,
-    is_angle: str,
-    is_orientation: str,
-    is_direction: str,
-    is_action: str,
+    is_angle: int,
+    is_orientation: int,
+    is_direction: int,
+    is_action: int,
+    is_wea: int,
 ):
-    # Convert coordinates and add them to a csv file
+    """Write the trajectory to a csv file, one row per point written as soon as it's formatted
 
-    coordinates = coordinates_to_int(coordinates)
+    The header contains the kept FIELDS, the actions of a point are joined with CSV_ACTION_SEPARATOR
+    (escaped with CSV_ACTION_ESCAPE inside the action names).
 
-    mask = [
-        True,
-        True,
-        is_angle.lower() == "true",
-        is_orientation.lower() == "true",
-        is_direction.lower() == "true",
-        is_action.lower() == "true",
-    ]
+    Args:
+        coordinates (Trajectory): the points to save
+        file_path (str): path of the csv file
+        is_angle, is_orientation, is_direction, is_action, is_wea (int): 1 to write the column
+    """
 
-    coordinates = [
-        [val for val, keep in zip(value, mask) if keep] for value in coordinates
-    ]
+    mask = [1, 1, is_angle, is_orientation, is_direction, is_action, is_wea]
+    kept = [field for field, keep in enumerate(mask) if keep]
+
+    def _rows():
+        # The columns are converted by chunks of CSV_CHUNK_SIZE points, never all at once
+        for start in range(0, len(coordinates), CSV_CHUNK_SIZE):
+            stop = min(start + CSV_CHUNK_SIZE, len(coordinates))
+            yield from zip(
+                *[_csv_column(coordinates, field, start, stop) for field in kept]
+            )
 
-    with open(file_path, mode="w", newline="") as file:
-        # Create header and add coordinates to a csv file
+    with open(file_path, mode="w", newline="", encoding="utf-8") as file:
         writer = csv.writer(file)
-        writer.writerow(header for header, keep in zip(FIELDS, mask) if keep)
-        writer.writerows(coordinates)
+        writer.writerow(FIELDS[field] for field in kept)
+        writer.writerows(_rows())
+
+
+def _csv_column(coordinates: Trajectory, field: int, start: int, stop: int) -> list:
+    """Get the csv cells of a field for the points start to stop - 1 (None for an empty cell)"""
+
+    if field < 2:
+        column = coordinates.xy[start:stop, field]
+        return [None if value != value else int(round(value)) for value in column.tolist()]
+
+    elif field == 2 or field == 3:
+        column = (coordinates.angle if field == 2 else coordinates.orientation)[start:stop]
+        return [None if value != value else value for value in column.tolist()]
+
+    elif field == 4:
+        column = coordinates.direction[start:stop].tolist()
+        return [None if value == DIRECTION_UNSET else value for value in column]
+
+    elif field == 5:
+        action_sets = [
+            CSV_ACTION_SEPARATOR.join(map(_escape_csv_action, actions)) if actions else None
+            for actions in coordinates.action_sets
+        ]
+        return [action_sets[action_id] for action_id in coordinates.action_ids[start:stop].tolist()]
+
+    else:
+        return [value or None for value in coordinates.wea[start:stop].tolist()]
+
+
+def _escape_csv_action(action: str) -> str:
+    # Action names are free text, they can contain the separator
+    return action.replace(CSV_ACTION_ESCAPE, CSV_ACTION_ESCAPE * 2).replace(
+        CSV_ACTION_SEPARATOR, CSV_ACTION_ESCAPE + CSV_ACTION_SEPARATOR
+    )
 
 
 def csv_to_coordinates(file_path: str):
-    # Convert the content of a csv file to coordinates array
-    # TODO: import the trajectory depending of the header of the csv
+    """Load a csv file into a Trajectory, the rows are streamed so the file is never held in memory
 
-    with open(file_path, newline="", encoding="utf-8") as csv_file:
-        reader = csv.reader(csv_file)
-        next(reader)
-        coordinates = [[None if cell == "" else cell for cell in row] for row in reader]
-        coordinates = coordinates_to_float64(coordinates)
+    Returns:
+        coordinates (Trajectory | None): the points of the file, None if there is no point
+    """
+
+    coordinates = Trajectory()
+    for row in iter_csv_rows(file_path):
+        coordinates.append(row)
 
     if coordinates:
         return coordinates
 
 
+def iter_csv_rows(file_path: str):
+    """Read a csv file one row at a time, the header maps the columns to FIELDS
+
+    The header names are matched to FIELDS without case, the unknown columns are ignored and the
+    missing fields are set to None. Only x and y are mandatory.
+
+    Args:
+        file_path (str): path of the csv file
+
+    Raises:
+        ValueError: if the header has no x or y column or if a cell is not valid
+
+    Yields:
+        row (list): a point [x, y, angle, orientation, direction, action, wea]
+    """
+
+    with open(file_path, newline="", encoding="utf-8-sig") as csv_file:
+        reader = csv.reader(csv_file)
+
+        header = next(reader, None)
+        if header is None:
+            return
+
+        # Index of the csv column of every field (None if the field is not inside the file)
+        columns = {name.strip().lower(): column for column, name in enumerate(header)}
+        mapping = [columns.get(field) for field in FIELDS]
+
+        if mapping[0] is None or mapping[1] is None:
+            raise ValueError("The csv header must contain a x and a y column")
+
+        for line_number, cells in enumerate(reader, start=2):
+            if not any(cell.strip() for cell in cells):
+                continue  # Blank line
+
+            row = [None] * len(FIELDS)
+            for field, column in enumerate(mapping):
+                if column is None or column >= len(cells):
+                    continue
+
+                cell = cells[column].strip()
+                if cell == "":
+                    continue
+
+                try:
+                    row[field] = CSV_PARSERS[field](cell)
+                except ValueError:
+                    raise ValueError(
+                        f"Line {line_number}: invalid {FIELDS[field]} value {cell!r}"
+                    ) from None
+
+            yield row
+
+
+def _parse_csv_int(cell: str) -> int:
+    # Accept "1" and "1.0" (odometry logs can write every number as a float)
+    value = float(cell)
+    if not value.is_integer():
+        raise ValueError(cell)
+    return int(value)
+
+
+def _parse_csv_actions(cell: str) -> list[str]:
+    # Split on the separators that aren't escaped, the inverse of _escape_csv_action
+    actions = []
+    action = []
+    chars = iter(cell)
+    for char in chars:
+        if char == CSV_ACTION_ESCAPE:
+            action.append(next(chars, ""))
+        elif char == CSV_ACTION_SEPARATOR:
+            actions.append("".join(action))
+            action = []
+        else:
+            action.append(char)
+    actions.append("".join(action))
+
+    return [action.strip() for action in actions if action.strip()]
+
+
+# Conversion of a csv cell for every field of FIELDS
+CSV_PARSERS = [
+    float,  # x
+    float,  # y
+    float,  # angle
+    float,  # orientation
+    _parse_csv_int,  # direction
+    _parse_csv_actions,  # action
+    _parse_csv_int,  # wea
+]
+
+
+def coordinates_to_binary(
+    coordinates: Trajectory,
+    actions: list[str],
+    file_path: str,
+    is_angle: int,
+    is_orientation: int,
+    is_direction: int,
+    is_action: int,
+    is_wea: int,
+):
+    """Write the trajectory to a binary file that can be loaded with np.memmap
+
+    Layout of the file:
+    - BINARY_HEADER: the field mask has the bit i set if FIELDS[i] is saved
+    - one packed record per point with the saved fields (binary_record_dtype)
+    - the string table: every action name, then the actions list and the action sets of the
+      points as indices into the names (all the counts and indices are little-endian uint32)
+
+    Args:
+        coordinates (Trajectory): the points to save
+        actions (list[str]): the actions saved with the trajectory
+        file_path (str): path of the binary file
+        is_angle, is_orientation, is_direction, is_action, is_wea (int): 1 to save the field
+    """
+
+    mask = [1, 1, is_angle, is_orientation, is_direction, is_action, is_wea]
+    field_mask = sum(1 << field for field, keep in enumerate(mask) if keep)
+    dtype = binary_record_dtype(field_mask)
+
+    records = np.empty(len(coordinates), dtype=dtype)
+    columns = [
+        coordinates.x,
+        coordinates.y,
+        coordinates.angle,
+        coordinates.orientation,
+        coordinates.direction,
+        coordinates.action_ids,
+        coordinates.wea,
+    ]
+    for field in dtype.names:
+        records[field] = columns[FIELDS.index(field)]
+
+    # String table, the actions are only saved with the action field (like the json file)
+    actions = actions if is_action else []
+    action_sets = coordinates.action_sets if is_action else [()]
+    names = list(dict.fromkeys(actions))
+    for actions_set in action_sets:
+        names.extend(name for name in actions_set if name not in names)
+    name_ids = {name: name_id for name_id, name in enumerate(names)}
+
+    table = [struct.pack("<I", len(names))]
+    for name in names:
+        encoded = name.encode("utf-8")
+        table.append(struct.pack("<I", len(encoded)) + encoded)
+
+    table.append(_pack_ids([name_ids[name] for name in actions]))
+    table.append(struct.pack("<I", len(action_sets)))
+    for actions_set in action_sets:
+        table.append(_pack_ids([name_ids[name] for name in actions_set]))
+
+    records_offset = BINARY_HEADER.size
+    strings_offset = records_offset + records.nbytes
+
+    with open(file_path, mode="wb") as file:
+        file.write(
+            BINARY_HEADER.pack(
+                BINARY_MAGIC,
+                BINARY_VERSION,
+                field_mask,
+                len(coordinates),
+                records_offset,
+                strings_offset,
+            )
+        )
+        file.write(records.tobytes())
+        file.write(b"".join(table))
+
+
+def binary_to_coordinates(file_path: str) -> tuple[Trajectory, list[str]]:
+    """Load a binary trajectory file, the records are memory-mapped instead of parsed
+
+    Raises:
+        ValueError: if the file is not a valid binary trajectory
+
+    Returns:
+        coordinates (Trajectory): the points of the file
+        actions (list[str]): the actions saved with the trajectory
+    """
+
+    file_size = os.path.getsize(file_path)
+
+    with open(file_path, mode="rb") as file:
+        header = file.read(BINARY_HEADER.size)
+        if len(header) < BINARY_HEADER.size:
+            raise ValueError("Not a binary trajectory file")
+
+        magic, version, field_mask, size, records_offset, strings_offset = (
+            BINARY_HEADER.unpack(header)
+        )
+        if magic != BINARY_MAGIC:
+            raise ValueError("Not a binary trajectory file")
+        if version != BINARY_VERSION:
+            raise ValueError(f"Unsupported binary trajectory version: {version}")
+
+        dtype = binary_record_dtype(field_mask)
+        if records_offset + size * dtype.itemsize > min(strings_offset, file_size):
+            raise ValueError("Truncated binary trajectory file")
+
+        file.seek(strings_offset)
+        names, actions, action_sets = _read_string_table(file.read())
+
+    if size:
+        records = np.memmap(
+            file_path, dtype=dtype, mode="r", offset=records_offset, shape=(size,)
+        )
+    else:
+        records = np.empty(0, dtype=dtype)
+
+    columns = {field: records[field] for field in dtype.names}
+    if "action" in columns and columns["action"].size:
+        if columns["action"].max() >= len(action_sets):
+            raise ValueError("Unknown action set inside the binary trajectory file")
+
+    coordinates = Trajectory.from_columns(
+        np.column_stack((columns["x"], columns["y"])),
+        columns.get("angle"),
+        columns.get("orientation"),
+        columns.get("direction"),
+        columns.get("action"),
+        columns.get("wea"),
+        action_sets,
+    )
+    del records, columns  # Close the memory map
+
+    return coordinates, actions
+
+
+def binary_record_dtype(field_mask: int) -> np.dtype:
+    """Get the packed record type of the fields set inside field_mask"""
+
+    return np.dtype(
+        [
+            (field, field_type)
+            for field_id, (field, field_type) in enumerate(
+                zip(FIELDS, BINARY_FIELD_TYPES)
+            )
+            if field_mask & (1 << field_id)
+        ]
+    )
+
+
+def _pack_ids(ids: list[int]) -> bytes:
+    # Count followed by the ids, all little-endian uint32
+    return struct.pack(f"<I{len(ids)}I", len(ids), *ids)
+
+
+def _read_string_table(data: bytes) -> tuple[list[str], list[str], list[tuple]]:
+    """Decode the string table of a binary trajectory file
+
+    Returns:
+        names (list[str]): every action name
+        actions (list[str]): the actions list saved with the trajectory
+        action_sets (list[tuple]): the action table of the points
+    """
+
+    offset = 0
+
+    def _read(format: str):
+        nonlocal offset
+        values = struct.unpack_from(format, data, offset)
+        offset += struct.calcsize(format)
+        return values
+
+    def _read_ids() -> list[int]:
+        (count,) = _read("<I")
+        return list(_read(f"<{count}I"))
+
+    try:
+        (count,) = _read("<I")
+        names = []
+        for _ in range(count):
+            (length,) = _read("<I")
+            names.append(data[offset : offset + length].decode("utf-8"))
+            offset += length
+
+        actions = [names[name_id] for name_id in _read_ids()]
+        (count,) = _read("<I")
+        action_sets = [
+            tuple(names[name_id] for name_id in _read_ids()) for _ in range(count)
+        ]
+
+    except (struct.error, IndexError, UnicodeDecodeError):
+        raise ValueError("Corrupted string table inside the binary trajectory file") from None
+
+    if not action_sets or action_sets[0] != ():
+        raise ValueError("Corrupted string table inside the binary trajectory file")
+
+    return names, actions, action_sets
+
+
+def load_trajectory_file(file_path: str) -> tuple[Trajectory, list[str]]:
+    """Load a trajectory file (.json, .csv or BINARY_EXTENSION) without any GUI
+
+    Args:
+        file_path (str): path of the trajectory file
+
+    Raises:
+        ValueError: if the file type is not supported or the content is not a trajectory
+
+    Returns:
+        trajectory (Trajectory): the points of the file
+        actions (list[str]): the actions saved with the trajectory (empty if there is none)
+    """
+
+    file_extension = os.path.splitext(file_path)[-1].lower()
+
+    if file_extension == ".csv":
+        return csv_to_coordinates(file_path) or Trajectory(), []
+
+    if file_extension == BINARY_EXTENSION:
+        return binary_to_coordinates(file_path)
+
+    if file_extension != ".json":
+        raise ValueError(f"Unsupported file type: {file_extension}")
+
+    with open(file_path, "r", encoding="utf-8") as json_file:
+        json_data = json.load(json_file)
+
+    if not isinstance(json_data, list):
+        raise ValueError("A trajectory file must contain a list")
+
+    # Actions & trajectory in the same file
+    if len(json_data) == 2 and isinstance(json_data[1], list):
+        actions = format_json_to_actions(json_data[0])
+        json_data = json_data[1]
+    else:
+        actions = []
+
+    if not all(isinstance(point, dict) for point in json_data):
+        raise ValueError("Every point of the trajectory must be an object")
+
+    return format_json_to_trajectory(json_data) or Trajectory(), actions
+
+
+def save_trajectory_file(
+    file_path: str,
+    coordinates: Trajectory,
+    actions: list[str],
+    fields: list[str],
+    compact: bool = False,
+):
+    """Save a trajectory file (.json, .csv or BINARY_EXTENSION) without any GUI
+
+    Args:
+        file_path (str): path of the new file
+        coordinates (Trajectory): the points to save
+        actions (list[str]): the actions saved with the trajectory (not saved inside a csv file)
+        fields (list[str]): the optional FIELDS to save, x and y are always saved
+        compact (bool): True to write a json file without indentation
+
+    Raises:
+        ValueError: if the file type is not supported
+    """
+
+    file_extension = os.path.splitext(file_path)[-1].lower()
+    mask = [int(field in fields) for field in FIELDS[2:]]
+
+    if file_extension == ".json":
+        write_json_trajectory(file_path, coordinates, actions, *mask, compact=compact)
+
+    elif file_extension == ".csv":
+        coordinates_to_csv(coordinates, file_path, *mask)
+
+    elif file_extension == BINARY_EXTENSION:
+        coordinates_to_binary(coordinates, actions, file_path, *mask)
+
+    else:
+        raise ValueError(f"Unsupported file type: {file_extension}")
+
+
+def used_fields(coordinates: Trajectory) -> list[str]:
+    """Get the optional FIELDS that are set on at least one point of the trajectory"""
+
+    columns = {
+        "angle": ~np.isnan(coordinates.angle),
+        "orientation": ~np.isnan(coordinates.orientation),
+        "direction": coordinates.direction != DIRECTION_UNSET,
+        "action": coordinates.action_ids != 0,
+        "wea": coordinates.wea != 0,
+    }
+
+    return [field for field, is_set in columns.items() if is_set.any()]
+
+
 def format_actions_to_json(actions: list[str]) -> dict[str, str]:
     """Convert a list of actions in a list of dict that can be read easily for a json_file
 
@@ -133,39 +726,405 @@ def format_json_to_actions(json_data) -> list[str]:
     return actions
 
 
-def update_trajectory(image_point, point_idx: int, values_index: int, new_values):
+def update_trajectory(
+    image_point: Trajectory, point_idx: int, values_index: int, new_values
+):
     """Update the trajectory idx based on the updated_index list and the new_values list"""
 
-    image_point[point_idx][values_index] = new_values
+    image_point.set(point_idx, values_index, new_values)
 
     return image_point
 
 
-def calculate_angle(coordinates: list):
-    # Calculate the angle between two points in a list of coordinates
+def calculate_angle(coordinates: Trajectory):
+    """Calculate the angle of every segment of the trajectory in one vectorized step (used on file load)
 
-    if len(coordinates) < 2:
-        return coordinates
-    coordinates = coordinates_to_int(coordinates)
-    trajectory_points = [
-        [
-            x,
-            y,
-            atan2(coordinates[i + 1][1] - y, coordinates[i + 1][0] - x) * 180 / pi,
-            orientation,
-            direction,
-            action,
-            wea,
-        ]
-        for i, (x, y, _, orientation, direction, action, wea) in enumerate(
-            coordinates[:-1]
-        )
-    ]
-    trajectory_points.append(coordinates[-1])
-    return trajectory_points
+    The angle of a point is the heading from this point to the next one, the last point keeps its angle.
+    The angles are calculated from the coordinates rounded to int (the exported ones), but the
+    coordinates of the trajectory are not rounded anymore.
+
+    Args:
+        coordinates (Trajectory): the trajectory, updated in place
+
+    Returns:
+        coordinates (Trajectory): the same trajectory
+    """
+
+    _calculate_segment_angles(coordinates, 0, len(coordinates) - 1)
+
+    return coordinates
+
+
+def update_angles(coordinates: Trajectory, point_idx: int):
+    """Only recalculate the angles of the (at most two) segments adjacent to a point
+
+    Gives the same angles as calculate_angle after:
+    - an insertion or a move: point_idx is the index of the point
+    - a deletion: point_idx is the index that the removed point had
+
+    Args:
+        coordinates (Trajectory): the trajectory, updated in place
+        point_idx (int): index of the inserted, moved or deleted point
+
+    Returns:
+        coordinates (Trajectory): the same trajectory
+    """
+
+    _calculate_segment_angles(
+        coordinates, max(point_idx - 1, 0), min(point_idx + 1, len(coordinates) - 1)
+    )
+
+    return coordinates
+
+
+def _calculate_segment_angles(coordinates: Trajectory, start: int, stop: int) -> None:
+    """Set the angle of the points start to stop - 1 to the heading of their segment (in degrees)
+
+    Args:
+        coordinates (Trajectory): the trajectory, updated in place
+        start (int): index of the first point of the first segment
+        stop (int): index of the last point of the last segment
+    """
+
+    if stop <= start:
+        return
+
+    deltas = np.diff(np.rint(coordinates.xy[start : stop + 1]), axis=0)
+    coordinates.angle[start:stop] = np.arctan2(deltas[:, 1], deltas[:, 0]) * 180 / pi
+
+
+def transform_trajectory(coordinates: Trajectory, matrix):
+    """Apply an affine transformation to the whole trajectory in one vectorized step
+
+    The points are multiplied by the matrix and the headings (angle and orientation, in degrees) are
+    turned by its linear part, so they still follow the transformed trajectory. The unset headings
+    stay NaN, the other columns are not changed.
+
+    Args:
+        coordinates (Trajectory): the trajectory, updated in place
+        matrix: 3x3 affine matrix in image coordinates (see the *_matrix functions, they can be composed with @)
+
+    Returns:
+        coordinates (Trajectory): the same trajectory
+    """
+
+    matrix = np.asarray(matrix, dtype=np.float64)
+    linear = matrix[:2, :2]
+
+    coordinates.xy[:] = coordinates.xy @ linear.T + matrix[:2, 2]
+
+    for headings in (coordinates.angle, coordinates.orientation):
+        radians = headings * pi / 180
+        vectors = np.stack((np.cos(radians), np.sin(radians)), axis=1) @ linear.T
+        headings[:] = np.arctan2(vectors[:, 1], vectors[:, 0]) * 180 / pi
+
+    return coordinates
+
+
+def mirror_matrix(size: float, axis: str = "x") -> np.ndarray:
+    """Matrix of the symmetry on the middle of the image: x -> size - x for "x", y -> size - y for "y"""
+
+    if axis not in ("x", "y"):
+        raise ValueError(f"Unknown mirror axis: {axis!r}")
+
+    matrix = np.identity(3)
+    axis_idx = 0 if axis == "x" else 1
+    matrix[axis_idx, axis_idx] = -1
+    matrix[axis_idx, 2] = size
+
+    return matrix
+
+
+def translation_matrix(offset_x: float, offset_y: float) -> np.ndarray:
+    """Matrix of a translation of (offset_x, offset_y)"""
+
+    matrix = np.identity(3)
+    matrix[:2, 2] = offset_x, offset_y
+
+    return matrix
+
+
+def rotation_matrix(degrees: float, center: tuple[float, float] = (0, 0)) -> np.ndarray:
+    """Matrix of a rotation around center, in the direction of the angles (from x towards y)"""
+
+    cos, sin = np.cos(degrees * pi / 180), np.sin(degrees * pi / 180)
+    rotation = np.array([[cos, -sin, 0], [sin, cos, 0], [0, 0, 1]])
+
+    return translation_matrix(*center) @ rotation @ translation_matrix(-center[0], -center[1])
 
 
-def coordinates_to_int(coordinates: list):
+def scale_matrix(
+    scale_x: float, scale_y: float | None = None, center: tuple[float, float] = (0, 0)
+) -> np.ndarray:
+    """Matrix of a scaling from center, uniform if scale_y is None"""
+
+    scaling = np.diag([scale_x, scale_x if scale_y is None else scale_y, 1.0])
+
+    return translation_matrix(*center) @ scaling @ translation_matrix(-center[0], -center[1])
+
+
+def mirror_trajectory(coordinates: Trajectory, size: float, axis: str = "x"):
+    """Mirror the trajectory on the middle of the image (x -> width - x, or y -> height - y)
+
+    Args:
+        coordinates (Trajectory): the trajectory, updated in place
+        size (float): width of the image for the "x" axis, height for "y"
+        axis (str): the mirrored coordinate, "x" swaps the sides of the playmat
+
+    Returns:
+        coordinates (Trajectory): the same trajectory
+    """
+
+    return transform_trajectory(coordinates, mirror_matrix(size, axis))
+
+
+def translate_trajectory(coordinates: Trajectory, offset_x: float, offset_y: float):
+    # Move every point of (offset_x, offset_y), the headings don't change
+    return transform_trajectory(coordinates, translation_matrix(offset_x, offset_y))
+
+
+def rotate_trajectory(
+    coordinates: Trajectory, degrees: float, center: tuple[float, float] = (0, 0)
+):
+    # Rotate every point around center, the headings are turned of the same angle
+    return transform_trajectory(coordinates, rotation_matrix(degrees, center))
+
+
+def scale_trajectory(
+    coordinates: Trajectory,
+    scale_x: float,
+    scale_y: float | None = None,
+    center: tuple[float, float] = (0, 0),
+):
+    # Scale every point from center, the headings only change with a non uniform scale
+    return transform_trajectory(coordinates, scale_matrix(scale_x, scale_y, center))
+
+
+SIMPLIFY_METHODS = ("douglas-peucker", "visvalingam")
+
+
+def simplify_mask(
+    coordinates: Trajectory, tolerance: float, method: str = "douglas-peucker"
+) -> np.ndarray:
+    """Find the points kept by a simplification of the trajectory (the trajectory isn't changed)
+
+    The points carrying actions, an orientation or wea, the points where the direction changes,
+    the points without coordinates and the first and last points are always kept: the trajectory
+    is simplified independently between two of them. The neighbours of a point without
+    coordinates are kept too.
+
+    Args:
+        coordinates (Trajectory): the trajectory
+        tolerance (float): in image pixels, douglas-peucker removes the points closer than tolerance
+            to the simplified line, visvalingam the points whose triangle area is below tolerance²
+        method (str): "douglas-peucker" (vectorized) or "visvalingam" (heap of the areas)
+
+    Raises:
+        ValueError: if the method is unknown
+
+    Returns:
+        kept (np.ndarray): boolean mask of the kept points
+    """
+
+    anchors = _simplify_anchors(coordinates)
+    if tolerance <= 0 or anchors.all():
+        return anchors
+
+    xy = coordinates.xy
+
+    if method == "douglas-peucker":
+        return _douglas_peucker(xy, anchors, tolerance)
+    if method == "visvalingam":
+        return _visvalingam(xy, anchors, tolerance * tolerance)
+
+    raise ValueError(f"Unknown simplification method: {method!r}")
+
+
+def simplify_trajectory(
+    coordinates: Trajectory, tolerance: float, method: str = "douglas-peucker"
+) -> int:
+    """Remove the points that don't change the shape of the trajectory (see simplify_mask)
+
+    Args:
+        coordinates (Trajectory): the trajectory, updated in place
+        tolerance (float): in image pixels
+        method (str): "douglas-peucker" or "visvalingam"
+
+    Returns:
+        removed (int): number of removed points
+    """
+
+    removed = np.flatnonzero(~simplify_mask(coordinates, tolerance, method))
+    remove_points(coordinates, removed)
+
+    return len(removed)
+
+
+def remove_points(coordinates: Trajectory, indices) -> None:
+    """Remove many points in one step and update the angles of the points before them
+
+    Gives the same angles as removing the points one by one with update_angles.
+
+    Args:
+        coordinates (Trajectory): the trajectory, updated in place
+        indices: sorted indices of the removed points
+    """
+
+    indices = np.asarray(indices, dtype=np.intp)
+    if len(indices) == 0:
+        return
+
+    kept = np.ones(len(coordinates), dtype=bool)
+    kept[indices] = False
+
+    # Kept points followed by a removed one, their segment now goes to the next kept point
+    before = indices[indices > 0] - 1
+    before = np.unique(before[kept[before]])
+    new_indices = np.cumsum(kept)[before] - 1
+
+    coordinates.delete(indices)
+
+    new_indices = new_indices[new_indices + 1 < len(coordinates)]
+    rounded = np.rint(coordinates.xy)
+    deltas = rounded[new_indices + 1] - rounded[new_indices]
+    coordinates.angle[new_indices] = np.arctan2(deltas[:, 1], deltas[:, 0]) * 180 / pi
+
+
+def _simplify_anchors(coordinates: Trajectory) -> np.ndarray:
+    # Points that must be kept by the simplification
+    size = len(coordinates)
+
+    anchors = (
+        (coordinates.action_ids != 0)
+        | ~np.isnan(coordinates.orientation)
+        | (coordinates.wea != 0)
+        | np.isnan(coordinates.xy).any(axis=1)
+    )
+    direction = coordinates.direction
+    anchors[1:] |= direction[1:] != direction[:-1]
+    anchors[:-1] |= direction[1:] != direction[:-1]
+
+    if size:
+        anchors[0] = anchors[-1] = True
+
+    return anchors
+
+
+def _douglas_peucker(xy: np.ndarray, anchors: np.ndarray, tolerance: float) -> np.ndarray:
+    """Douglas-Peucker on every span between two anchors at once
+
+    Each iteration computes the distance of every undecided point to the segment of its span and
+    keeps the farthest point of the spans above the tolerance, so the number of iterations is the
+    depth of the recursion (log n for usual trajectories) and each one is vectorized.
+    """
+
+    kept = anchors.copy()
+    undecided = ~kept
+
+    # A point without coordinates is an anchor, but no distance can be measured to a segment that
+    # ends on it: its neighbours are kept too, so every span ends on two measurable points
+    # (like visvalingam, whose areas next to a NaN point are NaN)
+    unset = np.flatnonzero(np.isnan(xy).any(axis=1))
+    neighbours = np.r_[unset - 1, unset + 1]
+    neighbours = neighbours[(neighbours >= 0) & (neighbours < len(xy))]
+    kept[neighbours] = True
+    undecided[neighbours] = False
+
+    while undecided.any():
+        candidates = np.flatnonzero(undecided)
+        kept_indices = np.flatnonzero(kept)
+        position = np.searchsorted(kept_indices, candidates)
+        start, end = kept_indices[position - 1], kept_indices[position]
+
+        distances = _segment_distances(xy[candidates], xy[start], xy[end])
+
+        # The candidates are sorted, so the ones of a span are contiguous
+        span_starts = np.flatnonzero(np.r_[True, start[1:] != start[:-1]])
+        span = np.repeat(np.arange(len(span_starts)), np.diff(np.r_[span_starts, len(start)]))
+        maxima = np.maximum.reduceat(distances, span_starts)
+
+        # First farthest point of every span
+        farthest = np.flatnonzero(distances == maxima[span])
+        farthest = farthest[np.r_[True, span[farthest][1:] != span[farthest][:-1]]]
+
+        split = maxima[span[farthest]] > tolerance
+        kept[candidates[farthest[split]]] = True
+
+        # The points of the spans under the tolerance are removed, the others are split again
+        undecided[candidates[~(maxima > tolerance)[span]]] = False
+        undecided[candidates[farthest[split]]] = False
+
+    return kept
+
+
+def _segment_distances(points: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    # Distance of every point to its segment [start, end]
+    segment = end - start
+    length = np.einsum("ij,ij->i", segment, segment)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.einsum("ij,ij->i", points - start, segment) / length
+    t = np.clip(np.nan_to_num(t), 0, 1)
+
+    projection = start + segment * t[:, None]
+    return np.hypot(*(points - projection).T)
+
+
+def _visvalingam(xy: np.ndarray, anchors: np.ndarray, min_area: float) -> np.ndarray:
+    """Visvalingam-Whyatt: remove the point of the smallest triangle until they are all above min_area
+
+    The initial areas are computed in one vectorized pass and only the points below min_area
+    enter the heap. The removals stay sequential (every removal changes the areas of its two
+    neighbours): a heap and two linked lists, O(n log n).
+    """
+
+    size = len(xy)
+    kept = np.ones(size, dtype=bool)
+    points = xy.tolist()  # Python floats, faster than NumPy scalars inside the loop
+    previous = list(range(-1, size - 1))
+    following = list(range(1, size + 1))
+
+    def _area(idx: int) -> float:
+        (x1, y1), (x2, y2), (x3, y3) = points[previous[idx]], points[idx], points[following[idx]]
+        return abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1)) / 2
+
+    areas = np.full(size, np.inf)
+    inner = np.flatnonzero(~anchors)
+    if len(inner):
+        ab, ac = xy[inner] - xy[inner - 1], xy[inner + 1] - xy[inner - 1]
+        areas[inner] = np.abs(ab[:, 0] * ac[:, 1] - ac[:, 0] * ab[:, 1]) / 2
+
+    # The points above min_area are only pushed once a removal makes their area smaller,
+    # the candidates sorted by (area, index) are already a valid heap
+    candidates = inner[areas[inner] < min_area]
+    candidates = candidates[np.lexsort((candidates, areas[candidates]))]
+    heap = list(zip(areas[candidates].tolist(), candidates.tolist()))
+
+    areas = areas.tolist()
+    is_anchor = anchors.tolist()
+
+    while heap:
+        area, idx = heapq.heappop(heap)
+        if area != areas[idx]:
+            continue  # Outdated area of a point that was updated
+        if area >= min_area:
+            break
+
+        kept[idx] = False
+        areas[idx] = None
+        before, after = previous[idx], following[idx]
+        following[before] = after
+        previous[after] = before
+
+        # The area of a neighbour can't become smaller than the removed one (no spikes)
+        for neighbour in (before, after):
+            if not is_anchor[neighbour]:
+                areas[neighbour] = max(_area(neighbour), area)
+                heapq.heappush(heap, (areas[neighbour], neighbour))
+
+    return kept
+
+
+def coordinates_to_int(coordinates: Trajectory):
     # Convert and round all coordinates from np.float64 to int
 
     return [
@@ -175,11 +1134,6 @@ def coordinates_to_int(coordinates: list):
 
 
 def coordinates_to_float64(coordinates: list):
-    # Convert all coordinates from int to np.float64
+    # Convert all the points to a Trajectory (np.float64 columns)
 
-    return [
-        [np.float64(coordinate) for coordinate in sublist[:2]]
-        + [float(value) if value is not None else None for value in sublist[2:-3]]
-        + sublist[-3:]
-        for sublist in coordinates
-    ]
+    return Trajectory.from_rows(coordinates)